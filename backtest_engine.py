@@ -17,7 +17,7 @@ from numba import jit
 from tqdm import tqdm
 
 from strategy import StrategyRegistry, StrategyConfig
-from backtest_store import BacktestStore
+from backtest_store import get_store
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -92,7 +92,7 @@ class BacktestEngine:
         self.strategy_registry = StrategyRegistry()
         
         # Initialize centralized backtest store
-        self.store = BacktestStore(str(self.output_path / "store.zarr"))
+        self.store = get_store(str(self.output_path / "store.zarr"))
     
     def run_backtest(
         self,
@@ -511,14 +511,19 @@ class BacktestEngine:
         with open(self.metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
     
-    def load_summary(self) -> Optional[pd.DataFrame]:
+    def load_summary(self, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
         """
         Load summary results from centralized store.
         
+        Args:
+            columns: Summary columns to load (optional, defaults to all)
+            
         Returns:
             DataFrame with summary results or None if not found
         """
         # Use new centralized store
+        if columns is not None:
+            return self.store.get_stats(columns=columns)
         return self.store.get_all_stats()
     
     def get_backtest_stats(
@@ -16,7 +16,7 @@ Features:
 import json
 import io
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 import plotly.graph_objs as go
@@ -41,20 +41,24 @@ class BacktestManagerUI:
     
     def __init__(
         self,
-        indicator_engine: IndicatorEngine,
-        backtest_engine: BacktestEngine,
-        session_manager=None
+        indicator_engine: Optional[IndicatorEngine],
+        backtest_engine: Optional[BacktestEngine],
+        session_manager=None,
+        engine_loader: Optional[Callable[[], Tuple[IndicatorEngine, BacktestEngine]]] = None
     ):
         """
         Initialize the Backtest Manager UI.
         
         Args:
-            indicator_engine: IndicatorEngine instance
-            backtest_engine: BacktestEngine instance
+            indicator_engine: IndicatorEngine instance, or None with engine_loader
+            backtest_engine: BacktestEngine instance, or None with engine_loader
             session_manager: Optional SessionManager instance
+            engine_loader: Optional callable returning (indicator_engine, backtest_engine),
+                called on first engine access when the engines were not passed
         """
-        self.indicator_engine = indicator_engine
-        self.backtest_engine = backtest_engine
+        self._indicator_engine = indicator_engine
+        self._backtest_engine = backtest_engine
+        self._engine_loader = engine_loader
         self.session_manager = session_manager
         self.strategy_registry = StrategyRegistry()
         
@@ -78,6 +82,31 @@ class BacktestManagerUI:
             }
         }
     
+    def _load_engines(self):
+        """Build the engines through engine_loader on first use."""
+        if self._indicator_engine is None and self._engine_loader is not None:
+            self._indicator_engine, self._backtest_engine = self._engine_loader()
+    
+    @property
+    def indicator_engine(self) -> IndicatorEngine:
+        """IndicatorEngine, loaded on first access when engine_loader is set."""
+        self._load_engines()
+        return self._indicator_engine
+    
+    @indicator_engine.setter
+    def indicator_engine(self, engine: IndicatorEngine):
+        self._indicator_engine = engine
+    
+    @property
+    def backtest_engine(self) -> BacktestEngine:
+        """BacktestEngine, loaded on first access when engine_loader is set."""
+        self._load_engines()
+        return self._backtest_engine
+    
+    @backtest_engine.setter
+    def backtest_engine(self, engine: BacktestEngine):
+        self._backtest_engine = engine
+    
     def create_layout(self) -> dbc.Container:
         """
         Create the Backtest Manager UI layout.
@@ -1310,12 +1339,12 @@ class BacktestManagerUI:
                     logger.error(f"_create_trade_details_view: Error creating trade stats section: {str(e)}")
                     trade_stats_section = dbc.Alert("Error calculating trade statistics.", color="warning")
             
-            # Equity curve visualization
+            # Equity curve visualization (WebGL traces: one point per trading day)
             equity_chart = None
             if equity_curve is not None and len(equity_curve) > 0:
                 try:
                     fig = go.Figure()
-                    fig.add_trace(go.Scatter(
+                    fig.add_trace(go.Scattergl(
                         x=dates if dates else list(range(len(equity_curve))),
                         y=equity_curve,
                         mode='lines',
@@ -1376,7 +1405,7 @@ class BacktestManagerUI:
                     drawdown = (equity_curve_array - peak) / peak * 100
                     
                     fig_dd = go.Figure()
-                    fig_dd.add_trace(go.Scatter(
+                    fig_dd.add_trace(go.Scattergl(
                         x=dates if dates else list(range(len(drawdown))),
                         y=drawdown,
                         fill='tozeroy',
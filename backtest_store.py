@@ -12,12 +12,17 @@ Design:
 """
 
 import os
-import json
+import time
+import hashlib
 import logging
+import threading
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 import pandas as pd
+import orjson
 import zarr
 from numcodecs import Blosc, JSON
 from datetime import datetime
@@ -25,6 +30,76 @@ from datetime import datetime
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Metadata row layout. Low-cardinality string columns (symbol, strategy,
+# exit_rule) are dictionary-encoded as int32 codes into StringTables that
+# are persisted in the root attrs.
+METADATA_DTYPE = [
+    ('symbol_id', 'i4'),
+    ('strategy_id', 'i4'),
+    ('params_hash', 'S16'),
+    ('exit_rule_id', 'i4'),
+    ('win_rate', 'f4'),
+    ('num_trades', 'i4'),
+    ('total_return', 'f4'),
+    ('cagr', 'f4'),
+    ('sharpe_ratio', 'f4'),
+    ('max_drawdown', 'f4'),
+    ('expectancy', 'f4'),
+    ('start_date', 'S10'),
+    ('end_date', 'S10'),
+    ('timestamp', 'f8')
+]
+
+# Equity curves: float32 values in large chunks; bitshuffle makes slowly
+# varying float32 series compress close to delta encoding
+EQUITY_CHUNK_SIZE = 16384
+EQUITY_COMPRESSOR = Blosc(cname='zstd', clevel=3, shuffle=Blosc.BITSHUFFLE)
+
+# Groups holding per-backtest detail datasets, keyed by backtest_id
+DETAIL_GROUPS = ('equity_curves', 'positions', 'trade_details')
+
+# Encoded metadata columns and the StringTable that decodes each of them
+ENCODED_COLUMNS = {
+    'symbol_id': 'symbol',
+    'strategy_id': 'strategy',
+    'exit_rule_id': 'exit_rule'
+}
+
+
+class StringTable:
+    """
+    Dictionary encoding for a low-cardinality string column.
+    
+    Maps each distinct string to a stable int32 code (its position in
+    `values`), so metadata rows only store the code.
+    """
+    
+    def __init__(self, values: Optional[List[str]] = None):
+        """
+        Initialize StringTable.
+        
+        Args:
+            values: Existing strings in code order (optional)
+        """
+        self.values: List[str] = list(values or [])
+        self._codes: Dict[str, int] = {value: code for code, value in enumerate(self.values)}
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def code(self, value: str) -> int:
+        """Return the code for value, or -1 if it has never been interned."""
+        return self._codes.get(value, -1)
+    
+    def intern(self, value: str) -> int:
+        """Return the code for value, adding it to the table if needed."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
 
 class BacktestStore:
     """
@@ -35,8 +110,17 @@ class BacktestStore:
     - Metadata stored in structured arrays for fast filtering
     - Trade-level details stored separately for memory efficiency
     - Supports quick stats lookup and detailed trade log retrieval
+    - Metadata cached in memory with a key -> row index for O(1) lookups
+    - Writers bump a generation stamp in the metadata attrs; other processes
+      sharing the store reload their cache when the stamp changes
     """
     
+    # Compact metadata once tombstoned (deleted) rows exceed this fraction of the table
+    TOMBSTONE_COMPACT_RATIO = 0.1
+    
+    # Minimum row capacity of the in-memory metadata buffer
+    META_MIN_CAPACITY = 1024
+    
     def __init__(self, store_path: str = "./data/backtests/store.zarr"):
         """
         Initialize BacktestStore.
@@ -46,12 +130,23 @@ class BacktestStore:
         """
         self.store_path = Path(store_path)
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        # Guards the cached metadata array and index across threads
+        self._lock = threading.RLock()
+        # Set by writers under _write_lock when they change the store
+        self._modified = False
+        # Serializes writers across processes (e.g. gunicorn workers) sharing the store
+        self._process_lock = zarr.ProcessSynchronizer(f"{self.store_path}.sync")['metadata']
         self._init_store()
     
     def _init_store(self):
         """Initialize or open Zarr store with appropriate structure."""
-        # Open store in read/write mode
-        self.root = zarr.open(str(self.store_path), mode='a')
+        # Open store in read/write mode. No chunk or attrs caching: other
+        # processes may rewrite any array, and hot metadata is cached below.
+        self.root = zarr.open_group(str(self.store_path), mode='a', cache_attrs=False)
+        self._generation = self._read_generation()
+        
+        # String tables for dictionary-encoded metadata columns
+        self._load_string_tables()
         
         # Initialize metadata array if not exists
         if 'metadata' not in self.root:
@@ -60,28 +155,26 @@ class BacktestStore:
             self.root.create_dataset(
                 'metadata',
                 shape=(0,),
-                dtype=[
-                    ('symbol', 'U20'),
-                    ('strategy', 'U50'),
-                    ('params_hash', 'U32'),
-                    ('exit_rule', 'U50'),
-                    ('win_rate', 'f4'),
-                    ('num_trades', 'i4'),
-                    ('total_return', 'f4'),
-                    ('cagr', 'f4'),
-                    ('sharpe_ratio', 'f4'),
-                    ('max_drawdown', 'f4'),
-                    ('expectancy', 'f4'),
-                    ('start_date', 'U10'),
-                    ('end_date', 'U10'),
-                    ('timestamp', 'U32')
-                ],
+                dtype=METADATA_DTYPE,
                 chunks=(1000,)
             )
+        elif 'symbol' in self.root['metadata'].dtype.names:
+            self._migrate_legacy_metadata()
         
-        # Initialize params lookup if not exists
-        if 'params_lookup' not in self.root:
-            self.root.create_group('params_lookup')
+        # Initialize params lookup table if not exists
+        # Single JSON-encoded array of [params_hash, params] pairs
+        if 'params_lookup_tbl' not in self.root:
+            self.root.create_dataset(
+                'params_lookup_tbl',
+                shape=(0,),
+                dtype=object,
+                object_codec=JSON(),
+                compressor=Blosc(cname='zstd', clevel=5),
+                chunks=(1024,)
+            )
+        self._load_params_cache()
+        if 'params_lookup' in self.root:
+            self._migrate_legacy_params_lookup()
         
         # Initialize trade details if not exists
         if 'trade_details' not in self.root:
@@ -90,12 +183,316 @@ class BacktestStore:
         # Initialize equity curves if not exists
         if 'equity_curves' not in self.root:
             self.root.create_group('equity_curves')
+        
+        # Initialize positions if not exists
+        if 'positions' not in self.root:
+            self.root.create_group('positions')
+        
+        self._load_metadata()
+    
+    def _read_generation(self) -> Optional[str]:
+        """Return the generation stamp currently on disk (None while being cleared)."""
+        metadata = self.root.get('metadata')
+        return None if metadata is None else metadata.attrs.get('generation')
+    
+    def _bump_generation(self):
+        """Record a write so other processes know to reload their cache."""
+        self._generation = uuid.uuid4().hex
+        self.root['metadata'].attrs['generation'] = self._generation
+    
+    def _reload_cache(self):
+        """Reload string tables, params and metadata rows from disk."""
+        with self._lock:
+            self._generation = self._read_generation()
+            self._load_string_tables()
+            self._load_params_cache()
+            self._load_metadata()
+    
+    def _load_string_tables(self):
+        """Load the string tables from the root attrs."""
+        tables = self.root.attrs.get('string_tables', {})
+        self._string_tables = {
+            name: StringTable(tables.get(name, []))
+            for name in ENCODED_COLUMNS.values()
+        }
+    
+    def _load_params_cache(self):
+        """Load params_hash -> params from the params lookup table."""
+        self._params_cache = {
+            params_hash: params
+            for params_hash, params in self.root['params_lookup_tbl'][:]
+        }
+    
+    def _refresh(self):
+        """Reload the cache if another process has written since it was loaded."""
+        with self._lock:
+            if self._read_generation() != self._generation:
+                # Wait for the writer to finish so a consistent state is loaded
+                with self._process_lock:
+                    self._reload_cache()
+    
+    @contextmanager
+    def _write_lock(self):
+        """
+        Hold the thread and cross-process locks with an up-to-date cache.
+        
+        Callers set ``self._modified`` once they start changing the store;
+        the generation is bumped only then, so no-op calls don't make other
+        processes reload.
+        """
+        with self._lock, self._process_lock:
+            if self._read_generation() != self._generation:
+                self._reload_cache()
+            self._modified = False
+            try:
+                yield
+            finally:
+                if self._modified:
+                    self._bump_generation()
+    
+    def _load_metadata(self):
+        """
+        Load metadata rows into memory and build the row index.
+        
+        The index maps (symbol, strategy, params_hash, exit_rule) to the row
+        position in the metadata array. Deleted rows are kept as tombstones
+        until compaction; older duplicate rows are treated as superseded.
+        """
+        with self._lock:
+            metadata = self.root['metadata']
+            self._meta_cache = metadata[:]
+            self._tombstones = set(metadata.attrs.get('tombstones', []))
+            self._build_meta_index()
+    
+    @property
+    def _meta_cache(self) -> np.ndarray:
+        """Cached metadata rows (a view of the filled part of the row buffer)."""
+        return self._meta_buf[:self._meta_len]
+    
+    @_meta_cache.setter
+    def _meta_cache(self, rows: np.ndarray):
+        self._meta_buf = rows
+        self._meta_len = len(rows)
+    
+    def _append_meta_row(self, row: np.void) -> int:
+        """
+        Append a row to the cached metadata and return its index.
+        
+        The buffer doubles in capacity when full, so storing N backtests
+        copies O(N) rows in total rather than the whole array per append.
+        """
+        if self._meta_len == len(self._meta_buf):
+            grown = np.zeros(max(2 * self._meta_len, self.META_MIN_CAPACITY), dtype=self._meta_buf.dtype)
+            grown[:self._meta_len] = self._meta_buf[:self._meta_len]
+            self._meta_buf = grown
+        idx = self._meta_len
+        self._meta_buf[idx] = row
+        self._meta_len += 1
+        return idx
+    
+    def _build_meta_index(self):
+        """Rebuild _meta_index from the cached metadata rows and tombstones."""
+        self._meta_index = {}
+        keys = self._meta_cache[['symbol_id', 'strategy_id', 'params_hash', 'exit_rule_id']].tolist()
+        for idx, key in enumerate(keys):
+            if idx in self._tombstones:
+                continue
+            previous = self._meta_index.get(key)
+            if previous is not None:
+                self._tombstones.add(previous)
+            self._meta_index[key] = idx
+    
+    def _migrate_legacy_metadata(self):
+        """Rewrite metadata stored with fixed-width string columns into the encoded layout."""
+        legacy = self.root['metadata'][:]
+        migrated = np.zeros(len(legacy), dtype=METADATA_DTYPE)
+        
+        for column, table_name in ENCODED_COLUMNS.items():
+            table = self._string_tables[table_name]
+            migrated[column] = [table.intern(str(value)) for value in legacy[table_name]]
+        
+        for name in migrated.dtype.names:
+            if name in legacy.dtype.names and name not in ('start_date', 'end_date', 'timestamp'):
+                migrated[name] = legacy[name]
+        migrated['params_hash'] = np.char.encode(legacy['params_hash'].astype('U16'), 'ascii')
+        migrated['start_date'] = np.char.encode(legacy['start_date'], 'ascii')
+        migrated['end_date'] = np.char.encode(legacy['end_date'], 'ascii')
+        timestamps = pd.to_datetime(pd.Series(legacy['timestamp']), errors='coerce')
+        migrated['timestamp'] = (timestamps - pd.Timestamp(0)).dt.total_seconds().fillna(0.0).to_numpy()
+        
+        attrs = self.root['metadata'].attrs.asdict()
+        del self.root['metadata']
+        self.root.create_dataset('metadata', data=migrated, chunks=(1000,))
+        self.root['metadata'].attrs.update(attrs)
+        self._save_string_tables()
+        
+        logger.info(f"Migrated {len(migrated)} metadata rows to dictionary-encoded layout")
+    
+    def _migrate_legacy_params_lookup(self):
+        """Move params stored as per-hash dataset attrs into the params lookup table."""
+        legacy_group = self.root['params_lookup']
+        for params_hash in legacy_group.array_keys():
+            if params_hash not in self._params_cache:
+                params = orjson.loads(legacy_group[params_hash].attrs['params'])
+                self._append_params(params_hash, params)
+        
+        del self.root['params_lookup']
+        logger.info("Migrated params_lookup group to params_lookup_tbl")
+    
+    def _append_params(self, params_hash: str, params: Dict[str, Any]):
+        """Append a (params_hash, params) pair to the params lookup table."""
+        table = self.root['params_lookup_tbl']
+        entry = np.empty(1, dtype=object)
+        entry[0] = [params_hash, params]
+        
+        size = table.shape[0]
+        table.resize(size + 1)
+        table[size:size + 1] = entry
+        self._params_cache[params_hash] = params
+    
+    def _detail_bytes(self, backtest_id: str) -> int:
+        """Return stored bytes of the detail datasets for a backtest."""
+        total = 0
+        for group_name in DETAIL_GROUPS:
+            group = self.root.get(group_name)
+            if group is not None and backtest_id in group:
+                total += group[backtest_id].nbytes_stored
+        return total
+    
+    def _adjust_storage_size(self, delta: int):
+        """Apply a change to the cached storage size, if it has been computed."""
+        storage_size = self.root.attrs.get('storage_size_bytes')
+        if storage_size is not None and delta:
+            self.root.attrs['storage_size_bytes'] = max(storage_size + delta, 0)
+    
+    def _save_string_tables(self):
+        """Persist string tables to the root attrs."""
+        self.root.attrs['string_tables'] = {
+            name: table.values for name, table in self._string_tables.items()
+        }
+    
+    def _meta_key(
+        self,
+        symbol: str,
+        strategy: str,
+        params_hash: str,
+        exit_rule: str
+    ) -> Tuple[int, int, bytes, int]:
+        """Encode a (symbol, strategy, params_hash, exit_rule) lookup into a _meta_index key."""
+        return (
+            self._string_tables['symbol'].code(symbol),
+            self._string_tables['strategy'].code(strategy),
+            params_hash.encode('ascii'),
+            self._string_tables['exit_rule'].code(exit_rule)
+        )
+    
+    def _decode_metadata(self, metadata: np.ndarray, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Build a DataFrame from encoded metadata rows with string columns restored.
+        
+        Args:
+            metadata: Structured array of metadata rows
+            columns: Decoded column names to build (optional, defaults to all)
+            
+        Returns:
+            DataFrame with one row per metadata row
+        """
+        if columns is None:
+            df = pd.DataFrame(metadata)
+        else:
+            # Only the requested fields are copied out of the structured array
+            fields = {name: field for field, name in ENCODED_COLUMNS.items()}
+            df = pd.DataFrame({fields.get(column, column): metadata[fields.get(column, column)]
+                               for column in columns})
+        
+        for column, table_name in ENCODED_COLUMNS.items():
+            if column in df:
+                df[column] = pd.Categorical.from_codes(
+                    metadata[column],
+                    categories=self._string_tables[table_name].values
+                )
+        df = df.rename(columns=ENCODED_COLUMNS)
+        
+        for column in ('params_hash', 'start_date', 'end_date'):
+            if column in df:
+                df[column] = np.char.decode(metadata[column], 'ascii')
+        if 'timestamp' in df:
+            df['timestamp'] = pd.to_datetime(metadata['timestamp'], unit='s')
+        
+        return df
+    
+    def _filter_meta(
+        self,
+        symbol: Optional[str] = None,
+        strategy: Optional[str] = None,
+        params_hash: Optional[str] = None,
+        exit_rule: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Select live metadata rows matching the given filters.
+        
+        Filters are fused into a single boolean mask over the raw structured
+        array and the matching rows are gathered once.
+        
+        Args:
+            symbol: Filter by symbol (optional)
+            strategy: Filter by strategy (optional)
+            params_hash: Filter by params hash (optional)
+            exit_rule: Filter by exit rule (optional)
+            
+        Returns:
+            Structured array of matching metadata rows
+        """
+        with self._lock:
+            arr = self._meta_cache
+            mask = np.ones(arr.shape[0], dtype=bool)
+            if self._tombstones:
+                mask[list(self._tombstones)] = False
+        
+        if symbol is not None:
+            mask &= arr['symbol_id'] == self._string_tables['symbol'].code(symbol)
+        if strategy is not None:
+            mask &= arr['strategy_id'] == self._string_tables['strategy'].code(strategy)
+        if params_hash is not None:
+            mask &= arr['params_hash'] == params_hash.encode('ascii')
+        if exit_rule is not None:
+            mask &= arr['exit_rule_id'] == self._string_tables['exit_rule'].code(exit_rule)
+        
+        return arr[np.flatnonzero(mask)]
+    
+    def _live_metadata(self) -> np.ndarray:
+        """Return cached metadata rows, excluding tombstoned rows."""
+        if not self._tombstones:
+            return self._meta_cache
+        
+        keep = np.ones(len(self._meta_cache), dtype=bool)
+        keep[list(self._tombstones)] = False
+        return self._meta_cache[keep]
+    
+    def _compact_metadata(self):
+        """Drop tombstoned rows from the metadata array with a single rewrite."""
+        live = np.delete(self._meta_cache, sorted(self._tombstones))
+        
+        metadata = self.root['metadata']
+        metadata.resize(len(live))
+        if len(live) > 0:
+            metadata[:] = live
+        metadata.attrs['tombstones'] = []
+        
+        # The compacted rows are already in memory; no need to read them back
+        self._meta_cache = live
+        self._tombstones = set()
+        self._build_meta_index()
     
     def _hash_params(self, params: Dict[str, Any]) -> str:
         """Create stable hash for parameter dictionary."""
-        # Sort keys for stable hash
-        sorted_params = json.dumps(params, sort_keys=True)
-        return str(hash(sorted_params) % (10**10))
+        # Sort keys for stable hash; digest is stable across processes
+        sorted_params = orjson.dumps(
+            params,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        )
+        return hashlib.blake2b(sorted_params, digest_size=8).hexdigest()
     
     def store_backtest(
         self,
@@ -129,108 +526,139 @@ class BacktestStore:
         params_hash = self._hash_params(params)
         backtest_id = f"{symbol}_{strategy}_{params_hash}_{exit_rule}"
         
-        # Prepare metadata entry
-        metadata_entry = np.array(
-            [(
-                symbol,
-                strategy,
-                params_hash,
-                exit_rule,
-                metrics.get('win_rate', 0.0),
-                metrics.get('num_trades', 0),
-                metrics.get('total_return', 0.0),
-                metrics.get('cagr', 0.0),
-                metrics.get('sharpe_ratio', 0.0),
-                metrics.get('max_drawdown', 0.0),
-                metrics.get('expectancy', 0.0),
-                dates[0] if dates is not None and len(dates) > 0 else '',
-                dates[-1] if dates is not None and len(dates) > 0 else '',
-                datetime.now().isoformat()
-            )],
-            dtype=self.root['metadata'].dtype
-        )
+        # Re-read shared state and write under the cross-process lock so rows
+        # and string tables written by other workers are never overwritten
+        with self._write_lock():
+            self._modified = True
+            detail_bytes_before = self._detail_bytes(backtest_id)
         
-        # Append to metadata
-        current_size = self.root['metadata'].shape[0]
-        self.root['metadata'].resize(current_size + 1)
-        self.root['metadata'][current_size] = metadata_entry[0]
-        
-        # Store params in metadata attributes (simpler than separate array)
-        # We'll store as attribute on a dummy dataset
-        params_group = self.root['params_lookup']
-        if params_hash not in params_group:
-            # Create a small dummy array to hold the params as attrs
-            params_array = params_group.create_dataset(
-                params_hash,
-                shape=(1,),
-                dtype='i1'
+            # Intern strings to codes, persisting the tables when new values appear
+            table_sizes = [len(table) for table in self._string_tables.values()]
+            symbol_id = self._string_tables['symbol'].intern(symbol)
+            strategy_id = self._string_tables['strategy'].intern(strategy)
+            exit_rule_id = self._string_tables['exit_rule'].intern(exit_rule)
+            if table_sizes != [len(table) for table in self._string_tables.values()]:
+                self._save_string_tables()
+        
+            # Prepare metadata entry
+            metadata_entry = np.array(
+                [(
+                    symbol_id,
+                    strategy_id,
+                    params_hash.encode('ascii'),
+                    exit_rule_id,
+                    metrics.get('win_rate', 0.0),
+                    metrics.get('num_trades', 0),
+                    metrics.get('total_return', 0.0),
+                    metrics.get('cagr', 0.0),
+                    metrics.get('sharpe_ratio', 0.0),
+                    metrics.get('max_drawdown', 0.0),
+                    metrics.get('expectancy', 0.0),
+                    str(dates[0])[:10].encode('ascii') if dates is not None and len(dates) > 0 else b'',
+                    str(dates[-1])[:10].encode('ascii') if dates is not None and len(dates) > 0 else b'',
+                    time.time()
+                )],
+                dtype=METADATA_DTYPE
             )
-            params_array.attrs['params'] = json.dumps(params)
         
-        # Store equity curve if provided
-        if equity_curve is not None:
-            equity_group = self.root['equity_curves']
-            if backtest_id in equity_group:
-                del equity_group[backtest_id]
+            # Overwrite existing row for this key, otherwise append
+            key = (symbol_id, strategy_id, params_hash.encode('ascii'), exit_rule_id)
+            metadata = self.root['metadata']
+            idx = self._meta_index.get(key)
+            appended = idx is None
+            if appended:
+                idx = self._append_meta_row(metadata_entry[0])
+                metadata.resize(idx + 1)
+                self._meta_index[key] = idx
+            else:
+                self._meta_cache[idx] = metadata_entry[0]
+            metadata[idx] = metadata_entry[0]
+        
+            # Record params for this hash (one table row per unique params set)
+            if params_hash not in self._params_cache:
+                self._append_params(params_hash, params)
+        
+            # Store equity curve if provided
+            if equity_curve is not None:
+                equity_group = self.root['equity_curves']
+                if backtest_id in equity_group:
+                    del equity_group[backtest_id]
             
-            equity_data = equity_group.create_dataset(
-                backtest_id,
-                shape=equity_curve.shape,
-                dtype=equity_curve.dtype,
-                data=equity_curve,
-                chunks=(min(len(equity_curve), 1000),)
-            )
+                # float32 keeps ~7 significant digits, plenty for dollar equity values
+                equity = np.ascontiguousarray(equity_curve, dtype=np.float32)
+                equity_data = equity_group.create_dataset(
+                    backtest_id,
+                    data=equity,
+                    chunks=(max(min(len(equity), EQUITY_CHUNK_SIZE), 1),),
+                    compressor=EQUITY_COMPRESSOR
+                )
             
-            # Store dates and positions as attributes
-            if dates is not None:
-                equity_data.attrs['dates'] = [str(d) for d in dates]
-            if positions is not None:
-                equity_data.attrs['positions'] = positions.tolist()
-        
-        # Store trade details if provided
-        # Always store trades if provided, even if empty - this lets us distinguish
-        # between "no trades occurred" vs "trade data not stored/missing"
-        if trades is not None:
-            try:
-                trade_group = self.root['trade_details']
-                if backtest_id in trade_group:
-                    del trade_group[backtest_id]
+                # Store dates as attributes
+                if dates is not None:
+                    equity_data.attrs['dates'] = [str(d) for d in dates]
+            
+                # Store positions as a compact int8 array (values are -1, 0, 1)
+                positions_group = self.root['positions']
+                if backtest_id in positions_group:
+                    del positions_group[backtest_id]
+                if positions is not None:
+                    positions_group.create_dataset(
+                        backtest_id,
+                        data=np.ascontiguousarray(positions, dtype=np.int8),
+                        chunks=(max(min(len(positions), EQUITY_CHUNK_SIZE), 1),),
+                        compressor=EQUITY_COMPRESSOR
+                    )
+        
+            # Store trade details if provided
+            # Always store trades if provided, even if empty - this lets us distinguish
+            # between "no trades occurred" vs "trade data not stored/missing"
+            if trades is not None:
+                try:
+                    trade_group = self.root['trade_details']
+                    if backtest_id in trade_group:
+                        del trade_group[backtest_id]
                 
-                # Convert DataFrame to JSON-serializable dict
-                trades_dict = trades.to_dict('records')
-                # Convert any datetime objects to strings
-                for trade in trades_dict:
-                    for key, value in trade.items():
-                        if pd.api.types.is_datetime64_any_dtype(type(value)) or isinstance(value, (pd.Timestamp, np.datetime64)):
-                            trade[key] = str(value)
+                    # Convert DataFrame to JSON-serializable dict
+                    trades_dict = trades.to_dict('records')
+                    # Convert any datetime objects to strings
+                    for trade in trades_dict:
+                        for key, value in trade.items():
+                            if pd.api.types.is_datetime64_any_dtype(type(value)) or isinstance(value, (pd.Timestamp, np.datetime64)):
+                                trade[key] = str(value)
                 
-                # Store as JSON in a text array
-                trades_json = json.dumps(trades_dict)
-                # Use a simple string array with sufficient length
-                # Add buffer for safety in case of JSON format variations
-                TRADE_JSON_BUFFER = 100
-                trade_data = trade_group.create_dataset(
-                    backtest_id,
-                    shape=(1,),
-                    dtype=f'U{len(trades_json) + TRADE_JSON_BUFFER}'
-                )
-                trade_data[0] = trades_json
+                    # Store as JSON in a text array
+                    trades_json = orjson.dumps(trades_dict, option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
+                    # Use a simple string array with sufficient length
+                    # Add buffer for safety in case of JSON format variations
+                    TRADE_JSON_BUFFER = 100
+                    trade_data = trade_group.create_dataset(
+                        backtest_id,
+                        shape=(1,),
+                        dtype=f'U{len(trades_json) + TRADE_JSON_BUFFER}'
+                    )
+                    trade_data[0] = trades_json
                 
-                logger.info(f"store_backtest: Stored {len(trades)} trades for {backtest_id}")
-            except Exception as e:
-                logger.error(f"store_backtest: Failed to store trades for {backtest_id}: {str(e)}", exc_info=True)
-                # Continue without failing the entire storage operation
-        else:
-            logger.debug(f"store_backtest: No trades provided for {backtest_id}")
+                    logger.info(f"store_backtest: Stored {len(trades)} trades for {backtest_id}")
+                except Exception as e:
+                    logger.error(f"store_backtest: Failed to store trades for {backtest_id}: {str(e)}", exc_info=True)
+                    # Continue without failing the entire storage operation
+            else:
+                logger.debug(f"store_backtest: No trades provided for {backtest_id}")
         
-        return backtest_id
+            size_delta = self._detail_bytes(backtest_id) - detail_bytes_before
+            if appended:
+                size_delta += metadata_entry.itemsize
+            self._adjust_storage_size(size_delta)
+        
+            return backtest_id
     
     def get_stats(
         self,
         symbol: Optional[str] = None,
         strategy: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
-        exit_rule: Optional[str] = None
+        exit_rule: Optional[str] = None,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Retrieve backtest statistics with optional filtering.
@@ -240,39 +668,25 @@ class BacktestStore:
             strategy: Filter by strategy (optional)
             params: Filter by exact params (optional)
             exit_rule: Filter by exit rule (optional)
+            columns: Metadata columns to return (optional, defaults to all
+                plus decoded params)
             
         Returns:
             DataFrame with matching backtest statistics
         """
-        if 'metadata' not in self.root or self.root['metadata'].shape[0] == 0:
+        self._refresh()
+        if len(self._meta_cache) == len(self._tombstones):
             return pd.DataFrame()
         
-        # Load metadata
-        metadata = self.root['metadata'][:]
-        df = pd.DataFrame(metadata)
-        
-        # Apply filters
-        if symbol is not None:
-            df = df[df['symbol'] == symbol]
-        
-        if strategy is not None:
-            df = df[df['strategy'] == strategy]
-        
-        if params is not None:
-            params_hash = self._hash_params(params)
-            df = df[df['params_hash'] == params_hash]
+        params_hash = self._hash_params(params) if params is not None else None
+        metadata = self._filter_meta(symbol, strategy, params_hash, exit_rule)
         
-        if exit_rule is not None:
-            df = df[df['exit_rule'] == exit_rule]
+        # Build the DataFrame only from the matching rows
+        df = self._decode_metadata(metadata, columns)
         
         # Decode params for readability
-        if len(df) > 0:
-            params_lookup = self.root['params_lookup']
-            def get_params(h):
-                if h in params_lookup:
-                    return json.loads(params_lookup[h].attrs['params'])
-                return {}
-            df['params'] = df['params_hash'].apply(get_params)
+        if len(df) > 0 and columns is None:
+            df['params'] = [dict(self._params_cache.get(h, {})) for h in df['params_hash']]
         
         return df
     
@@ -305,57 +719,47 @@ class BacktestStore:
                 logger.warning(f"get_detailed_results: Invalid params type: {type(params)}, converting to dict")
                 params = {} if params is None else dict(params)
             
-            # Get stats matching symbol, strategy, and exit_rule
-            # Don't filter by params initially to avoid hash mismatch issues
+            # Fetch the metadata row directly from the in-memory index
+            self._refresh()
             try:
-                stats_df = self.get_stats(symbol=symbol, strategy=strategy, exit_rule=exit_rule)
-                if len(stats_df) == 0:
-                    logger.warning(f"get_detailed_results: No stats found for {symbol}_{strategy}_{exit_rule}")
-                    return None
+                params_hash = self._hash_params(params)
+                idx = self._meta_index.get(self._meta_key(symbol, strategy, params_hash, exit_rule))
                 
-                # If params provided, try to find best match
-                # But if params were loaded from JSON, they should exactly match
-                if params:
-                    # Try exact hash match first
-                    params_hash_attempt = self._hash_params(params)
-                    exact_match = stats_df[stats_df['params_hash'] == params_hash_attempt]
-                    
-                    if len(exact_match) > 0:
-                        # Found exact match
-                        stats_row = exact_match.iloc[0]
-                    else:
-                        # No exact match - params might have been loaded from JSON with type changes
-                        # Use the first match but warn since this could be unexpected
+                if idx is not None:
+                    row = self._meta_cache[idx]
+                else:
+                    # No exact match - params might have been loaded from JSON with type changes
+                    # (or no params given); fall back to the first row for symbol/strategy/exit_rule
+                    candidates = self._filter_meta(symbol=symbol, strategy=strategy, exit_rule=exit_rule)
+                    if len(candidates) == 0:
+                        logger.warning(f"get_detailed_results: No stats found for {symbol}_{strategy}_{exit_rule}")
+                        return None
+                    if params:
                         logger.warning(f"get_detailed_results: No exact param hash match for {symbol}_{strategy}, using first result. "
                                       f"This may happen when params are loaded from JSON with type conversions.")
-                        stats_row = stats_df.iloc[0]
-                else:
-                    # No params filtering, use first result
-                    stats_row = stats_df.iloc[0]
+                    row = candidates[0]
                 
                 # Use the params_hash from metadata (which is the one used for storage)
-                params_hash = stats_row['params_hash']
+                params_hash = row['params_hash'].decode('ascii')
                 backtest_id = f"{symbol}_{strategy}_{params_hash}_{exit_rule}"
                 logger.debug(f"get_detailed_results: Retrieving backtest_id: {backtest_id}")
             except Exception as e:
                 logger.error(f"get_detailed_results: Error retrieving stats for {symbol}_{strategy}: {str(e)}")
                 return None
             
-            stats = stats_df.iloc[0].to_dict()
-            
             result = {
                 'symbol': symbol,
                 'strategy': strategy,
                 'params': params,
                 'exit_rule': exit_rule,
                 'metrics': {
-                    'win_rate': float(stats.get('win_rate', 0)),
-                    'num_trades': int(stats.get('num_trades', 0)),
-                    'total_return': float(stats.get('total_return', 0)),
-                    'cagr': float(stats.get('cagr', 0)),
-                    'sharpe_ratio': float(stats.get('sharpe_ratio', 0)),
-                    'max_drawdown': float(stats.get('max_drawdown', 0)),
-                    'expectancy': float(stats.get('expectancy', 0))
+                    'win_rate': float(row['win_rate']),
+                    'num_trades': int(row['num_trades']),
+                    'total_return': float(row['total_return']),
+                    'cagr': float(row['cagr']),
+                    'sharpe_ratio': float(row['sharpe_ratio']),
+                    'max_drawdown': float(row['max_drawdown']),
+                    'expectancy': float(row['expectancy'])
                 }
             }
             
@@ -368,7 +772,12 @@ class BacktestStore:
                     
                     if 'dates' in equity_data.attrs:
                         result['dates'] = equity_data.attrs['dates']
-                    if 'positions' in equity_data.attrs:
+                    
+                    positions_group = self.root.get('positions')
+                    if positions_group is not None and backtest_id in positions_group:
+                        result['positions'] = positions_group[backtest_id][:]
+                    elif 'positions' in equity_data.attrs:
+                        # Stores written before positions moved to their own group
                         result['positions'] = equity_data.attrs['positions']
                     
                     logger.debug(f"get_detailed_results: Loaded equity curve for {backtest_id}")
@@ -390,7 +799,7 @@ class BacktestStore:
                         trade_json = str(trade_data[:])
                     
                     # Parse JSON and create DataFrame
-                    trades_dict = json.loads(trade_json)
+                    trades_dict = orjson.loads(trade_json)
                     result['trades'] = pd.DataFrame(trades_dict)
                     logger.debug(f"get_detailed_results: Loaded {len(result['trades'])} trades for {backtest_id}")
                 else:
@@ -418,17 +827,70 @@ class BacktestStore:
         Returns:
             DataFrame with stats for all requested combinations
         """
-        results = []
+        with self._lock:
+            self._refresh()
+            rows = [self._get_one_row(*lookup) for lookup in lookups]
+        rows = [row for row in rows if row is not None]
+        
+        if not rows:
+            return pd.DataFrame()
+        
+        # Decode all matched rows in one pass
+        df = self._decode_metadata(np.array(rows, dtype=METADATA_DTYPE))
+        df['params'] = [dict(self._params_cache.get(h, {})) for h in df['params_hash']]
+        return df
+    
+    def _get_one_row(
+        self,
+        symbol: str,
+        strategy: str,
+        params: Optional[Dict[str, Any]],
+        exit_rule: Optional[str]
+    ) -> Optional[np.void]:
+        """Return the cached metadata row for one lookup, or None if not stored."""
+        if params is not None and exit_rule is not None:
+            idx = self._meta_index.get(self._meta_key(symbol, strategy, self._hash_params(params), exit_rule))
+            return self._meta_cache[idx] if idx is not None else None
+        
+        params_hash = self._hash_params(params) if params is not None else None
+        matches = self._filter_meta(symbol, strategy, params_hash, exit_rule)
+        return matches[0] if len(matches) > 0 else None
+    
+    def get_strategy_averages(self, metrics: List[str]) -> pd.DataFrame:
+        """
+        Average metric columns per strategy over all stored backtests.
         
-        for symbol, strategy, params, exit_rule in lookups:
-            stats_df = self.get_stats(symbol, strategy, params, exit_rule)
-            if len(stats_df) > 0:
-                results.append(stats_df.iloc[0])
+        Sums are accumulated with np.bincount over the encoded strategy codes,
+        so no row-level DataFrame is built. NaN metric values are skipped.
         
-        if not results:
+        Args:
+            metrics: Numeric metadata columns to average
+            
+        Returns:
+            DataFrame with 'strategy', one column per metric and 'count'
+            (backtests per strategy), sorted by strategy
+        """
+        self._refresh()
+        metadata = self._filter_meta()
+        if len(metadata) == 0:
             return pd.DataFrame()
         
-        return pd.DataFrame(results)
+        strategies = self._string_tables['strategy'].values
+        codes = metadata['strategy_id']
+        counts = np.bincount(codes, minlength=len(strategies))
+        present = np.flatnonzero(counts)
+        
+        averages = {'strategy': [strategies[code] for code in present]}
+        for metric in metrics:
+            values = metadata[metric].astype('f8')
+            valid = ~np.isnan(values)
+            sums = np.bincount(codes[valid], weights=values[valid], minlength=len(strategies))
+            totals = np.bincount(codes[valid], minlength=len(strategies))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                averages[metric] = sums[present] / totals[present]
+        averages['count'] = counts[present]
+        
+        return pd.DataFrame(averages).sort_values('strategy', ignore_index=True)
     
     def get_all_stats(self) -> pd.DataFrame:
         """
@@ -461,46 +923,50 @@ class BacktestStore:
         params_hash = self._hash_params(params)
         backtest_id = f"{symbol}_{strategy}_{params_hash}_{exit_rule}"
         
-        # Find and remove from metadata
-        metadata = self.root['metadata'][:]
-        mask = ~((metadata['symbol'] == symbol) &
-                 (metadata['strategy'] == strategy) &
-                 (metadata['params_hash'] == params_hash) &
-                 (metadata['exit_rule'] == exit_rule))
-        
-        if np.all(mask):
-            return False  # Not found
-        
-        # Update metadata
-        filtered_metadata = metadata[mask]
-        self.root['metadata'].resize(len(filtered_metadata))
-        self.root['metadata'][:] = filtered_metadata
-        
-        # Delete equity curve if exists
-        equity_group = self.root.get('equity_curves')
-        if equity_group is not None and backtest_id in equity_group:
-            del equity_group[backtest_id]
-        
-        # Delete trade details if exists
-        trade_group = self.root.get('trade_details')
-        if trade_group is not None and backtest_id in trade_group:
-            del trade_group[backtest_id]
+        with self._write_lock():
+            # Look up the row directly instead of scanning the metadata table
+            idx = self._meta_index.pop(self._meta_key(symbol, strategy, params_hash, exit_rule), None)
+            if idx is None:
+                return False  # Not found
+            
+            self._modified = True
+            # Tombstone the row; compact only once enough rows have accumulated
+            self._tombstones.add(idx)
+            if len(self._tombstones) > self.TOMBSTONE_COMPACT_RATIO * len(self._meta_cache):
+                self._compact_metadata()
+            else:
+                self.root['metadata'].attrs['tombstones'] = sorted(self._tombstones)
+            
+            # Delete equity curve, positions and trade details if exist
+            size_delta = -self._detail_bytes(backtest_id) - self._meta_cache.dtype.itemsize
+            for group_name in DETAIL_GROUPS:
+                group = self.root.get(group_name)
+                if group is not None and backtest_id in group:
+                    del group[backtest_id]
+            self._adjust_storage_size(size_delta)
         
         return True
     
     def clear_all(self):
         """Clear all backtest data from the store."""
-        # Recreate metadata with empty array
-        if 'metadata' in self.root:
-            del self.root['metadata']
-        
-        # Recreate groups
-        for group_name in ['params_lookup', 'trade_details', 'equity_curves']:
-            if group_name in self.root:
-                del self.root[group_name]
-        
-        # Reinitialize
-        self._init_store()
+        with self._write_lock():
+            self._modified = True
+            # Recreate metadata with empty array
+            if 'metadata' in self.root:
+                del self.root['metadata']
+            
+            # Recreate groups
+            for group_name in ['params_lookup', 'params_lookup_tbl', 'trade_details', 'equity_curves', 'positions']:
+                if group_name in self.root:
+                    del self.root[group_name]
+            
+            # Reset string tables and cached storage size
+            for attr in ('string_tables', 'storage_size_bytes'):
+                if attr in self.root.attrs:
+                    del self.root.attrs[attr]
+            
+            # Reinitialize
+            self._init_store()
     
     def get_summary_stats(self) -> Dict[str, Any]:
         """
@@ -509,7 +975,9 @@ class BacktestStore:
         Returns:
             Dictionary with summary stats
         """
-        if 'metadata' not in self.root or self.root['metadata'].shape[0] == 0:
+        self._refresh()
+        metadata = self._live_metadata()
+        if len(metadata) == 0:
             return {
                 'total_backtests': 0,
                 'unique_symbols': 0,
@@ -517,20 +985,20 @@ class BacktestStore:
                 'storage_size_mb': 0
             }
         
-        metadata = self.root['metadata'][:]
-        df = pd.DataFrame(metadata)
-        
-        # Calculate storage size
-        storage_size = 0
-        if self.store_path.exists():
-            for path in self.store_path.rglob('*'):
-                if path.is_file():
-                    storage_size += path.stat().st_size
+        # Walk the store once; afterwards the size is maintained on write/delete
+        storage_size = self.root.attrs.get('storage_size_bytes')
+        if storage_size is None:
+            storage_size = 0
+            if self.store_path.exists():
+                for path in self.store_path.rglob('*'):
+                    if path.is_file():
+                        storage_size += path.stat().st_size
+            self.root.attrs['storage_size_bytes'] = storage_size
         
         return {
-            'total_backtests': len(df),
-            'unique_symbols': df['symbol'].nunique(),
-            'unique_strategies': df['strategy'].nunique(),
+            'total_backtests': len(metadata),
+            'unique_symbols': len(np.unique(metadata['symbol_id'])),
+            'unique_strategies': len(np.unique(metadata['strategy_id'])),
             'storage_size_mb': storage_size / (1024 * 1024)
         }
     
@@ -557,10 +1025,10 @@ class BacktestStore:
             del group_sets[name]
         
         group_data = group_sets.create_group(name)
-        group_data.attrs['symbols'] = json.dumps(symbols)
-        group_data.attrs['strategies'] = json.dumps(strategies)
-        group_data.attrs['params_list'] = json.dumps(params_list)
-        group_data.attrs['exit_rules'] = json.dumps(exit_rules)
+        group_data.attrs['symbols'] = orjson.dumps(symbols).decode()
+        group_data.attrs['strategies'] = orjson.dumps(strategies).decode()
+        group_data.attrs['params_list'] = orjson.dumps(params_list).decode()
+        group_data.attrs['exit_rules'] = orjson.dumps(exit_rules).decode()
         group_data.attrs['created_at'] = datetime.now().isoformat()
     
     def load_group_set(self, name: str) -> Optional[Dict[str, Any]]:
@@ -583,10 +1051,10 @@ class BacktestStore:
         group_data = group_sets[name]
         return {
             'name': name,
-            'symbols': json.loads(group_data.attrs['symbols']),
-            'strategies': json.loads(group_data.attrs['strategies']),
-            'params_list': json.loads(group_data.attrs['params_list']),
-            'exit_rules': json.loads(group_data.attrs['exit_rules']),
+            'symbols': orjson.loads(group_data.attrs['symbols']),
+            'strategies': orjson.loads(group_data.attrs['strategies']),
+            'params_list': orjson.loads(group_data.attrs['params_list']),
+            'exit_rules': orjson.loads(group_data.attrs['exit_rules']),
             'created_at': group_data.attrs.get('created_at', '')
         }
     
@@ -621,3 +1089,31 @@ class BacktestStore:
         
         del group_sets[name]
         return True
+
+
+# Shared BacktestStore instances keyed by resolved store path
+_STORES: Dict[str, BacktestStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(store_path: str = "./data/backtests/store.zarr") -> BacktestStore:
+    """
+    Get a shared BacktestStore for the given path.
+    
+    Reuses the already-open store (and its cached metadata) instead of
+    reopening the Zarr hierarchy on every construction.
+    
+    Args:
+        store_path: Path to Zarr store
+        
+    Returns:
+        BacktestStore instance for the path
+    """
+    key = str(Path(store_path).resolve())
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        # Reopen if the store directory was removed underneath us
+        if store is None or not store.store_path.exists():
+            store = BacktestStore(store_path)
+            _STORES[key] = store
+        return store
@@ -0,0 +1,118 @@
+"""
+Candlestick Kernel Module
+=========================
+Numba-compiled single-pass detector for all candlestick patterns.
+
+Reads each row's OHLC values (and the previous two rows where a pattern
+needs them) once and writes every pattern flag for that row, instead of
+running one vectorized pass per detector.
+"""
+
+from typing import List
+
+import numpy as np
+from numba import njit, prange
+
+
+# Column order of the kernel output matrix
+PATTERN_NAMES: List[str] = [
+    'engulfing_bull',
+    'engulfing_bear',
+    'hammer',
+    'hanging_man',
+    'doji',
+    'shooting_star',
+    'harami_bull',
+    'harami_bear',
+    'dark_cloud',
+    'piercing',
+    'three_white_soldiers',
+    'three_black_crows',
+]
+
+
+@njit(parallel=True, cache=True)
+def detect_all(O: np.ndarray, H: np.ndarray, L: np.ndarray, C: np.ndarray, out: np.ndarray):
+    """
+    Fill ``out`` with all candlestick pattern flags.
+
+    The criteria mirror the ``detect_*`` functions in candlestick_patterns;
+    two-candle patterns are never flagged on the first row and three-candle
+    patterns never on the first two.
+
+    Args:
+        O: Open prices (float64)
+        H: High prices (float64)
+        L: Low prices (float64)
+        C: Close prices (float64)
+        out: Zero-initialized int8 array of shape (N, len(PATTERN_NAMES))
+    """
+    n = O.shape[0]
+    for i in prange(n):
+        o0 = O[i]
+        h0 = H[i]
+        l0 = L[i]
+        c0 = C[i]
+        body = abs(c0 - o0)
+        rng = h0 - l0
+        upper = h0 - max(o0, c0)
+        lower = min(o0, c0) - l0
+        bull = c0 > o0
+        bear = c0 < o0
+
+        # Single-candle shapes
+        small_body = body < 0.3 * rng
+        if small_body and lower >= 2 * body and upper < 0.1 * rng and lower >= 0.6 * rng:
+            out[i, 2] = 1
+            out[i, 3] = 1
+        if body < 0.05 * rng and rng > 0:
+            out[i, 4] = 1
+        if small_body and upper >= 2 * body and lower < 0.1 * rng and upper >= 0.6 * rng:
+            out[i, 5] = 1
+
+        if i < 1:
+            continue
+
+        # Two-candle patterns
+        o1 = O[i - 1]
+        h1 = H[i - 1]
+        l1 = L[i - 1]
+        c1 = C[i - 1]
+        body1 = abs(c1 - o1)
+        rng1 = h1 - l1
+        bull1 = c1 > o1
+        bear1 = c1 < o1
+        mid1 = (o1 + c1) / 2
+
+        if bear1 and bull and o0 < c1 and c0 > o1:
+            out[i, 0] = 1
+        if bull1 and bear and o0 > c1 and c0 < o1:
+            out[i, 1] = 1
+        prev_large = body1 > 0.3 * rng1
+        if bear1 and bull and prev_large and body < body1 and o0 > c1 and c0 < o1:
+            out[i, 6] = 1
+        if bull1 and bear and prev_large and body < body1 and o0 < c1 and c0 > o1:
+            out[i, 7] = 1
+        if bull1 and bear and o0 > h1 and c0 < mid1:
+            out[i, 8] = 1
+        if bear1 and bull and o0 < l1 and c0 > mid1:
+            out[i, 9] = 1
+
+        if i < 2:
+            continue
+
+        # Three-candle patterns
+        o2 = O[i - 2]
+        c2 = C[i - 2]
+        large_bodies = (body > 0.5 * rng and body1 > 0.5 * rng1
+                        and abs(c2 - o2) > 0.5 * (H[i - 2] - L[i - 2]))
+        if not large_bodies:
+            continue
+        if (bull and bull1 and c2 > o2
+                and o0 > o1 and o0 < c1 and o1 > o2 and o1 < c2
+                and c0 > c1 and c1 > c2):
+            out[i, 10] = 1
+        if (bear and bear1 and c2 < o2
+                and o0 < o1 and o0 > c1 and o1 < o2 and o1 > c2
+                and c0 < c1 and c1 < c2):
+            out[i, 11] = 1
@@ -21,40 +21,143 @@ Patterns Implemented:
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import List, NamedTuple, Tuple, Union
+from numpy.lib.stride_tricks import sliding_window_view
+
+from candle_kernel import PATTERN_NAMES, detect_all
+
+
+# Bit position of each pattern in a packed uint16 flag word
+PATTERN_BITS = {name: bit for bit, name in enumerate(PATTERN_NAMES)}
 
 
 def compute_body_size(df: pd.DataFrame) -> pd.Series:
     """Compute the size of the candle body."""
-    return abs(df['Close'] - df['Open'])
+    return pd.Series(np.abs(df['Close'].to_numpy() - df['Open'].to_numpy()), index=df.index)
 
 
 def compute_upper_shadow(df: pd.DataFrame) -> pd.Series:
     """Compute the upper shadow (wick) length."""
-    return df['High'] - df[['Open', 'Close']].max(axis=1)
+    body_top = np.fmax(df['Open'].to_numpy(), df['Close'].to_numpy())
+    return pd.Series(df['High'].to_numpy() - body_top, index=df.index)
 
 
 def compute_lower_shadow(df: pd.DataFrame) -> pd.Series:
     """Compute the lower shadow (tail) length."""
-    return df[['Open', 'Close']].min(axis=1) - df['Low']
+    body_bottom = np.fmin(df['Open'].to_numpy(), df['Close'].to_numpy())
+    return pd.Series(body_bottom - df['Low'].to_numpy(), index=df.index)
 
 
 def compute_candle_range(df: pd.DataFrame) -> pd.Series:
     """Compute the total candle range (High - Low)."""
-    return df['High'] - df['Low']
+    return pd.Series(df['High'].to_numpy() - df['Low'].to_numpy(), index=df.index)
 
 
 def is_bullish(df: pd.DataFrame) -> pd.Series:
     """Return True where Close > Open (bullish candle)."""
-    return df['Close'] > df['Open']
+    return pd.Series(df['Close'].to_numpy() > df['Open'].to_numpy(), index=df.index)
 
 
 def is_bearish(df: pd.DataFrame) -> pd.Series:
     """Return True where Close < Open (bearish candle)."""
-    return df['Close'] < df['Open']
+    return pd.Series(df['Close'].to_numpy() < df['Open'].to_numpy(), index=df.index)
+
+
+class Candles(NamedTuple):
+    """
+    OHLC columns as NumPy arrays plus their lagged views and derived features.
+    
+    Built once per symbol by ``prepare_candles`` and shared by every
+    detector, so no detector has to call ``.shift()`` on a pandas column or
+    recompute body, range and shadow lengths. Three-candle patterns read
+    zero-copy sliding windows instead of two-bar lags.
+    Lagged price arrays hold NaN where no prior candle exists, which makes
+    every comparison against them False; lagged direction masks are filled
+    with False directly so they stay plain bool arrays.
+    """
+    index: pd.Index
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray
+    c: np.ndarray
+    o1: np.ndarray
+    h1: np.ndarray
+    l1: np.ndarray
+    c1: np.ndarray
+    bull: np.ndarray
+    bear: np.ndarray
+    bull1: np.ndarray
+    bear1: np.ndarray
+    body: np.ndarray
+    rng: np.ndarray
+    upper: np.ndarray
+    lower: np.ndarray
+    body1: np.ndarray
+    rng1: np.ndarray
+    mid1: np.ndarray
+
+
+def _lag(arr: np.ndarray, periods: int, fill_value=np.nan) -> np.ndarray:
+    """Return ``arr`` shifted forward by ``periods`` rows, padded with ``fill_value``."""
+    out = np.empty_like(arr)
+    k = min(periods, len(arr))
+    out[:k] = fill_value
+    out[k:] = arr[:len(arr) - k]
+    return out
+
+
+def prepare_candles(df: pd.DataFrame) -> Candles:
+    """
+    Extract OHLC arrays, their one-bar lags and the derived candle features
+    (body, range, shadows, previous body midpoint) from a DataFrame.
+    
+    Args:
+        df: DataFrame with Open, High, Low, Close columns
+        
+    Returns:
+        Candles tuple shared across detectors
+    """
+    o = df['Open'].to_numpy(dtype=np.float64)
+    h = df['High'].to_numpy(dtype=np.float64)
+    l = df['Low'].to_numpy(dtype=np.float64)
+    c = df['Close'].to_numpy(dtype=np.float64)
+    bull = c > o
+    bear = c < o
+    body = np.abs(c - o)
+    rng = h - l
+    o1 = _lag(o, 1)
+    c1 = _lag(c, 1)
+    return Candles(
+        df.index, o, h, l, c,
+        o1, _lag(h, 1), _lag(l, 1), c1,
+        bull, bear,
+        _lag(bull, 1, fill_value=False), _lag(bear, 1, fill_value=False),
+        body, rng, h - np.maximum(o, c), np.minimum(o, c) - l,
+        _lag(body, 1), _lag(rng, 1), 0.5 * (o1 + c1),
+    )
+
+
+def _as_candles(data: Union[pd.DataFrame, Candles]) -> Candles:
+    """Accept either a raw OHLC DataFrame or an already prepared Candles."""
+    return data if isinstance(data, Candles) else prepare_candles(data)
+
+
+def _to_series(pattern: np.ndarray, cd: Candles) -> pd.Series:
+    """
+    Wrap a boolean detection mask as an int8 Series on the candle index.
+    
+    The mask is a fresh bool array owned by the caller, so it is
+    reinterpreted as int8 in place rather than copied.
+    """
+    return pd.Series(pattern.view(np.int8), index=cd.index)
+
+
+def _windows3(arr: np.ndarray) -> np.ndarray:
+    """(N-2, 3) zero-copy view of consecutive triples, oldest candle first."""
+    return sliding_window_view(arr, 3)
 
 
-def detect_engulfing_bullish(df: pd.DataFrame) -> pd.Series:
+def detect_engulfing_bullish(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Bullish Engulfing pattern.
     
@@ -66,17 +169,18 @@ def detect_engulfing_bullish(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    prev_bearish = is_bearish(df).shift(1)
-    curr_bullish = is_bullish(df)
+    cd = _as_candles(data)
+    prev_bearish = cd.bear1
+    curr_bullish = cd.bull
     
     # Current open < previous close AND current close > previous open
-    engulfs = (df['Open'] < df['Close'].shift(1)) & (df['Close'] > df['Open'].shift(1))
+    engulfs = (cd.o < cd.c1) & (cd.c > cd.o1)
     
     pattern = prev_bearish & curr_bullish & engulfs
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_engulfing_bearish(df: pd.DataFrame) -> pd.Series:
+def detect_engulfing_bearish(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Bearish Engulfing pattern.
     
@@ -88,33 +192,28 @@ def detect_engulfing_bearish(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    prev_bullish = is_bullish(df).shift(1)
-    curr_bearish = is_bearish(df)
+    cd = _as_candles(data)
+    prev_bullish = cd.bull1
+    curr_bearish = cd.bear
     
     # Current open > previous close AND current close < previous open
-    engulfs = (df['Open'] > df['Close'].shift(1)) & (df['Close'] < df['Open'].shift(1))
+    engulfs = (cd.o > cd.c1) & (cd.c < cd.o1)
     
     pattern = prev_bullish & curr_bearish & engulfs
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_hammer(df: pd.DataFrame) -> pd.Series:
+def _detect_hammer_shape(cd: Candles) -> np.ndarray:
     """
-    Detect Hammer pattern.
-    
-    Criteria:
-    - Small body at upper end of range
-    - Lower shadow at least 2x body size
-    - Upper shadow very small or absent
-    - Appears after downtrend (bullish reversal)
+    Boolean mask of the hammer / hanging man candle shape.
     
-    Returns:
-        Series with 1 where pattern detected, 0 otherwise
+    Both patterns share this shape and differ only in the preceding trend,
+    which the detectors do not evaluate, so it is computed once for both.
     """
-    body = compute_body_size(df)
-    lower_shadow = compute_lower_shadow(df)
-    upper_shadow = compute_upper_shadow(df)
-    candle_range = compute_candle_range(df)
+    body = cd.body
+    lower_shadow = cd.lower
+    upper_shadow = cd.upper
+    candle_range = cd.rng
     
     # Small body (less than 30% of range)
     small_body = body < (0.3 * candle_range)
@@ -126,13 +225,29 @@ def detect_hammer(df: pd.DataFrame) -> pd.Series:
     small_upper = upper_shadow < (0.1 * candle_range)
     
     # Body at upper part of range
-    body_at_top = (df[['Open', 'Close']].min(axis=1) - df['Low']) >= (0.6 * candle_range)
+    body_at_top = lower_shadow >= (0.6 * candle_range)
     
-    pattern = small_body & long_lower & small_upper & body_at_top
-    return pattern.astype(int).fillna(0)
+    return small_body & long_lower & small_upper & body_at_top
 
 
-def detect_hanging_man(df: pd.DataFrame) -> pd.Series:
+def detect_hammer(data: Union[pd.DataFrame, Candles]) -> pd.Series:
+    """
+    Detect Hammer pattern.
+    
+    Criteria:
+    - Small body at upper end of range
+    - Lower shadow at least 2x body size
+    - Upper shadow very small or absent
+    - Appears after downtrend (bullish reversal)
+    
+    Returns:
+        Series with 1 where pattern detected, 0 otherwise
+    """
+    cd = _as_candles(data)
+    return _to_series(_detect_hammer_shape(cd), cd)
+
+
+def detect_hanging_man(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Hanging Man pattern.
     
@@ -147,22 +262,11 @@ def detect_hanging_man(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    # Same shape as hammer
-    body = compute_body_size(df)
-    lower_shadow = compute_lower_shadow(df)
-    upper_shadow = compute_upper_shadow(df)
-    candle_range = compute_candle_range(df)
-    
-    small_body = body < (0.3 * candle_range)
-    long_lower = lower_shadow >= (2 * body)
-    small_upper = upper_shadow < (0.1 * candle_range)
-    body_at_top = (df[['Open', 'Close']].min(axis=1) - df['Low']) >= (0.6 * candle_range)
-    
-    pattern = small_body & long_lower & small_upper & body_at_top
-    return pattern.astype(int).fillna(0)
+    cd = _as_candles(data)
+    return _to_series(_detect_hammer_shape(cd), cd)
 
 
-def detect_doji(df: pd.DataFrame) -> pd.Series:
+def detect_doji(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Doji pattern.
     
@@ -173,8 +277,9 @@ def detect_doji(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    body = compute_body_size(df)
-    candle_range = compute_candle_range(df)
+    cd = _as_candles(data)
+    body = cd.body
+    candle_range = cd.rng
     
     # Very small body relative to range
     very_small_body = body < (0.05 * candle_range)
@@ -183,10 +288,10 @@ def detect_doji(df: pd.DataFrame) -> pd.Series:
     has_range = candle_range > 0
     
     pattern = very_small_body & has_range
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_shooting_star(df: pd.DataFrame) -> pd.Series:
+def detect_shooting_star(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Shooting Star pattern.
     
@@ -199,10 +304,11 @@ def detect_shooting_star(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    body = compute_body_size(df)
-    lower_shadow = compute_lower_shadow(df)
-    upper_shadow = compute_upper_shadow(df)
-    candle_range = compute_candle_range(df)
+    cd = _as_candles(data)
+    body = cd.body
+    lower_shadow = cd.lower
+    upper_shadow = cd.upper
+    candle_range = cd.rng
     
     # Small body (less than 30% of range)
     small_body = body < (0.3 * candle_range)
@@ -214,13 +320,13 @@ def detect_shooting_star(df: pd.DataFrame) -> pd.Series:
     small_lower = lower_shadow < (0.1 * candle_range)
     
     # Body at bottom part of range
-    body_at_bottom = (df['High'] - df[['Open', 'Close']].max(axis=1)) >= (0.6 * candle_range)
+    body_at_bottom = upper_shadow >= (0.6 * candle_range)
     
     pattern = small_body & long_upper & small_lower & body_at_bottom
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_harami_bullish(df: pd.DataFrame) -> pd.Series:
+def detect_harami_bullish(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Bullish Harami pattern.
     
@@ -232,26 +338,27 @@ def detect_harami_bullish(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    prev_bearish = is_bearish(df).shift(1)
-    curr_bullish = is_bullish(df)
+    cd = _as_candles(data)
+    prev_bearish = cd.bear1
+    curr_bullish = cd.bull
     
-    prev_body = compute_body_size(df).shift(1)
-    curr_body = compute_body_size(df)
+    prev_body = cd.body1
+    curr_body = cd.body
     
     # Previous candle is large
-    prev_large = prev_body > (0.3 * compute_candle_range(df).shift(1))
+    prev_large = prev_body > (0.3 * cd.rng1)
     
     # Current body is smaller
     curr_smaller = curr_body < prev_body
     
     # Current is inside previous body
-    inside = (df['Open'] > df['Close'].shift(1)) & (df['Close'] < df['Open'].shift(1))
+    inside = (cd.o > cd.c1) & (cd.c < cd.o1)
     
     pattern = prev_bearish & curr_bullish & prev_large & curr_smaller & inside
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_harami_bearish(df: pd.DataFrame) -> pd.Series:
+def detect_harami_bearish(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Bearish Harami pattern.
     
@@ -263,26 +370,27 @@ def detect_harami_bearish(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    prev_bullish = is_bullish(df).shift(1)
-    curr_bearish = is_bearish(df)
+    cd = _as_candles(data)
+    prev_bullish = cd.bull1
+    curr_bearish = cd.bear
     
-    prev_body = compute_body_size(df).shift(1)
-    curr_body = compute_body_size(df)
+    prev_body = cd.body1
+    curr_body = cd.body
     
     # Previous candle is large
-    prev_large = prev_body > (0.3 * compute_candle_range(df).shift(1))
+    prev_large = prev_body > (0.3 * cd.rng1)
     
     # Current body is smaller
     curr_smaller = curr_body < prev_body
     
     # Current is inside previous body
-    inside = (df['Open'] < df['Close'].shift(1)) & (df['Close'] > df['Open'].shift(1))
+    inside = (cd.o < cd.c1) & (cd.c > cd.o1)
     
     pattern = prev_bullish & curr_bearish & prev_large & curr_smaller & inside
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_dark_cloud_cover(df: pd.DataFrame) -> pd.Series:
+def detect_dark_cloud_cover(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Dark Cloud Cover pattern.
     
@@ -295,21 +403,22 @@ def detect_dark_cloud_cover(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    prev_bullish = is_bullish(df).shift(1)
-    curr_bearish = is_bearish(df)
+    cd = _as_candles(data)
+    prev_bullish = cd.bull1
+    curr_bearish = cd.bear
     
     # Current opens above previous high
-    opens_above = df['Open'] > df['High'].shift(1)
+    opens_above = cd.o > cd.h1
     
     # Current closes below midpoint of previous body
-    prev_midpoint = (df['Open'].shift(1) + df['Close'].shift(1)) / 2
-    closes_below_mid = df['Close'] < prev_midpoint
+    prev_midpoint = cd.mid1
+    closes_below_mid = cd.c < prev_midpoint
     
     pattern = prev_bullish & curr_bearish & opens_above & closes_below_mid
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_piercing_pattern(df: pd.DataFrame) -> pd.Series:
+def detect_piercing_pattern(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Piercing Pattern.
     
@@ -322,21 +431,22 @@ def detect_piercing_pattern(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    prev_bearish = is_bearish(df).shift(1)
-    curr_bullish = is_bullish(df)
+    cd = _as_candles(data)
+    prev_bearish = cd.bear1
+    curr_bullish = cd.bull
     
     # Current opens below previous low
-    opens_below = df['Open'] < df['Low'].shift(1)
+    opens_below = cd.o < cd.l1
     
     # Current closes above midpoint of previous body
-    prev_midpoint = (df['Open'].shift(1) + df['Close'].shift(1)) / 2
-    closes_above_mid = df['Close'] > prev_midpoint
+    prev_midpoint = cd.mid1
+    closes_above_mid = cd.c > prev_midpoint
     
     pattern = prev_bearish & curr_bullish & opens_below & closes_above_mid
-    return pattern.astype(int).fillna(0)
+    return _to_series(pattern, cd)
 
 
-def detect_three_white_soldiers(df: pd.DataFrame) -> pd.Series:
+def detect_three_white_soldiers(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Three White Soldiers pattern.
     
@@ -349,30 +459,32 @@ def detect_three_white_soldiers(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    bullish = is_bullish(df)
-    body = compute_body_size(df)
-    candle_range = compute_candle_range(df)
+    cd = _as_candles(data)
+    pattern = np.zeros(len(cd.o), dtype=bool)
+    if len(pattern) < 3:
+        return _to_series(pattern, cd)
+    
+    # Window columns: 0 = two candles ago, 1 = previous, 2 = current
+    ow, cw = _windows3(cd.o), _windows3(cd.c)
     
     # Three consecutive bullish candles
-    three_bullish = bullish & bullish.shift(1) & bullish.shift(2)
+    three_bullish = _windows3(cd.bull).all(axis=1)
     
     # Each opens within previous body
-    opens_in_body_1 = (df['Open'] > df['Open'].shift(1)) & (df['Open'] < df['Close'].shift(1))
-    opens_in_body_2 = (df['Open'].shift(1) > df['Open'].shift(2)) & (df['Open'].shift(1) < df['Close'].shift(2))
+    opens_in_body_1 = (ow[:, 2] > ow[:, 1]) & (ow[:, 2] < cw[:, 1])
+    opens_in_body_2 = (ow[:, 1] > ow[:, 0]) & (ow[:, 1] < cw[:, 0])
     
     # Each closes higher
-    closes_higher = (df['Close'] > df['Close'].shift(1)) & (df['Close'].shift(1) > df['Close'].shift(2))
+    closes_higher = (cw[:, 2] > cw[:, 1]) & (cw[:, 1] > cw[:, 0])
     
     # Bodies are reasonably large (> 50% of range)
-    large_bodies = (body > 0.5 * candle_range) & \
-                   (body.shift(1) > 0.5 * candle_range.shift(1)) & \
-                   (body.shift(2) > 0.5 * candle_range.shift(2))
+    large_bodies = _windows3(cd.body > 0.5 * cd.rng).all(axis=1)
     
-    pattern = three_bullish & opens_in_body_1 & opens_in_body_2 & closes_higher & large_bodies
-    return pattern.astype(int).fillna(0)
+    pattern[2:] = three_bullish & opens_in_body_1 & opens_in_body_2 & closes_higher & large_bodies
+    return _to_series(pattern, cd)
 
 
-def detect_three_black_crows(df: pd.DataFrame) -> pd.Series:
+def detect_three_black_crows(data: Union[pd.DataFrame, Candles]) -> pd.Series:
     """
     Detect Three Black Crows pattern.
     
@@ -385,52 +497,113 @@ def detect_three_black_crows(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series with 1 where pattern detected, 0 otherwise
     """
-    bearish = is_bearish(df)
-    body = compute_body_size(df)
-    candle_range = compute_candle_range(df)
+    cd = _as_candles(data)
+    pattern = np.zeros(len(cd.o), dtype=bool)
+    if len(pattern) < 3:
+        return _to_series(pattern, cd)
+    
+    # Window columns: 0 = two candles ago, 1 = previous, 2 = current
+    ow, cw = _windows3(cd.o), _windows3(cd.c)
     
     # Three consecutive bearish candles
-    three_bearish = bearish & bearish.shift(1) & bearish.shift(2)
+    three_bearish = _windows3(cd.bear).all(axis=1)
     
     # Each opens within previous body
-    opens_in_body_1 = (df['Open'] < df['Open'].shift(1)) & (df['Open'] > df['Close'].shift(1))
-    opens_in_body_2 = (df['Open'].shift(1) < df['Open'].shift(2)) & (df['Open'].shift(1) > df['Close'].shift(2))
+    opens_in_body_1 = (ow[:, 2] < ow[:, 1]) & (ow[:, 2] > cw[:, 1])
+    opens_in_body_2 = (ow[:, 1] < ow[:, 0]) & (ow[:, 1] > cw[:, 0])
     
     # Each closes lower
-    closes_lower = (df['Close'] < df['Close'].shift(1)) & (df['Close'].shift(1) < df['Close'].shift(2))
+    closes_lower = (cw[:, 2] < cw[:, 1]) & (cw[:, 1] < cw[:, 0])
     
     # Bodies are reasonably large (> 50% of range)
-    large_bodies = (body > 0.5 * candle_range) & \
-                   (body.shift(1) > 0.5 * candle_range.shift(1)) & \
-                   (body.shift(2) > 0.5 * candle_range.shift(2))
+    large_bodies = _windows3(cd.body > 0.5 * cd.rng).all(axis=1)
+    
+    pattern[2:] = three_bearish & opens_in_body_1 & opens_in_body_2 & closes_lower & large_bodies
+    return _to_series(pattern, cd)
+
+
+def compute_pattern_matrix(df: pd.DataFrame) -> Tuple[List[str], np.ndarray]:
+    """
+    Compute all candlestick patterns as one contiguous flag matrix.
+    
+    Runs the fused Numba kernel from candle_kernel, which scans the OHLC
+    arrays once and emits every pattern flag per row. Scans that combine
+    several patterns can work on the matrix directly, e.g.
+    ``mat[:, [0, 2, 5]].any(axis=1)``.
+    
+    Args:
+        df: DataFrame with OHLC data
+        
+    Returns:
+        Tuple of (pattern names, C-contiguous int8 array of shape
+        (len(df), len(names)) with 1 where detected); rows follow df.index
+    """
+    n = len(df)
+    out = np.zeros((n, len(PATTERN_NAMES)), dtype=np.int8)
+    if n == 0:
+        return list(PATTERN_NAMES), out
+    
+    detect_all(
+        np.ascontiguousarray(df['Open'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(df['High'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(df['Low'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(df['Close'].to_numpy(dtype=np.float64)),
+        out,
+    )
     
-    pattern = three_bearish & opens_in_body_1 & opens_in_body_2 & closes_lower & large_bodies
-    return pattern.astype(int).fillna(0)
+    return list(PATTERN_NAMES), out
 
 
-def compute_all_patterns(df: pd.DataFrame) -> Dict[str, pd.Series]:
+def compute_all_patterns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Compute all candlestick patterns.
     
+    Wraps compute_pattern_matrix as a single int8 block, so the patterns
+    share one index and can be concatenated or written in one step.
+    
     Args:
         df: DataFrame with OHLC data
         
     Returns:
-        Dictionary mapping pattern name to detection series
-    """
-    patterns = {
-        'engulfing_bull': detect_engulfing_bullish(df),
-        'engulfing_bear': detect_engulfing_bearish(df),
-        'hammer': detect_hammer(df),
-        'hanging_man': detect_hanging_man(df),
-        'doji': detect_doji(df),
-        'shooting_star': detect_shooting_star(df),
-        'harami_bull': detect_harami_bullish(df),
-        'harami_bear': detect_harami_bearish(df),
-        'dark_cloud': detect_dark_cloud_cover(df),
-        'piercing': detect_piercing_pattern(df),
-        'three_white_soldiers': detect_three_white_soldiers(df),
-        'three_black_crows': detect_three_black_crows(df),
-    }
-    
-    return patterns
+        DataFrame with one int8 column per pattern (1 where detected),
+        in PATTERN_NAMES order
+    """
+    names, mat = compute_pattern_matrix(df)
+    return pd.DataFrame(mat, index=df.index, columns=names)
+
+
+def pack_patterns(patterns: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    """
+    Pack the 12 pattern flags of each row into a single uint16 word.
+    
+    Bit ``PATTERN_BITS[name]`` is set where that pattern was detected, so
+    a query over several patterns becomes one mask-and-compare, e.g.
+    ``packed & ((1 << PATTERN_BITS['hammer']) | (1 << PATTERN_BITS['piercing']))``.
+    
+    Args:
+        patterns: Output of compute_all_patterns, or an (N, 12) flag array
+            in PATTERN_NAMES order
+        
+    Returns:
+        uint16 array of length N
+    """
+    if isinstance(patterns, pd.DataFrame):
+        patterns = patterns[PATTERN_NAMES].to_numpy()
+    packed = np.zeros(len(patterns), dtype=np.uint16)
+    for bit in range(len(PATTERN_NAMES)):
+        packed |= patterns[:, bit].astype(np.uint16) << np.uint16(bit)
+    return packed
+
+
+def has_pattern(packed: np.ndarray, name: str) -> np.ndarray:
+    """
+    Extract one pattern's flags from packed uint16 words.
+    
+    Args:
+        packed: Output of pack_patterns
+        name: Pattern name (key of PATTERN_BITS)
+        
+    Returns:
+        uint16 array with 1 where the pattern is set, 0 otherwise
+    """
+    return (packed >> np.uint16(PATTERN_BITS[name])) & np.uint16(1)
@@ -21,12 +21,10 @@ Environment:
 import os
 import sys
 import argparse
+from itertools import islice
 from pathlib import Path
 from typing import List, Optional
 
-from data_loader import DataLoader
-from indicator_engine import IndicatorEngine
-
 
 def print_banner():
     """Print a nice banner."""
@@ -55,11 +53,17 @@ def validate_data_directory(data_path: Path) -> tuple[bool, str]:
     if not data_path.exists():
         return False, f"Data directory does not exist: {data_path}"
     
-    parquet_files = list(data_path.glob("*.parquet"))
-    if not parquet_files:
+    if not data_path.is_dir():
+        return False, f"Data path is not a directory: {data_path}"
+    
+    # Count with scandir rather than materializing a glob list of Paths
+    with os.scandir(data_path) as entries:
+        count = sum(1 for entry in entries if entry.name.endswith('.parquet'))
+    
+    if count == 0:
         return False, f"No Parquet files found in: {data_path}"
     
-    return True, f"Found {len(parquet_files)} Parquet files"
+    return True, f"Found {count} Parquet files"
 
 
 def main():
@@ -83,10 +87,20 @@ Examples:
   
   # Use custom RSI periods
   python compute_indicators.py --rsi-periods 7 14 21
+  
+  # Keep full float64 precision for prices and indicators
+  python compute_indicators.py --float-dtype 64
+  
+  # Compute sequentially in a single process
+  python compute_indicators.py --workers 1
+  
+  # Recompute every symbol, even those whose data is unchanged
+  python compute_indicators.py --force
 
 Notes:
   - This script MUST be run before using the scanner or web UI
-  - Re-run after uploading new price data (Parquet files)
+  - Re-run after uploading new price data (Parquet files); symbols whose
+    data and parameters are unchanged are skipped unless --force is given
   - Indicators are stored in: data/indicators/indicators.h5 and config.json
         """
     )
@@ -150,6 +164,27 @@ Notes:
         help='Skip days since prev high/low indicators'
     )
     
+    parser.add_argument(
+        '--float-dtype',
+        type=int,
+        choices=[32, 64],
+        default=32,
+        help='Float precision for prices and SMA/RSI/EMA outputs (default: 32)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes for indicator computation (default: number of CPUs)'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Recompute symbols whose price data and parameters are unchanged'
+    )
+    
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -158,6 +193,10 @@ Notes:
     
     args = parser.parse_args()
     
+    # Imported after argument parsing so --help and usage errors stay fast
+    from data_loader import DataLoader
+    from indicator_engine import IndicatorEngine
+    
     # Convert paths to Path objects
     data_path = Path(args.data_path)
     indicator_path = Path(args.indicator_path)
@@ -169,6 +208,7 @@ Notes:
         print(f"  Indicator path:  {indicator_path.absolute()}")
         print(f"  SMA periods:     {args.sma_periods}")
         print(f"  RSI periods:     {args.rsi_periods}")
+        print(f"  Float precision: float{args.float_dtype}")
     
     # Step 1: Validate data directory
     if not args.quiet:
@@ -215,14 +255,20 @@ Notes:
             print("\n❌ ERROR: Failed to load any symbols")
             sys.exit(1)
         
+        # Downcast prices so moving averages and RSI are computed and stored in float32
+        if args.float_dtype == 32:
+            for sym, d in data_dict.items():
+                price_cols = [c for c in ('Open', 'High', 'Low', 'Close') if c in d.columns]
+                data_dict[sym] = d.astype({c: 'float32' for c in price_cols})
+        
         if not args.quiet:
             print(f"✓ Successfully loaded {len(data_dict)} symbols")
-            print(f"  Symbols: {', '.join(list(data_dict.keys())[:10])}")
+            print(f"  Symbols: {', '.join(islice(data_dict, 10))}")
             if len(data_dict) > 10:
                 print(f"           ... and {len(data_dict) - 10} more")
             
             # Show sample data info
-            sample_symbol = list(data_dict.keys())[0]
+            sample_symbol = next(iter(data_dict))
             sample_data = data_dict[sample_symbol]
             print(f"\n  Sample data ({sample_symbol}):")
             print(f"    Rows: {len(sample_data)}")
@@ -246,6 +292,7 @@ Notes:
         print(f"  Candlestick patterns: {'No' if args.no_candlestick_patterns else 'Yes'}")
         print(f"  Streak indicators: {'No' if args.no_streak_indicators else 'Yes'}")
         print(f"  High/Low day tracking: {'No' if args.no_high_low_days else 'Yes'}")
+        print(f"  Workers: {args.workers}")
         print()
     
     try:
@@ -264,7 +311,9 @@ Notes:
             include_candlestick_patterns=not args.no_candlestick_patterns,
             include_streak_indicators=not args.no_streak_indicators,
             include_high_low_days=not args.no_high_low_days,
-            show_progress=not args.quiet
+            show_progress=not args.quiet,
+            max_workers=args.workers,
+            skip_unchanged=not args.force
         )
         
         if not args.quiet:
@@ -10,11 +10,30 @@ from dash import dcc, html, dash_table, callback_context
 from dash.dependencies import Input, Output, State
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
+import plotly.io.json as plotly_json
 import pandas as pd
+import pyarrow as pa
+import hashlib
+import json
+import math
+import multiprocessing as mp
+import orjson
+import os
+import re
+import threading
+import time
+import traceback
 import uuid
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from flask.json.provider import JSONProvider
+from typing import Optional, Tuple
 
-from scanner import Scanner
+from scanner import Scanner, scan_shard
+from data_loader import DataLoader
 from indicator_engine import IndicatorEngine
 from backtest_engine import BacktestEngine
 from backtest_manager_ui import BacktestManagerUI
@@ -23,13 +42,301 @@ from error_handler import (
     with_error_handling,
     safe_execute,
     handle_callback_error,
+    get_user_friendly_error,
     ApplicationError
 )
 
+# Optional: run scans as background callbacks when diskcache is installed
+try:
+    import diskcache
+    from dash import DiskcacheManager
+except ImportError:
+    diskcache = None
+
 # Data path options to check for price data
 DEFAULT_DATA_PATHS = ['./data/prices', './data/stock_data', '../data/prices']
 
 
+def _find_data_path() -> Optional[str]:
+    """Return the first existing directory in DEFAULT_DATA_PATHS, or None."""
+    return next((path for path in DEFAULT_DATA_PATHS if os.path.exists(path)), None)
+
+
+# Rows per scan results page (virtualized, so only visible rows reach the DOM),
+# and how many recent scans keep their full results server-side
+SCAN_PAGE_SIZE = 100
+SCAN_CACHE_SIZE = 8
+
+# Candlestick pattern columns hold 1 on bars where the pattern is detected
+PATTERN_PRESENT = 1
+
+# Scan type -> (Scanner method, keyword-argument builder, status template).
+# Builders take the symbol list and the scan query; templates are formatted
+# with the query values plus n (result count), pattern_name and streak_name.
+SCAN_DISPATCH = {
+    'rsi_oversold': (
+        'scan_rsi_oversold',
+        lambda symbols, q: dict(symbols=symbols, rsi_period=q['rsi_period'],
+                                threshold=q['rsi_threshold']),
+        "Found {n} oversold stocks (RSI < {rsi_threshold})"
+    ),
+    'rsi_overbought': (
+        'scan_rsi_overbought',
+        lambda symbols, q: dict(symbols=symbols, rsi_period=q['rsi_period'],
+                                threshold=q['rsi_threshold']),
+        "Found {n} overbought stocks (RSI > {rsi_threshold})"
+    ),
+    'ma_cross_bull': (
+        'scan_ma_crossover',
+        lambda symbols, q: dict(symbols=symbols, fast_period=q['fast_ma'],
+                                slow_period=q['slow_ma'], direction='bullish'),
+        "Found {n} bullish MA crossovers"
+    ),
+    'ma_cross_bear': (
+        'scan_ma_crossover',
+        lambda symbols, q: dict(symbols=symbols, fast_period=q['fast_ma'],
+                                slow_period=q['slow_ma'], direction='bearish'),
+        "Found {n} bearish MA crossovers"
+    ),
+    'candlestick': (
+        'scan_by_indicator',
+        lambda symbols, q: dict(symbols=symbols, indicator=q['pattern_type'],
+                                operator='==', threshold=PATTERN_PRESENT),
+        "Found {n} stocks with {pattern_name} pattern"
+    ),
+    'momentum_streak': (
+        'scan_by_indicator',
+        lambda symbols, q: dict(symbols=symbols, indicator=q['streak_type'],
+                                operator='>=', threshold=float(q['streak_threshold'])),
+        "Found {n} stocks with {streak_name} >= {streak_threshold} days"
+    ),
+    'custom_indicator': (
+        'scan_by_indicator',
+        lambda symbols, q: dict(symbols=symbols, indicator=q['custom_indicator'],
+                                operator=q['custom_operator'],
+                                threshold=float(q['custom_threshold'])),
+        "Found {n} stocks where {custom_indicator} {custom_operator} {custom_threshold}"
+    ),
+    'top_performers': (
+        'get_top_performers',
+        lambda symbols, q: dict(strategy_name='rsi_meanrev', metric='sharpe_ratio', top_n=20),
+        "Top 20 performers by Sharpe ratio"
+    ),
+}
+
+# Scan types whose results a repeated query reuses. RSI and MA crossover scans
+# also merge in backtest stats, so cached results are keyed by both the
+# indicators.h5 and backtest store versions. Top performers is a single
+# backtest store query, cheap enough to always re-run.
+REUSABLE_SCAN_TYPES = frozenset(
+    scan_type for scan_type, (method, _, _) in SCAN_DISPATCH.items()
+    if method != 'get_top_performers'
+)
+
+# Static dropdown options, built once at import
+SCAN_TYPE_OPTIONS = (
+    {'label': 'RSI Oversold', 'value': 'rsi_oversold'},
+    {'label': 'RSI Overbought', 'value': 'rsi_overbought'},
+    {'label': 'MA Crossover (Bullish)', 'value': 'ma_cross_bull'},
+    {'label': 'MA Crossover (Bearish)', 'value': 'ma_cross_bear'},
+    {'label': 'Candlestick Patterns', 'value': 'candlestick'},
+    {'label': 'Momentum Streaks', 'value': 'momentum_streak'},
+    {'label': 'Custom Indicator Filter', 'value': 'custom_indicator'},
+    {'label': 'Top Performers', 'value': 'top_performers'},
+)
+PATTERN_OPTIONS = (
+    {'label': 'Bullish Engulfing', 'value': 'engulfing_bull'},
+    {'label': 'Bearish Engulfing', 'value': 'engulfing_bear'},
+    {'label': 'Hammer', 'value': 'hammer'},
+    {'label': 'Shooting Star', 'value': 'shooting_star'},
+    {'label': 'Doji', 'value': 'doji'},
+    {'label': 'Hanging Man', 'value': 'hanging_man'},
+    {'label': 'Bullish Harami', 'value': 'harami_bull'},
+    {'label': 'Bearish Harami', 'value': 'harami_bear'},
+    {'label': 'Dark Cloud Cover', 'value': 'dark_cloud'},
+    {'label': 'Piercing Pattern', 'value': 'piercing'},
+    {'label': 'Three White Soldiers', 'value': 'three_white_soldiers'},
+    {'label': 'Three Black Crows', 'value': 'three_black_crows'},
+)
+STREAK_OPTIONS = (
+    {'label': 'Consecutive Higher Highs', 'value': 'consec_higher_high'},
+    {'label': 'Consecutive Lower Lows', 'value': 'consec_lower_low'},
+)
+OPERATOR_OPTIONS = (
+    {'label': 'Greater than (>)', 'value': '>'},
+    {'label': 'Less than (<)', 'value': '<'},
+    {'label': 'Greater or equal (>=)', 'value': '>='},
+    {'label': 'Less or equal (<=)', 'value': '<='},
+    {'label': 'Equal (==)', 'value': '=='},
+    {'label': 'Not equal (!=)', 'value': '!='},
+)
+STRATEGY_OPTIONS = (
+    {'label': 'RSI Mean Reversion', 'value': 'rsi_meanrev'},
+    {'label': 'MA Crossover', 'value': 'ma_crossover'},
+)
+
+# Friendly dropdown labels: fixed names, then period-suffixed indicators
+INDICATOR_LABELS = {
+    'consec_higher_high': "Consecutive Higher Highs",
+    'consec_lower_low': "Consecutive Lower Lows",
+    'days_since_prev_high': "Days Since Previous High",
+    'days_since_prev_low': "Days Since Previous Low",
+    'engulfing_bull': "Bullish Engulfing Pattern",
+    'engulfing_bear': "Bearish Engulfing Pattern",
+}
+PERIOD_INDICATOR_RE = re.compile(r'^(RSI|SMA|EMA)_([^_]*)')
+
+# Scanner methods that only read the stores, and the symbol count from which
+# they are sharded across worker processes. scan_rsi_* may compute and write a
+# missing RSI period, so those always run in-process.
+PARALLEL_SCAN_METHODS = {'scan_ma_crossover', 'scan_by_indicator'}
+PARALLEL_SCAN_MIN_SYMBOLS = 500
+
+# Decimal places float columns are rounded to before being sent to tables
+DISPLAY_DECIMALS = 4
+
+# Disk cache shared by background scan jobs and the web process
+BACKGROUND_CACHE_DIR = './data/cache/dash'
+SCAN_RESULTS_EXPIRE_SECONDS = 3600
+
+# Clientside click debounce: only the last click within 500ms of the previous
+# one is forwarded. Takes the button's n_clicks and id; each button id keeps
+# its own timer.
+DEBOUNCE_CLICKS_JS = """
+function(n_clicks, buttonId) {
+    var timers = window._clickDebounce = window._clickDebounce || {};
+    var state = timers[buttonId] = timers[buttonId] || {};
+    if (state.timer) {
+        clearTimeout(state.timer);
+        state.resolve(window.dash_clientside.no_update);
+    }
+    return new Promise(function(resolve) {
+        state.resolve = resolve;
+        state.timer = setTimeout(function() {
+            state.timer = null;
+            resolve(n_clicks);
+        }, 500);
+    });
+}
+"""
+
+# Backtest metrics averaged per strategy in the summary card
+SUMMARY_METRICS = ('cagr', 'sharpe_ratio', 'win_rate', 'max_drawdown', 'num_trades')
+
+# Default seconds a _cached value is reused before re-reading from disk
+CACHE_TTL_SECONDS = 60
+
+
+def _frame_records(df: pd.DataFrame) -> list:
+    """
+    Convert a DataFrame to DataTable row dicts.
+    
+    Equivalent to ``df.to_dict('records')`` but builds the rows in Arrow's C++
+    ``to_pylist``; columns Arrow cannot type (mixed-object) fall back to
+    zipping plain tuples with the column names.
+    
+    Args:
+        df: DataFrame to convert
+        
+    Returns:
+        List of {column: value} dicts
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+    except (pa.ArrowException, ValueError):
+        columns = list(df.columns)
+        return [dict(zip(columns, row)) for row in df.itertuples(index=False, name=None)]
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used to parse callback requests."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def _narrow_columns(df: pd.DataFrame, decimals: int = DISPLAY_DECIMALS) -> pd.DataFrame:
+    """
+    Round float columns to display precision, downcast integer columns and
+    format date-only datetime columns.
+    
+    float32 columns are widened first so rounded values serialize as short
+    decimals (0.1 rather than 0.10000000149011612); integers are stored in
+    the smallest type holding their range, shrinking cached result frames.
+    Datetime columns without a time of day become 'YYYY-MM-DD' strings once
+    here, instead of a datetime object per row on every page served.
+    
+    Args:
+        df: DataFrame to narrow
+        decimals: Decimal places to keep
+        
+    Returns:
+        DataFrame with rounded float, downcast integer and formatted date columns
+    """
+    float_cols = df.select_dtypes('float').columns
+    if len(float_cols) > 0:
+        df = df.astype(dict.fromkeys(float_cols, 'float64')).round(dict.fromkeys(float_cols, decimals))
+    
+    int_cols = df.select_dtypes('integer').columns
+    if len(int_cols) > 0:
+        df = df.assign(**{col: pd.to_numeric(df[col], downcast='integer') for col in int_cols})
+    
+    date_cols = [col for col in df.select_dtypes('datetime').columns
+                 if (df[col].dt.normalize() == df[col])[df[col].notna()].all()]
+    if date_cols:
+        df = df.assign(**{col: df[col].dt.strftime('%Y-%m-%d') for col in date_cols})
+    
+    return df
+
+
+@lru_cache(maxsize=32)
+def _table_columns(names: tuple) -> list:
+    """
+    DataTable column specs for a results schema, built once per schema.
+    
+    Args:
+        names: Column names, as a tuple so the schema can be cached
+        
+    Returns:
+        List of {'name', 'id'} dicts (shared; do not mutate)
+    """
+    return [{'name': col, 'id': col} for col in names]
+
+
+@lru_cache(maxsize=8)
+def _indicator_options(names: frozenset) -> list:
+    """
+    Indicator dropdown options with friendly labels, built once per indicator set.
+    
+    Args:
+        names: Indicator column names, as a frozenset so the set can be cached
+        
+    Returns:
+        Sorted list of {'label', 'value'} dicts (shared; do not mutate)
+    """
+    options = []
+    for indicator in sorted(names):
+        match = PERIOD_INDICATOR_RE.match(indicator)
+        if match:
+            label = f"{match[1]} ({match[2]} period)"
+        elif '_' in indicator:
+            # Convert snake_case to Title Case unless a fixed label exists
+            label = INDICATOR_LABELS.get(indicator, indicator.replace('_', ' ').title())
+        else:
+            label = indicator
+        
+        options.append({'label': label, 'value': indicator})
+    
+    return options
+
+
 class DashUI:
     """
     Dash-based web UI for scanning and results visualization.
@@ -62,16 +369,47 @@ class DashUI:
             metadata={'type': 'dash_ui', 'indicator_path': indicator_path}
         )
         
-        # Initialize engines
-        self.indicator_engine = IndicatorEngine(indicator_path)
-        self.backtest_engine = BacktestEngine(backtest_path)
-        self.scanner = Scanner(self.indicator_engine, self.backtest_engine)
+        # Engines are built on first use so the page loads without opening the stores
+        self._indicator_path = indicator_path
+        self._backtest_path = backtest_path
+        self._engines = None
+        self._engines_lock = threading.Lock()
+        
+        # Price data root, probed once; the Rescan Paths button probes again
+        self._data_path = _find_data_path()
+        
+        # Full scan results keyed by scan query; only the visible page is sent to the browser
+        self._scan_cache = OrderedDict()
+        self._scan_cache_lock = threading.Lock()
+        
+        # Scans run in a background process when diskcache is available; their
+        # results are then kept in the same disk cache so pages can be served
+        self._disk_cache = None
+        background_callback_manager = None
+        if diskcache is not None:
+            try:
+                self._disk_cache = diskcache.Cache(BACKGROUND_CACHE_DIR)
+                background_callback_manager = DiskcacheManager(self._disk_cache)
+            except Exception as e:
+                print(f"Background callbacks disabled: {e}")
+                self._disk_cache = None
+        
+        # Short-lived copies of disk reads shared by callbacks: name -> (expires_at, value)
+        self._ttl_cache = {}
+        
+        # indicators.h5 mtime the cached symbol/indicator lists were read at
+        self._indicator_version = None
+        
+        # Aggregated backtest summary rows keyed by the store's metadata mtime:
+        # (mtime_ns, (num_backtests, records, columns))
+        self._summary_cache = None
         
         # Initialize Backtest Manager UI with session manager
         self.backtest_manager = BacktestManagerUI(
-            self.indicator_engine, 
-            self.backtest_engine,
-            session_manager=self.session_manager
+            None,
+            None,
+            session_manager=self.session_manager,
+            engine_loader=lambda: self._get_engines()[:2]
         )
         
         # Initialize Dash app with dark theme CSS
@@ -84,15 +422,53 @@ class DashUI:
             __name__,
             external_stylesheets=external_stylesheets,
             suppress_callback_exceptions=True,
-            assets_folder='assets'
+            assets_folder='assets',
+            background_callback_manager=background_callback_manager
         )
         
         # Set app title
         self.app.title = "Quant Dashboard - Stock Analysis & Trading"
         
+        # orjson for callback request parsing (Flask) and response encoding (plotly)
+        self.app.server.json = OrjsonProvider(self.app.server)
+        plotly_json.config.default_engine = 'orjson'
+        
         self._setup_layout()
         self._setup_callbacks()
     
+    def _get_engines(self) -> Tuple[IndicatorEngine, BacktestEngine, Scanner]:
+        """
+        Build the engines on first call and return the cached instances.
+        
+        Returns:
+            Tuple of (indicator_engine, backtest_engine, scanner)
+        """
+        if self._engines is None:
+            with self._engines_lock:
+                if self._engines is None:
+                    # Scans may run in fresh background processes; the disk cache
+                    # lets them reuse indicator tails read by earlier scans
+                    indicator_engine = IndicatorEngine(self._indicator_path, shared_cache=self._disk_cache)
+                    backtest_engine = BacktestEngine(self._backtest_path)
+                    scanner = Scanner(indicator_engine, backtest_engine)
+                    self._engines = (indicator_engine, backtest_engine, scanner)
+        return self._engines
+    
+    @property
+    def indicator_engine(self) -> IndicatorEngine:
+        """IndicatorEngine, built on first access."""
+        return self._get_engines()[0]
+    
+    @property
+    def backtest_engine(self) -> BacktestEngine:
+        """BacktestEngine, built on first access."""
+        return self._get_engines()[1]
+    
+    @property
+    def scanner(self) -> Scanner:
+        """Scanner, built on first access."""
+        return self._get_engines()[2]
+    
     def _setup_layout(self):
         """Setup the UI layout."""
         self.app.layout = dbc.Container([
@@ -109,6 +485,9 @@ class DashUI:
             # Hidden store for session ID
             dcc.Store(id='session-id-store', data=self.session_id),
             
+            # Last health outcome rendered into the banner, so unchanged checks skip re-rendering
+            dcc.Store(id='session-health-key'),
+            
             # Header Section
             html.Div([
                 dbc.Row([
@@ -224,11 +603,24 @@ class DashUI:
                                         id='refresh-symbols-btn',
                                         color="secondary",
                                         size="lg",
+                                        outline=True,
+                                        className="me-2"
+                                    ),
+                                    dbc.Button(
+                                        "📁 Rescan Paths",
+                                        id='rescan-paths-btn',
+                                        color="secondary",
+                                        size="lg",
                                         outline=True
                                     ),
+                                    dcc.Store(id='debounced-refresh'),
                                 ], width="auto")
                             ], className="mb-3"),
                             
+                            html.Small(id='data-path-status', className="text-muted"),
+                            
+                            html.Div(id='indicator-progress', className="mt-3"),
+                            
                             html.Div(id='indicator-output', className="mt-3", 
                                     style={'fontSize': '0.9em', 'fontFamily': 'monospace'}),
                             
@@ -271,16 +663,7 @@ class DashUI:
                             dbc.Label("Scan Type:"),
                             dcc.Dropdown(
                                 id='scan-type',
-                                options=[
-                                    {'label': 'RSI Oversold', 'value': 'rsi_oversold'},
-                                    {'label': 'RSI Overbought', 'value': 'rsi_overbought'},
-                                    {'label': 'MA Crossover (Bullish)', 'value': 'ma_cross_bull'},
-                                    {'label': 'MA Crossover (Bearish)', 'value': 'ma_cross_bear'},
-                                    {'label': 'Candlestick Patterns', 'value': 'candlestick'},
-                                    {'label': 'Momentum Streaks', 'value': 'momentum_streak'},
-                                    {'label': 'Custom Indicator Filter', 'value': 'custom_indicator'},
-                                    {'label': 'Top Performers', 'value': 'top_performers'}
-                                ],
+                                options=list(SCAN_TYPE_OPTIONS),
                                 value='rsi_oversold',
                                 className="mb-3"
                             ),
@@ -326,20 +709,7 @@ class DashUI:
                                 dbc.Label("Pattern Type:"),
                                 dcc.Dropdown(
                                     id='pattern-type',
-                                    options=[
-                                        {'label': 'Bullish Engulfing', 'value': 'engulfing_bull'},
-                                        {'label': 'Bearish Engulfing', 'value': 'engulfing_bear'},
-                                        {'label': 'Hammer', 'value': 'hammer'},
-                                        {'label': 'Shooting Star', 'value': 'shooting_star'},
-                                        {'label': 'Doji', 'value': 'doji'},
-                                        {'label': 'Hanging Man', 'value': 'hanging_man'},
-                                        {'label': 'Bullish Harami', 'value': 'harami_bull'},
-                                        {'label': 'Bearish Harami', 'value': 'harami_bear'},
-                                        {'label': 'Dark Cloud Cover', 'value': 'dark_cloud'},
-                                        {'label': 'Piercing Pattern', 'value': 'piercing'},
-                                        {'label': 'Three White Soldiers', 'value': 'three_white_soldiers'},
-                                        {'label': 'Three Black Crows', 'value': 'three_black_crows'}
-                                    ],
+                                    options=list(PATTERN_OPTIONS),
                                     value='engulfing_bull',
                                     className="mb-3"
                                 )
@@ -350,10 +720,7 @@ class DashUI:
                                 dbc.Label("Streak Type:"),
                                 dcc.Dropdown(
                                     id='streak-type',
-                                    options=[
-                                        {'label': 'Consecutive Higher Highs', 'value': 'consec_higher_high'},
-                                        {'label': 'Consecutive Lower Lows', 'value': 'consec_lower_low'}
-                                    ],
+                                    options=list(STREAK_OPTIONS),
                                     value='consec_higher_high',
                                     className="mb-2"
                                 ),
@@ -379,14 +746,7 @@ class DashUI:
                                 dbc.Label("Operator:"),
                                 dcc.Dropdown(
                                     id='custom-operator',
-                                    options=[
-                                        {'label': 'Greater than (>)', 'value': '>'},
-                                        {'label': 'Less than (<)', 'value': '<'},
-                                        {'label': 'Greater or equal (>=)', 'value': '>='},
-                                        {'label': 'Less or equal (<=)', 'value': '<='},
-                                        {'label': 'Equal (==)', 'value': '=='},
-                                        {'label': 'Not equal (!=)', 'value': '!='}
-                                    ],
+                                    options=list(OPERATOR_OPTIONS),
                                     value='>',
                                     className="mb-2"
                                 ),
@@ -413,8 +773,53 @@ class DashUI:
                     dbc.Card([
                         dbc.CardHeader("Scan Results"),
                         dbc.CardBody([
-                            html.Div(id='scan-results-div'),
-                            html.Div(id='scan-status', className="mt-2")
+                            html.Div(
+                                html.P("Configure scan and click 'Run Scan'"),
+                                id='scan-results-div'
+                            ),
+                            # Mounted once; scans only update its columns and paging,
+                            # and the page callback fills in the rows
+                            html.Div(
+                                dash_table.DataTable(
+                                    id='scan-results-table',
+                                    data=[],
+                                    columns=[],
+                                    style_table={'overflowX': 'auto'},
+                                    style_cell={
+                                        'textAlign': 'left',
+                                        'padding': '10px',
+                                        'fontSize': '14px',
+                                        'minWidth': 95, 'width': 95, 'maxWidth': 95
+                                    },
+                                    style_header={
+                                        'backgroundColor': 'rgb(230, 230, 230)',
+                                        'fontWeight': 'bold'
+                                    },
+                                    style_data_conditional=[
+                                        {
+                                            'if': {'row_index': 'odd'},
+                                            'backgroundColor': 'rgb(248, 248, 248)'
+                                        }
+                                    ],
+                                    virtualization=True,
+                                    fixed_rows={'headers': True},
+                                    page_action='custom',
+                                    page_current=0,
+                                    page_size=SCAN_PAGE_SIZE,
+                                    page_count=0
+                                ),
+                                id='scan-results-table-container',
+                                style={'display': 'none'}
+                            ),
+                            html.Div(id='scan-status', className="mt-2"),
+                            dcc.Store(id='scan-query-store'),
+                            dcc.Store(id='debounced-clicks'),
+                            dcc.Store(id='scan-meta'),
+                            dcc.Store(id='scan-session-sync'),
+                            dcc.Store(
+                                id='scan-status-templates',
+                                data={scan_type: entry[2] for scan_type, entry in SCAN_DISPATCH.items()}
+                            )
                         ])
                     ])
                 ], width=9)
@@ -424,9 +829,44 @@ class DashUI:
             dbc.Row([
                 dbc.Col([
                     dbc.Card([
-                        dbc.CardHeader("Backtest Summary"),
+                        dbc.CardHeader([
+                            "Backtest Summary",
+                            dbc.Button(
+                                "Refresh",
+                                id='refresh-summary-btn',
+                                color="secondary",
+                                size="sm",
+                                className="float-end"
+                            )
+                        ]),
                         dbc.CardBody([
-                            html.Div(id='backtest-summary-div')
+                            html.H5(id='backtest-summary-header', className="mb-3"),
+                            dcc.Store(id='backtest-summary-data'),
+                            html.Div(id='backtest-summary-div'),
+                            # Populated clientside from backtest-summary-data, so the
+                            # static style props never cross the wire
+                            html.Div(
+                                dash_table.DataTable(
+                                    id='backtest-summary-table',
+                                    data=[],
+                                    columns=[],
+                                    style_table={'overflowX': 'auto'},
+                                    style_cell={
+                                        'textAlign': 'left',
+                                        'padding': '10px',
+                                        'fontSize': '14px',
+                                        'minWidth': 95, 'width': 95, 'maxWidth': 95
+                                    },
+                                    style_header={
+                                        'backgroundColor': 'rgb(230, 230, 230)',
+                                        'fontWeight': 'bold'
+                                    },
+                                    virtualization=True,
+                                    fixed_rows={'headers': True}
+                                ),
+                                id='backtest-summary-table-container',
+                                style={'display': 'none'}
+                            )
                         ])
                     ])
                 ], width=12)
@@ -447,10 +887,7 @@ class DashUI:
                                     dbc.Label("Strategy:"),
                                     dcc.Dropdown(
                                         id='backtest-strategy',
-                                        options=[
-                                            {'label': 'RSI Mean Reversion', 'value': 'rsi_meanrev'},
-                                            {'label': 'MA Crossover', 'value': 'ma_crossover'}
-                                        ],
+                                        options=list(STRATEGY_OPTIONS),
                                         value='rsi_meanrev',
                                         className="mb-2"
                                     ),
@@ -504,25 +941,34 @@ class DashUI:
         
         # Health check callback
         @self.app.callback(
-            Output('session-status-banner', 'children'),
+            [Output('session-status-banner', 'children'),
+             Output('session-health-key', 'data')],
             [Input('health-check-interval', 'n_intervals'),
-             Input('session-id-store', 'data')]
+             Input('session-id-store', 'data')],
+            State('session-health-key', 'data')
         )
-        def check_session_health(n_intervals, session_id):
+        def check_session_health(n_intervals, session_id, last_key):
             """
             Periodic health check of the session.
             
             Note: On initial load (n_intervals == 0), no alert is shown to avoid
             confusing users with error messages before the session is fully initialized.
+            The outcome is summarized as a key kept in the client's store; when a
+            check yields the same key as the banner already shows, nothing is sent.
             """
+            def render(key, banner):
+                if key == last_key:
+                    return dash.no_update, dash.no_update
+                return banner, key
+            
             if not session_id:
                 # No session - this is unusual, but can happen on first load
                 # Don't show error on initial load (n_intervals == 0)
                 if n_intervals == 0:
-                    return None
+                    return render(['pending'], None)
                 
                 # Show prominent "Start New Session" banner
-                return dbc.Alert([
+                return render(['missing'], dbc.Alert([
                     html.Div([
                         html.H5("🔔 Session Not Found", className="alert-heading mb-3"),
                         html.P([
@@ -543,7 +989,7 @@ class DashUI:
                         html.Span("Click to create a new session and continue", className="text-muted small")
                     ])
                 ], color="warning", dismissable=False, className="mb-4", 
-                   style={'border': '2px solid #ff9800', 'boxShadow': '0 4px 8px rgba(0,0,0,0.1)'})
+                   style={'border': '2px solid #ff9800', 'boxShadow': '0 4px 8px rgba(0,0,0,0.1)'}))
             
             # Check if session exists in manager
             try:
@@ -611,9 +1057,9 @@ class DashUI:
                        'boxShadow': '0 4px 8px rgba(0,0,0,0.1)'
                    })
                 
-                return banner
+                return render(['unhealthy', status_type, message, recovery], banner)
             
-            return None
+            return render(['healthy'], None)
         
         @self.app.callback(
             Output('session-id-store', 'data'),
@@ -643,7 +1089,21 @@ class DashUI:
             
             return dash.no_update
         
-        @self.app.callback(
+        # Show only the controls of the selected scan type (pure UI, so clientside)
+        self.app.clientside_callback(
+            """
+            function(scanType) {
+                var show = {'display': 'block'};
+                var hide = {'display': 'none'};
+                return [
+                    (scanType === 'rsi_oversold' || scanType === 'rsi_overbought') ? show : hide,
+                    (scanType === 'ma_cross_bull' || scanType === 'ma_cross_bear') ? show : hide,
+                    scanType === 'candlestick' ? show : hide,
+                    scanType === 'momentum_streak' ? show : hide,
+                    scanType === 'custom_indicator' ? show : hide
+                ];
+            }
+            """,
             [Output('rsi-controls', 'style'),
              Output('ma-controls', 'style'),
              Output('candlestick-controls', 'style'),
@@ -651,81 +1111,51 @@ class DashUI:
              Output('custom-indicator-controls', 'style')],
             Input('scan-type', 'value')
         )
-        def toggle_controls(scan_type):
-            """Show/hide controls based on scan type."""
-            show = {'display': 'block'}
-            hide = {'display': 'none'}
-            
-            # Default: hide all
-            rsi_style = hide
-            ma_style = hide
-            candlestick_style = hide
-            streak_style = hide
-            custom_style = hide
-            
-            # Show relevant controls
-            if scan_type in ['rsi_oversold', 'rsi_overbought']:
-                rsi_style = show
-            elif scan_type in ['ma_cross_bull', 'ma_cross_bear']:
-                ma_style = show
-            elif scan_type == 'candlestick':
-                candlestick_style = show
-            elif scan_type == 'momentum_streak':
-                streak_style = show
-            elif scan_type == 'custom_indicator':
-                custom_style = show
-            
-            return rsi_style, ma_style, candlestick_style, streak_style, custom_style
+        
+        # Debounce Refresh Status: repeated clicks re-read the store only once
+        self.app.clientside_callback(
+            DEBOUNCE_CLICKS_JS,
+            Output('debounced-refresh', 'data'),
+            Input('refresh-symbols-btn', 'n_clicks'),
+            State('refresh-symbols-btn', 'id'),
+            prevent_initial_call=True
+        )
         
         @self.app.callback(
             Output('custom-indicator', 'options'),
-            Input('refresh-symbols-btn', 'n_clicks')
+            Input('debounced-refresh', 'data')
         )
         def populate_indicator_dropdown(n_clicks):
             """Populate the indicator dropdown with available indicators."""
             try:
-                available_indicators = self.scanner.get_available_indicators()
+                if n_clicks:
+                    self._invalidate_cached('indicators')
+                available_indicators = self._indicators()
                 if not available_indicators:
                     return []
                 
-                # Create options with friendly labels
-                options = []
-                for indicator in available_indicators:
-                    # Create a friendly label
-                    label = indicator
-                    if indicator.startswith('RSI_'):
-                        label = f"RSI ({indicator.split('_')[1]} period)"
-                    elif indicator.startswith('SMA_'):
-                        label = f"SMA ({indicator.split('_')[1]} period)"
-                    elif indicator.startswith('EMA_'):
-                        label = f"EMA ({indicator.split('_')[1]} period)"
-                    elif indicator == 'consec_higher_high':
-                        label = "Consecutive Higher Highs"
-                    elif indicator == 'consec_lower_low':
-                        label = "Consecutive Lower Lows"
-                    elif indicator == 'days_since_prev_high':
-                        label = "Days Since Previous High"
-                    elif indicator == 'days_since_prev_low':
-                        label = "Days Since Previous Low"
-                    elif indicator == 'engulfing_bull':
-                        label = "Bullish Engulfing Pattern"
-                    elif indicator == 'engulfing_bear':
-                        label = "Bearish Engulfing Pattern"
-                    elif '_' in indicator:
-                        # Convert snake_case to Title Case
-                        label = indicator.replace('_', ' ').title()
-                    
-                    options.append({'label': label, 'value': indicator})
-                
-                return options
+                # Labels are rebuilt only when the indicator set changes
+                return _indicator_options(frozenset(available_indicators))
             except Exception as e:
                 print(f"Error populating indicators: {e}")
                 return []
         
+        # Debounce Run Scan: only the last click within 500ms reaches the server
+        self.app.clientside_callback(
+            DEBOUNCE_CLICKS_JS,
+            Output('debounced-clicks', 'data'),
+            Input('run-scan-btn', 'n_clicks'),
+            State('run-scan-btn', 'id'),
+            prevent_initial_call=True
+        )
+        
         @self.app.callback(
             [Output('scan-results-div', 'children'),
-             Output('scan-status', 'children')],
-            Input('run-scan-btn', 'n_clicks'),
+             Output('scan-results-table', 'columns'),
+             Output('scan-results-table', 'page_current'),
+             Output('scan-meta', 'data'),
+             Output('scan-query-store', 'data')],
+            Input('debounced-clicks', 'data'),
             [State('scan-type', 'value'),
              State('rsi-period', 'value'),
              State('rsi-threshold', 'value'),
@@ -736,112 +1166,71 @@ class DashUI:
              State('streak-threshold', 'value'),
              State('custom-indicator', 'value'),
              State('custom-operator', 'value'),
-             State('custom-threshold', 'value'),
-             State('session-id-store', 'data')]
+             State('custom-threshold', 'value')],
+            prevent_initial_call=True,
+            background=self._disk_cache is not None,
+            running=[(Output('run-scan-btn', 'disabled'), True, False)]
         )
         def run_scan(n_clicks, scan_type, rsi_period, rsi_threshold, fast_ma, slow_ma,
                      pattern_type, streak_type, streak_threshold, 
-                     custom_indicator, custom_operator, custom_threshold, session_id):
-            """Run the selected scan."""
-            if n_clicks is None:
-                return html.P("Configure scan and click 'Run Scan'"), ""
+                     custom_indicator, custom_operator, custom_threshold):
+            """
+            Run the selected scan.
             
-            # Update session activity
-            if session_id:
-                self.session_manager.update_session_activity(session_id)
+            May run as a background job in a forked process, so session
+            bookkeeping is left to record_scan_session in the server process.
+            """
+            def show_message(message, meta=None):
+                # Clear the table's page; the query store reset empties its rows
+                return message, [], 0, meta, None
+            
+            query = {
+                'scan_type': scan_type,
+                'rsi_period': rsi_period,
+                'rsi_threshold': rsi_threshold,
+                'fast_ma': fast_ma,
+                'slow_ma': slow_ma,
+                'pattern_type': pattern_type,
+                'streak_type': streak_type,
+                'streak_threshold': streak_threshold,
+                'custom_indicator': custom_indicator,
+                'custom_operator': custom_operator,
+                'custom_threshold': custom_threshold
+            }
             
             try:
-                # Get available symbols
-                symbols = self.indicator_engine.list_available_symbols()
-                
-                if not symbols:
-                    return html.P("No symbols with indicators found. Please run indicator computation first."), ""
-                
-                # Run appropriate scan
-                if scan_type == 'rsi_oversold':
-                    results = self.scanner.scan_rsi_oversold(symbols, rsi_period, rsi_threshold)
-                    status = f"Found {len(results)} oversold stocks (RSI < {rsi_threshold})"
-                
-                elif scan_type == 'rsi_overbought':
-                    results = self.scanner.scan_rsi_overbought(symbols, rsi_period, rsi_threshold)
-                    status = f"Found {len(results)} overbought stocks (RSI > {rsi_threshold})"
-                
-                elif scan_type == 'ma_cross_bull':
-                    results = self.scanner.scan_ma_crossover(symbols, fast_ma, slow_ma, 'bullish')
-                    status = f"Found {len(results)} bullish MA crossovers"
-                
-                elif scan_type == 'ma_cross_bear':
-                    results = self.scanner.scan_ma_crossover(symbols, fast_ma, slow_ma, 'bearish')
-                    status = f"Found {len(results)} bearish MA crossovers"
-                
-                elif scan_type == 'candlestick':
-                    # Scan for candlestick pattern (pattern value == 1 indicates pattern detected)
-                    PATTERN_PRESENT = 1
-                    results = self.scanner.scan_by_indicator(symbols, pattern_type, '==', PATTERN_PRESENT)
-                    pattern_name = pattern_type.replace('_', ' ').title()
-                    status = f"Found {len(results)} stocks with {pattern_name} pattern"
-                
-                elif scan_type == 'momentum_streak':
-                    # Scan for momentum streaks
-                    results = self.scanner.scan_by_indicator(symbols, streak_type, '>=', float(streak_threshold))
-                    streak_name = streak_type.replace('_', ' ').title()
-                    status = f"Found {len(results)} stocks with {streak_name} >= {streak_threshold} days"
-                
-                elif scan_type == 'custom_indicator':
-                    # Scan with custom indicator filter
-                    if custom_indicator is None:
-                        return html.P("Please select an indicator"), ""
-                    results = self.scanner.scan_by_indicator(
-                        symbols, custom_indicator, custom_operator, float(custom_threshold)
-                    )
-                    status = f"Found {len(results)} stocks where {custom_indicator} {custom_operator} {custom_threshold}"
-                
-                elif scan_type == 'top_performers':
-                    results = self.scanner.get_top_performers('rsi_meanrev', metric='sharpe_ratio', top_n=20)
-                    status = f"Top 20 performers by Sharpe ratio"
+                results = None
+                if scan_type in REUSABLE_SCAN_TYPES:
+                    results = self._get_cached_scan(query)
+                
+                if results is None:
+                    results, message = self._execute_scan(query)
+                    if results is None:
+                        return show_message(html.P(message))
+                    
+                    # Keep the full results server-side; the table pages through them on demand
+                    self._cache_scan_results(query, results)
                 
-                else:
-                    return html.P("Unknown scan type"), ""
+                # Status text is formatted in the browser from this metadata
+                n = len(results)
+                meta = self._scan_meta(query, n)
                 
                 # Display results
-                if results is None or len(results) == 0:
-                    return html.P("No results found"), status
+                if n == 0:
+                    return show_message(html.P("No results found"), meta)
                 
-                # Create table
-                table = dash_table.DataTable(
-                    data=results.to_dict('records'),
-                    columns=[{'name': col, 'id': col} for col in results.columns],
-                    style_table={'overflowX': 'auto'},
-                    style_cell={
-                        'textAlign': 'left',
-                        'padding': '10px',
-                        'fontSize': '14px'
-                    },
-                    style_header={
-                        'backgroundColor': 'rgb(230, 230, 230)',
-                        'fontWeight': 'bold'
-                    },
-                    style_data_conditional=[
-                        {
-                            'if': {'row_index': 'odd'},
-                            'backgroundColor': 'rgb(248, 248, 248)'
-                        }
-                    ],
-                    page_size=20
+                # The new query resets the table to page 0, which the page callback fills;
+                # the browser shows the table and sizes its pager from the metadata
+                return (
+                    None,
+                    _table_columns(tuple(results.columns)),
+                    0,
+                    meta,
+                    query
                 )
-                
-                return table, html.P(status, className="text-success")
             
             except Exception as e:
-                # Record error in session
-                if session_id:
-                    self.session_manager.record_session_error(
-                        session_id,
-                        f"Scanner error: {str(e)}"
-                    )
-                
                 # Format user-friendly error message
-                from error_handler import get_user_friendly_error
                 error_msg = get_user_friendly_error(e)
                 
                 error_display = dbc.Alert([
@@ -859,141 +1248,157 @@ class DashUI:
                     ], className="mb-0 small")
                 ], color="danger")
                 
-                return error_display, html.P("Scan failed", className="text-danger")
+                # The error is recorded in the session by record_scan_session
+                return show_message(error_display, {
+                    'status': "Scan failed",
+                    'ok': False,
+                    'error': f"Scanner error: {str(e)}"
+                })
+        
+        @self.app.callback(
+            Output('scan-session-sync', 'data'),
+            [Input('debounced-clicks', 'data'),
+             Input('scan-meta', 'data')],
+            State('session-id-store', 'data'),
+            prevent_initial_call=True
+        )
+        def record_scan_session(n_clicks, meta, session_id):
+            """Record scan activity and scan errors in the server's session manager."""
+            if session_id:
+                triggered = callback_context.triggered[0]['prop_id'] if callback_context.triggered else ''
+                if triggered.startswith('debounced-clicks'):
+                    self.session_manager.update_session_activity(session_id)
+                elif meta and meta.get('error'):
+                    self.session_manager.record_session_error(session_id, meta['error'])
+            return dash.no_update
         
         @self.app.callback(
-            Output('backtest-summary-div', 'children'),
-            Input('run-scan-btn', 'n_clicks')
+            Output('scan-results-table', 'data'),
+            [Input('scan-results-table', 'page_current'),
+             Input('scan-query-store', 'data')],
+            State('scan-results-table', 'page_size'),
+            prevent_initial_call=True
         )
-        def update_backtest_summary(n_clicks):
-            """Update backtest summary statistics."""
+        def page_scan_results(page_current, query, page_size):
+            """Return the rows of the requested scan results page."""
+            if not query:
+                return []
+            
             try:
-                summary = self.backtest_engine.load_summary()
-                
-                if summary is None or len(summary) == 0:
-                    return html.P("No backtest results available. Please run backtests first.")
-                
-                # Calculate aggregate statistics
-                avg_metrics = summary.groupby('strategy').agg({
-                    'cagr': 'mean',
-                    'sharpe_ratio': 'mean',
-                    'win_rate': 'mean',
-                    'max_drawdown': 'mean',
-                    'num_trades': 'mean'
-                }).round(4)
-                
-                # Create summary table
-                table = dash_table.DataTable(
-                    data=avg_metrics.reset_index().to_dict('records'),
-                    columns=[{'name': col, 'id': col} for col in avg_metrics.reset_index().columns],
-                    style_table={'overflowX': 'auto'},
-                    style_cell={
-                        'textAlign': 'left',
-                        'padding': '10px',
-                        'fontSize': '14px'
-                    },
-                    style_header={
-                        'backgroundColor': 'rgb(230, 230, 230)',
-                        'fontWeight': 'bold'
-                    }
-                )
-                
-                return [
-                    html.H5(f"Average Performance Across {len(summary)} Backtests", className="mb-3"),
-                    table
-                ]
+                results = self._get_cached_scan(query)
+                if results is None:
+                    # Evicted or cached by another worker process: re-run the scan once
+                    results, _ = self._execute_scan(query)
+                    if results is None:
+                        return []
+                    self._cache_scan_results(query, results)
+                
+                page_size = page_size or SCAN_PAGE_SIZE
+                start = (page_current or 0) * page_size
+                return _frame_records(results.iloc[start:start + page_size])
             
             except Exception as e:
-                return html.P(f"Error loading backtest summary: {str(e)}")
+                print(f"Error paging scan results: {e}")
+                return []
+        
+        # Status text is formatted in the browser from the scan metadata and
+        # the per-scan-type templates shipped once with the layout
+        self.app.clientside_callback(
+            """
+            function(meta, templates) {
+                if (!meta) {
+                    return ['', 'mt-2'];
+                }
+                if (meta.status !== undefined) {
+                    return [meta.status, meta.ok ? 'mt-2 text-success' : 'mt-2 text-danger'];
+                }
+                var values = Object.assign({n: meta.n}, meta.values);
+                var template = (templates || {})[meta.type] || '';
+                var text = template.replace(/\\{(\\w+)\\}/g, function(match, key) {
+                    return key in values ? values[key] : match;
+                });
+                return [text, 'mt-2 text-success'];
+            }
+            """,
+            [Output('scan-status', 'children'),
+             Output('scan-status', 'className')],
+            Input('scan-meta', 'data'),
+            State('scan-status-templates', 'data')
+        )
+        
+        self.app.clientside_callback(
+            """
+            function(meta, pageSize) {
+                if (!meta || !meta.n) {
+                    return [{'display': 'none'}, 0];
+                }
+                return [{'display': 'block'}, Math.ceil(meta.n / pageSize)];
+            }
+            """,
+            [Output('scan-results-table-container', 'style'),
+             Output('scan-results-table', 'page_count')],
+            Input('scan-meta', 'data'),
+            State('scan-results-table', 'page_size')
+        )
+        
+        self.app.clientside_callback(
+            """
+            function(summary) {
+                if (!summary) {
+                    return ['', [], [], {'display': 'none'}];
+                }
+                return [
+                    'Average Performance Across ' + summary.n + ' Backtests',
+                    summary.rows,
+                    summary.cols,
+                    {'display': 'block'}
+                ];
+            }
+            """,
+            [Output('backtest-summary-header', 'children'),
+             Output('backtest-summary-table', 'data'),
+             Output('backtest-summary-table', 'columns'),
+             Output('backtest-summary-table-container', 'style')],
+            Input('backtest-summary-data', 'data')
+        )
         
         @self.app.callback(
-            [Output('indicator-output', 'children'),
-             Output('indicator-status', 'children')],
-            Input('compute-indicators-btn', 'n_clicks'),
+            [Output('backtest-summary-div', 'children'),
+             Output('backtest-summary-data', 'data')],
+            [Input('main-tabs', 'active_tab'),
+             Input('refresh-summary-btn', 'n_clicks'),
+             Input('batch-results-store', 'data')],
             prevent_initial_call=True
         )
-        def compute_indicators(n_clicks):
-            """Compute indicators from price data."""
-            if n_clicks is None:
-                return "", ""
+        def update_backtest_summary(active_tab, n_clicks, batch_results):
+            """Update backtest summary statistics when the Scanner tab opens, on refresh or after a batch run."""
+            triggered = callback_context.triggered[0]['prop_id'] if callback_context.triggered else ''
+            if triggered.startswith('main-tabs') and active_tab != 'scanner-tab':
+                return dash.no_update, dash.no_update
             
             try:
-                from data_loader import DataLoader
-                import os
-                
-                # Determine data path - try common locations
-                data_path = None
-                for path in DEFAULT_DATA_PATHS:
-                    if os.path.exists(path):
-                        data_path = path
-                        break
-                
-                if data_path is None:
-                    return html.Div([
-                        html.P("❌ No price data directory found.", className="text-danger mb-1"),
-                        html.P("Expected directories: data/prices/ or data/stock_data/", 
-                               className="text-muted small")
-                    ]), html.Span("❌ Failed", className="badge bg-danger")
-                
-                # Load data
-                loader = DataLoader(data_path)
-                symbols = loader.list_available_symbols()
-                
-                if not symbols:
-                    return html.Div([
-                        html.P("❌ No Parquet files found in data directory.", className="text-danger mb-1"),
-                        html.P(f"Location: {data_path}", className="text-muted small")
-                    ]), html.Span("❌ Failed", className="badge bg-danger")
-                
-                # Show progress
-                output_msg = html.Div([
-                    html.P(f"⏳ Processing {len(symbols)} symbols from {data_path}...", 
-                           className="mb-1"),
-                    html.P("This may take a minute. Please wait...", 
-                           className="text-muted small")
-                ])
-                
-                # Load data
-                data_dict = loader.load_multiple_symbols(symbols)
-                
-                if not data_dict:
-                    return html.Div([
-                        html.P("❌ Failed to load any symbols.", className="text-danger mb-1"),
-                        html.P("Check that Parquet files have correct OHLCV columns.", 
-                               className="text-muted small")
-                    ]), html.Span("❌ Failed", className="badge bg-danger")
-                
-                # Compute indicators
-                # Compute multiple RSI periods to support user selection in UI
-                self.indicator_engine.process_multiple_symbols(
-                    data_dict,
-                    sma_periods=[20, 50, 200],
-                    rsi_periods=[7, 14, 21, 28],
-                    show_progress=False  # Disable progress bar in UI
-                )
-                
-                # Verify results
-                available = self.indicator_engine.list_available_symbols()
+                # Reuse the aggregated rows while the store has not been written to
+                version = self._summary_version()
+                if (self._summary_cache is not None and version is not None
+                        and self._summary_cache[0] == version):
+                    num_backtests, data, columns = self._summary_cache[1]
+                else:
+                    # The store averages per strategy on its encoded metadata
+                    averages = self.backtest_engine.store.get_strategy_averages(SUMMARY_METRICS)
+                    
+                    if len(averages) == 0:
+                        return html.P("No backtest results available. Please run backtests first."), None
+                    
+                    num_backtests = int(averages.pop('count').sum())
+                    averages = averages.round(DISPLAY_DECIMALS)
+                    data = _frame_records(averages)
+                    columns = _table_columns(tuple(averages.columns))
+                    self._summary_cache = (version, (num_backtests, data, columns))
                 
-                return html.Div([
-                    html.P("✅ Indicators computed successfully!", className="text-success mb-1"),
-                    html.P([
-                        f"{len(available)} symbols now available. ",
-                        html.Strong("Click 'Run Scan' to use them.")
-                    ], className="small")
-                ]), html.Span(f"✅ {len(available)} symbols", className="badge bg-success")
+                return None, {'n': num_backtests, 'rows': data, 'cols': columns}
             
             except Exception as e:
-                import traceback
-                error_details = traceback.format_exc()
-                return html.Div([
-                    html.P(f"❌ Error: {str(e)}", className="text-danger mb-1"),
-                    html.Details([
-                        html.Summary("Show details", className="small text-muted"),
-                        html.Pre(error_details, className="small bg-light p-2")
-                    ])
-                ]), html.Span("❌ Error", className="badge bg-danger")
-        
+                return html.P(f"Error loading backtest summary: {str(e)}"), None
         
         # New callbacks for Indicators page
         @self.app.callback(
@@ -1004,15 +1409,16 @@ class DashUI:
              Output('available-indicators-list', 'children')],
             [Input('health-check-interval', 'n_intervals'),
              Input('compute-indicators-btn', 'n_clicks'),
-             Input('refresh-symbols-btn', 'n_clicks')]
+             Input('debounced-refresh', 'data')]
         )
         def update_indicator_summary(n_intervals, compute_clicks, refresh_clicks):
             """Update the indicator summary panel with current status."""
-            from datetime import datetime
-            
             try:
+                triggered = callback_context.triggered[0]['prop_id'] if callback_context.triggered else ''
+                if not triggered.startswith('health-check-interval'):
+                    self._invalidate_cached('symbols')
                 metadata = self.indicator_engine.get_metadata()
-                symbols = self.indicator_engine.list_available_symbols()
+                symbols = self._symbols()
                 symbols_count = len(symbols)
                 
                 # Format last computation date
@@ -1100,28 +1506,25 @@ class DashUI:
                 return "Error", "0", "❌ Error", "mb-0 text-danger", html.P(f"Error: {str(e)}", className="text-danger")
         
         @self.app.callback(
-            [Output('indicator-output', 'children'),
-             Output('indicator-computation-alert', 'children'),
-             Output('indicator-computation-alert', 'color'),
-             Output('indicator-computation-alert', 'is_open')],
-            Input('compute-indicators-btn', 'n_clicks'),
-            prevent_initial_call=True
+            Output('data-path-status', 'children'),
+            Input('rescan-paths-btn', 'n_clicks')
         )
-        def compute_indicators(n_clicks):
-            """Compute indicators from price data."""
+        def rescan_data_paths(n_clicks):
+            """Show the price data directory, probing DEFAULT_DATA_PATHS again on click."""
+            if n_clicks:
+                self._data_path = _find_data_path()
+            
+            if self._data_path is None:
+                return f"No price data directory found (checked {', '.join(DEFAULT_DATA_PATHS)})"
+            return f"Price data: {self._data_path}"
+        
+        def compute_indicators(set_progress, n_clicks):
+            """Compute indicators from price data, reporting stages via set_progress if given."""
             if n_clicks is None:
                 return "", "", "info", False
             
             try:
-                from data_loader import DataLoader
-                import os
-                
-                # Determine data path - try common locations
-                data_path = None
-                for path in DEFAULT_DATA_PATHS:
-                    if os.path.exists(path):
-                        data_path = path
-                        break
+                data_path = self._data_path
                 
                 if data_path is None:
                     return (
@@ -1157,6 +1560,8 @@ class DashUI:
                     html.P("Computing indicators: SMA, RSI, EMA, candlestick patterns, momentum streaks...", 
                            className="text-muted small")
                 ])
+                if set_progress is not None:
+                    set_progress(output_msg)
                 
                 # Load data
                 data_dict = loader.load_multiple_symbols(symbols)
@@ -1173,16 +1578,31 @@ class DashUI:
                         True
                     )
                 
-                # Compute indicators
+                # Report per-symbol progress in about 50 steps
+                report_progress = None
+                if set_progress is not None:
+                    step = max(1, len(data_dict) // 50)
+                    
+                    def report_progress(done, total):
+                        if done % step == 0 or done == total:
+                            set_progress(html.P(f"⏳ Computed indicators for {done}/{total} symbols...",
+                                                className="mb-1 text-info"))
+                
+                # Compute indicators on all CPUs; the store is still written serially
                 self.indicator_engine.process_multiple_symbols(
                     data_dict,
                     sma_periods=[20, 50, 200],
                     rsi_periods=[7, 14, 21, 28],
-                    show_progress=False  # Disable progress bar in UI
+                    show_progress=False,  # Disable progress bar in UI
+                    max_workers=None,
+                    progress_callback=report_progress,
+                    skip_unchanged=True
                 )
                 
                 # Verify results
-                available = self.indicator_engine.list_available_symbols()
+                self._invalidate_cached('symbols')
+                self._invalidate_cached('indicators')
+                available = self._symbols()
                 
                 return (
                     html.Div([
@@ -1210,7 +1630,6 @@ class DashUI:
                 )
             
             except Exception as e:
-                import traceback
                 error_details = traceback.format_exc()
                 return (
                     html.Div([
@@ -1225,6 +1644,31 @@ class DashUI:
                     True
                 )
         
+        compute_outputs = [Output('indicator-output', 'children'),
+                           Output('indicator-computation-alert', 'children'),
+                           Output('indicator-computation-alert', 'color'),
+                           Output('indicator-computation-alert', 'is_open')]
+        compute_running = [(Output('compute-indicators-btn', 'disabled'), True, False)]
+        if self._disk_cache is not None:
+            # Computing takes minutes on a full universe: run it in a worker
+            # process so other callbacks keep being served meanwhile
+            self.app.callback(
+                compute_outputs,
+                Input('compute-indicators-btn', 'n_clicks'),
+                prevent_initial_call=True,
+                background=True,
+                running=compute_running,
+                progress=Output('indicator-progress', 'children'),
+                progress_default=""
+            )(compute_indicators)
+        else:
+            self.app.callback(
+                compute_outputs,
+                Input('compute-indicators-btn', 'n_clicks'),
+                prevent_initial_call=True,
+                running=compute_running
+            )(lambda n_clicks: compute_indicators(None, n_clicks))
+        
         @self.app.callback(
             [Output('backtest-details-div', 'children'),
              Output('backtest-status', 'children')],
@@ -1240,7 +1684,6 @@ class DashUI:
             
             try:
                 # Parse parameters
-                import json
                 if params_json:
                     try:
                         params = json.loads(params_json)
@@ -1314,9 +1757,9 @@ class DashUI:
                     ], width=4)
                 ])
                 
-                # Create equity curve chart
+                # Create equity curve chart (WebGL: one point per trading day)
                 equity_chart = go.Figure()
-                equity_chart.add_trace(go.Scatter(
+                equity_chart.add_trace(go.Scattergl(
                     y=result['equity'],
                     mode='lines',
                     name='Equity',
@@ -1346,22 +1789,277 @@ class DashUI:
                 return details, status
                 
             except Exception as e:
-                import traceback
                 error_msg = html.Div([
                     html.P(f"Error running backtest: {str(e)}", className="text-danger"),
                     html.Pre(traceback.format_exc(), style={'fontSize': '0.8em'})
                 ])
                 return error_msg, html.Div(f"✗ Error: {str(e)}", className="text-danger")
     
-    def run(self, host: str = '0.0.0.0', port: int = 8050, debug: bool = False):
+    def _execute_scan(self, query: dict) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """
+        Run the scan described by the scanner control values.
+        
+        Args:
+            query: Scanner control values keyed by parameter name
+            
+        Returns:
+            Tuple of (results, message). Results is None when the scan could not
+            run, in which case message holds the text to show instead.
+        """
+        scan_type = query['scan_type']
+        if scan_type not in SCAN_DISPATCH:
+            return None, "Unknown scan type"
+        if scan_type == 'custom_indicator' and query['custom_indicator'] is None:
+            return None, "Please select an indicator"
+        
+        # Get available symbols
+        symbols = self._symbols()
+        
+        if not symbols:
+            return None, "No symbols with indicators found. Please run indicator computation first."
+        
+        # Run appropriate scan
+        method, build_kwargs, _ = SCAN_DISPATCH[scan_type]
+        kwargs = build_kwargs(symbols, query)
+        if method in PARALLEL_SCAN_METHODS and len(symbols) >= PARALLEL_SCAN_MIN_SYMBOLS:
+            results = self._parallel_scan(method, kwargs)
+        else:
+            results = getattr(self.scanner, method)(**kwargs)
+        
+        # Round once here so cached results serialize compactly on every page
+        return _narrow_columns(results), None
+    
+    def _parallel_scan(self, method: str, kwargs: dict, num_workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Run a read-only Scanner method over symbol shards in worker processes.
+        
+        Shards are contiguous slices of the symbol list, so concatenating them
+        keeps the serial result order; scan_by_indicator results are re-sorted
+        because each shard sorts only its own rows.
+        
+        Args:
+            method: Scanner method name (one of PARALLEL_SCAN_METHODS)
+            kwargs: Keyword arguments for the method, including symbols
+            num_workers: Worker processes to use (None for all CPUs)
+            
+        Returns:
+            Merged scan results
+        """
+        symbols = kwargs['symbols']
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = min(num_workers, len(symbols))
+        
+        if num_workers <= 1:
+            return getattr(self.scanner, method)(**kwargs)
+        
+        size = math.ceil(len(symbols) / num_workers)
+        shards = [dict(kwargs, symbols=symbols[i:i + size]) for i in range(0, len(symbols), size)]
+        
+        context = mp.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+            parts = list(executor.map(
+                scan_shard, repeat(self._indicator_path), repeat(self._backtest_path),
+                repeat(method), shards, repeat(self._disk_cache)
+            ))
+        
+        parts = [part for part in parts if len(part) > 0]
+        if not parts:
+            return pd.DataFrame()
+        
+        results = pd.concat(parts, ignore_index=True)
+        indicator = kwargs.get('indicator')
+        if method == 'scan_by_indicator' and indicator in results.columns:
+            results = results.sort_values(indicator)
+        
+        return results
+    
+    @staticmethod
+    def _scan_meta(query: dict, n: int) -> dict:
+        """
+        Build the metadata the browser formats the scan status text from.
+        
+        Args:
+            query: Scanner control values keyed by parameter name
+            n: Number of results
+            
+        Returns:
+            Dict with the result count, scan type and template values
+        """
+        values = dict(
+            query,
+            pattern_name=(query['pattern_type'] or '').replace('_', ' ').title(),
+            streak_name=(query['streak_type'] or '').replace('_', ' ').title()
+        )
+        return {'n': n, 'type': query['scan_type'], 'values': values}
+    
+    def _cached(self, name: str, loader, ttl: float = CACHE_TTL_SECONDS):
+        """
+        Return a value loaded at most once per ``ttl`` seconds.
+        
+        Args:
+            name: Cache entry name
+            loader: Zero-argument callable producing the value
+            ttl: Seconds before the value is loaded again
+            
+        Returns:
+            Cached or freshly loaded value
+        """
+        now = time.monotonic()
+        entry = self._ttl_cache.get(name)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        value = loader()
+        self._ttl_cache[name] = (now + ttl, value)
+        return value
+    
+    def _invalidate_cached(self, name: str):
+        """Drop a cached value so the next read goes to disk."""
+        self._ttl_cache.pop(name, None)
+    
+    def _check_indicator_version(self):
+        """
+        Drop the cached symbol and indicator lists if indicators.h5 was rewritten.
+        
+        Background jobs compute indicators in another process, so their cache
+        invalidations never reach this one; the file's mtime does.
+        """
+        try:
+            version = os.stat(self.indicator_engine.hdf5_path).st_mtime_ns
+        except OSError:
+            version = None
+        
+        if version != self._indicator_version:
+            self._invalidate_cached('symbols')
+            self._invalidate_cached('indicators')
+            self._indicator_version = version
+    
+    def _symbols(self) -> list:
+        """Symbols with computed indicators, cached until indicators.h5 changes."""
+        self._check_indicator_version()
+        return self._cached('symbols', self.indicator_engine.list_available_symbols,
+                            ttl=math.inf)
+    
+    def _indicators(self) -> list:
+        """Indicator names in the store, cached until indicators.h5 changes."""
+        self._check_indicator_version()
+        return self._cached('indicators', self.scanner.get_available_indicators,
+                            ttl=math.inf)
+    
+    def _summary_version(self) -> Optional[int]:
+        """
+        Modification time of the backtest store's metadata array.
+        
+        Every stored or deleted backtest rewrites a file in this directory,
+        so an unchanged mtime means the summary is unchanged.
+        
+        Returns:
+            mtime in nanoseconds, or None if the store cannot be stat'ed
+        """
+        try:
+            return os.stat(self.backtest_engine.store.store_path / 'metadata').st_mtime_ns
+        except (AttributeError, OSError):
+            return None
+    
+    def _scan_cache_key(self, query: dict) -> str:
+        """
+        Hash scan query values into a short, process-stable cache key.
+        
+        The indicator and backtest store versions are part of the key, so
+        results computed before indicators.h5 was rewritten, or before a
+        backtest run changed the stats merged into them, are never served again.
+        """
+        self._check_indicator_version()
+        encoded = orjson.dumps([query, self._indicator_version, self._summary_version()],
+                               option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def _get_cached_scan(self, query: dict) -> Optional[pd.DataFrame]:
+        """
+        Look up full results kept by _cache_scan_results.
+        
+        Args:
+            query: Scanner control values the results were produced with
+            
+        Returns:
+            Results DataFrame, or None if not cached
+        """
+        key = self._scan_cache_key(query)
+        if self._disk_cache is not None:
+            return self._disk_cache.get(f"scan:{key}")
+        return self._scan_cache.get(key)
+    
+    def _cache_scan_results(self, query: dict, results: pd.DataFrame):
+        """
+        Keep full scan results for paging.
+        
+        Results go to the disk cache when background callbacks are enabled,
+        since the scan then runs in another process; otherwise they are held
+        in memory, evicting the least recently used scan.
+        
+        Args:
+            query: Scanner control values the results were produced with
+            results: Full scan results DataFrame
+        """
+        key = self._scan_cache_key(query)
+        if self._disk_cache is not None:
+            self._disk_cache.set(f"scan:{key}", results, expire=SCAN_RESULTS_EXPIRE_SECONDS)
+            return
+        
+        with self._scan_cache_lock:
+            self._scan_cache[key] = results
+            self._scan_cache.move_to_end(key)
+            while len(self._scan_cache) > SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+    
+    def run(
+        self,
+        host: str = '0.0.0.0',
+        port: int = 8050,
+        debug: bool = False,
+        workers: int = 4,
+        threads: int = 2
+    ):
         """
         Run the Dash server.
         
+        Without debug, serves through gunicorn worker processes when gunicorn
+        is installed; otherwise (or with debug) uses the Flask dev server.
+        
         Args:
             host: Host address
             port: Port number
-            debug: Debug mode
+            debug: Debug mode (dev server with reloader and dev tools)
+            workers: Gunicorn worker processes
+            threads: Threads per gunicorn worker
         """
+        if not debug:
+            try:
+                from gunicorn.app.base import BaseApplication
+            except ImportError:
+                BaseApplication = None
+            
+            if BaseApplication is not None:
+                server = self.app.server
+                options = {
+                    'bind': f'{host}:{port}',
+                    'workers': workers,
+                    'threads': threads,
+                    'timeout': 120
+                }
+                
+                class DashGunicornApp(BaseApplication):
+                    def load_config(self):
+                        for key, value in options.items():
+                            self.cfg.set(key, value)
+                    
+                    def load(self):
+                        return server
+                
+                DashGunicornApp().run()
+                return
+        
         self.app.run(host=host, port=port, debug=debug)
 
 
@@ -1381,6 +2079,6 @@ def create_app(indicator_path: str = "./data/indicators",
 
 
 if __name__ == '__main__':
-    # For running standalone
+    # For running standalone; set DEBUG=true for the dev server with hot reload
     ui = create_app()
-    ui.run(debug=True)
+    ui.run(debug=os.environ.get('DEBUG', 'False').lower() == 'true')
@@ -6,12 +6,34 @@ Optimized for Google Drive storage with symbol-wise file organization.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 import pandas as pd
 import pyarrow.parquet as pq
 
 
+# Columns read from each file (matched case-insensitively); anything else,
+# such as a per-row symbol string, is never decoded
+PRICE_COLUMNS = ('Date', 'Open', 'High', 'Low', 'Close', 'Volume')
+
+
+@dataclass
+class LoadConfig:
+    """
+    Read settings for DataLoader.
+    
+    Attributes:
+        max_workers: Threads reading symbol files concurrently (1 reads sequentially)
+        use_threads: Let Arrow decode each file's columns in parallel
+        buffer_size: Read buffer per Parquet file in bytes (0 for unbuffered reads)
+    """
+    max_workers: int = 8
+    use_threads: bool = True
+    buffer_size: int = 1 << 20
+
+
 class DataLoader:
     """
     Loads OHLCV price data from Parquet files.
@@ -22,14 +44,16 @@ class DataLoader:
     - Returns pandas DataFrames with DatetimeIndex
     """
     
-    def __init__(self, data_path: str = "./data/stock_data"):
+    def __init__(self, data_path: str = "./data/stock_data", config: Optional[LoadConfig] = None):
         """
         Initialize DataLoader with path to Parquet files.
         
         Args:
             data_path: Root directory containing symbol-wise Parquet files
+            config: Read settings (defaults to LoadConfig())
         """
         self.data_path = Path(data_path)
+        self.config = config or LoadConfig()
         self.cache: Dict[str, pd.DataFrame] = {}
     
     def load_symbol(self, symbol: str, use_cache: bool = True) -> Optional[pd.DataFrame]:
@@ -53,7 +77,15 @@ class DataLoader:
             return None
         
         try:
-            df = pd.read_parquet(file_path)
+            parquet_file = pq.ParquetFile(file_path, buffer_size=self.config.buffer_size)
+            columns = [name for name in parquet_file.schema_arrow.names
+                       if name.title() in PRICE_COLUMNS]
+            table = parquet_file.read(
+                columns=columns, use_threads=self.config.use_threads, use_pandas_metadata=True
+            )
+            # Release Arrow buffers column by column as pandas takes them over
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
             
             # Normalize column names to title case for consistency
             df.columns = df.columns.str.title()
@@ -69,7 +101,7 @@ class DataLoader:
             df = df.sort_index()
             
             # Validate required columns
-            required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+            required_cols = list(PRICE_COLUMNS[1:])
             missing = [col for col in required_cols if col not in df.columns]
             if missing:
                 print(f"Warning: Missing columns for {symbol}: {missing}")
@@ -88,16 +120,27 @@ class DataLoader:
         """
         Load OHLCV data for multiple symbols.
         
+        Files are read on up to ``config.max_workers`` threads; Arrow releases
+        the GIL while reading and decoding, so disk latency overlaps across files.
+        
         Args:
             symbols: List of stock symbols
             use_cache: Whether to use cached data
             
         Returns:
-            Dictionary mapping symbol to DataFrame
+            Dictionary mapping symbol to DataFrame, in the order of ``symbols``
         """
+        max_workers = min(self.config.max_workers, len(symbols))
+        if max_workers <= 1:
+            frames = [self.load_symbol(symbol, use_cache=use_cache) for symbol in symbols]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                frames = list(executor.map(
+                    lambda symbol: self.load_symbol(symbol, use_cache=use_cache), symbols
+                ))
+        
         result = {}
-        for symbol in symbols:
-            df = self.load_symbol(symbol, use_cache=use_cache)
+        for symbol, df in zip(symbols, frames):
             if df is not None:
                 result[symbol] = df
         return result
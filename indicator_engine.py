@@ -7,8 +7,11 @@ Configurable periods and parameters with efficient computation.
 
 import os
 import json
+import hashlib
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 import tables as tb
@@ -16,6 +19,15 @@ from tqdm import tqdm
 from candlestick_patterns import compute_all_patterns
 
 
+# Compression for per-symbol indicator frames in indicators.h5
+HDF5_COMPLIB = 'blosc:lz4'
+HDF5_COMPLEVEL = 3
+
+# Lifetime of tail frames kept in a shared cache; entries are keyed by the
+# indicators.h5 mtime, so this only bounds how long stale entries use disk
+SHARED_TAIL_EXPIRE_SECONDS = 3600
+
+
 class IndicatorEngine:
     """
     Computes and stores technical indicators.
@@ -27,17 +39,33 @@ class IndicatorEngine:
     - Supports batch processing across multiple symbols
     """
     
-    def __init__(self, output_path: str = "./data/indicators"):
+    def __init__(self, output_path: str = "./data/indicators", shared_cache=None):
         """
         Initialize IndicatorEngine.
         
         Args:
             output_path: Directory to store indicator outputs
+            shared_cache: diskcache.Cache shared between processes (optional);
+                scan tails are kept there as well as in memory
         """
         self.output_path = Path(output_path)
         self.output_path.mkdir(parents=True, exist_ok=True)
         self.hdf5_path = self.output_path / "indicators.h5"
         self.config_path = self.output_path / "config.json"
+        
+        # Trailing rows served to scans, per tail length, and the
+        # indicators.h5 mtime they were read at
+        self._tail_cache: Dict[int, Dict[str, Optional[pd.DataFrame]]] = {}
+        self._tail_cache_mtime: Optional[int] = None
+        self._shared_cache = shared_cache
+    
+    def __getstate__(self):
+        # Worker processes only compute; don't ship the cached tails to them
+        state = self.__dict__.copy()
+        state['_tail_cache'] = {}
+        state['_tail_cache_mtime'] = None
+        state['_shared_cache'] = None
+        return state
     
     @staticmethod
     def compute_sma(prices: pd.Series, period: int) -> pd.Series:
@@ -157,7 +185,7 @@ class IndicatorEngine:
             Series with days since previous high
         """
         high_prices = df['High'].copy()
-        result = pd.Series(0, index=df.index, dtype=int)
+        result = pd.Series(0, index=df.index, dtype=np.int32)
         
         # Use expanding window for initial period, then rolling for lookback period
         lookback_days = lookback_years * 252  # Approximate trading days per year
@@ -201,7 +229,7 @@ class IndicatorEngine:
             Series with days since previous low
         """
         low_prices = df['Low'].copy()
-        result = pd.Series(0, index=df.index, dtype=int)
+        result = pd.Series(0, index=df.index, dtype=np.int32)
         
         # Use expanding window for initial period, then rolling for lookback period
         lookback_days = lookback_years * 252  # Approximate trading days per year
@@ -243,7 +271,7 @@ class IndicatorEngine:
             Series with consecutive higher high count
         """
         high_prices = df['High']
-        result = pd.Series(0, index=df.index, dtype=int)
+        result = pd.Series(0, index=df.index, dtype=np.int32)
         
         streak = 0
         for i in range(1, len(high_prices)):
@@ -270,7 +298,7 @@ class IndicatorEngine:
             Series with consecutive lower low count
         """
         low_prices = df['Low']
-        result = pd.Series(0, index=df.index, dtype=int)
+        result = pd.Series(0, index=df.index, dtype=np.int32)
         
         streak = 0
         for i in range(1, len(low_prices)):
@@ -306,6 +334,7 @@ class IndicatorEngine:
             
         Returns:
             DataFrame with original data + computed indicators
+            (float32 prices give float32 SMA/RSI/EMA columns)
         """
         # Start with original data
         result = data.copy()
@@ -313,15 +342,29 @@ class IndicatorEngine:
         # Collect all new columns in a dictionary for efficient concatenation
         new_columns = {}
         
+        # rolling/ewm always return float64, so cast back to the price precision
+        value_dtype = np.float32 if data['Close'].dtype == np.float32 else np.float64
+        
+        # Periods longer than the history can never produce a value; emit
+        # all-NaN columns for them instead of running the full computation
+        n_rows = len(data)
+        all_nan = np.full(n_rows, np.nan, dtype=value_dtype)
+        
         # Compute SMAs
         for period in sma_periods:
             col_name = f"SMA_{period}"
-            new_columns[col_name] = self.compute_sma(data['Close'], period)
+            if period > n_rows:
+                new_columns[col_name] = pd.Series(all_nan, index=data.index)
+            else:
+                new_columns[col_name] = self.compute_sma(data['Close'], period).astype(value_dtype)
         
-        # Compute RSIs
+        # Compute RSIs (the first value needs period + 1 rows)
         for period in rsi_periods:
             col_name = f"RSI_{period}"
-            new_columns[col_name] = self.compute_rsi(data['Close'], period)
+            if period >= n_rows:
+                new_columns[col_name] = pd.Series(all_nan, index=data.index)
+            else:
+                new_columns[col_name] = self.compute_rsi(data['Close'], period).astype(value_dtype)
         
         # Compute EMAs (2-200, then 250, 300, ..., 1000)
         if ema_periods is None:
@@ -329,12 +372,13 @@ class IndicatorEngine:
         
         for period in ema_periods:
             col_name = f"EMA_{period}"
-            new_columns[col_name] = self.compute_ema(data['Close'], period)
+            if period > n_rows:
+                new_columns[col_name] = pd.Series(all_nan, index=data.index)
+            else:
+                new_columns[col_name] = self.compute_ema(data['Close'], period).astype(value_dtype)
         
-        # Compute candlestick patterns
-        if include_candlestick_patterns:
-            patterns = compute_all_patterns(data)
-            new_columns.update(patterns)
+        # Compute candlestick patterns (already a single int8 block)
+        patterns = compute_all_patterns(data) if include_candlestick_patterns else None
         
         # Compute streak indicators
         if include_streak_indicators:
@@ -347,9 +391,13 @@ class IndicatorEngine:
             new_columns['days_since_prev_low'] = self.compute_days_since_prev_low(data)
         
         # Concatenate all new columns at once to avoid fragmentation
+        frames = [result]
         if new_columns:
-            new_df = pd.DataFrame(new_columns, index=data.index)
-            result = pd.concat([result, new_df], axis=1)
+            frames.append(pd.DataFrame(new_columns, index=data.index))
+        if patterns is not None:
+            frames.append(patterns)
+        if len(frames) > 1:
+            result = pd.concat(frames, axis=1)
         
         return result
     
@@ -388,9 +436,51 @@ class IndicatorEngine:
             include_high_low_days
         )
         
+        self._store_indicators(
+            symbol,
+            indicators_df,
+            sma_periods,
+            rsi_periods,
+            ema_periods,
+            include_candlestick_patterns,
+            include_streak_indicators,
+            include_high_low_days
+        )
+    
+    def _store_indicators(
+        self,
+        symbol: str,
+        indicators_df: pd.DataFrame,
+        sma_periods: List[int],
+        rsi_periods: List[int],
+        ema_periods: Optional[List[int]],
+        include_candlestick_patterns: bool,
+        include_streak_indicators: bool,
+        include_high_low_days: bool,
+        store: Optional[pd.HDFStore] = None,
+        source_hash: Optional[str] = None
+    ):
+        """
+        Write computed indicators to HDF5 and record them in the config.
+        
+        Args:
+            symbol: Stock symbol
+            indicators_df: Output of compute_indicators
+            sma_periods: SMA periods used
+            rsi_periods: RSI periods used
+            ema_periods: EMA periods used
+            include_candlestick_patterns: Whether candlestick patterns were computed
+            include_streak_indicators: Whether streak indicators were computed
+            include_high_low_days: Whether days since prev high/low were computed
+            store: Already open HDFStore to write into (opened here if None)
+            source_hash: Fingerprint of the price frame the indicators came from (optional)
+        """
         # Store to HDF5
-        with pd.HDFStore(self.hdf5_path, mode='a', complevel=9, complib='zlib') as store:
-            store.put(f"/{symbol}", indicators_df, format='table')
+        if store is None:
+            with self._open_store() as store:
+                self._put_indicators(store, symbol, indicators_df)
+        else:
+            self._put_indicators(store, symbol, indicators_df)
         
         # Update config
         self._update_config(
@@ -400,7 +490,37 @@ class IndicatorEngine:
             ema_periods,
             include_candlestick_patterns,
             include_streak_indicators,
-            include_high_low_days
+            include_high_low_days,
+            source_hash=source_hash
+        )
+    
+    @staticmethod
+    def _put_indicators(store: pd.HDFStore, symbol: str, indicators_df: pd.DataFrame):
+        """
+        Write one symbol's indicator frame as a single fixed-format block.
+        
+        Args:
+            store: Open HDFStore
+            symbol: Stock symbol
+            indicators_df: Indicator DataFrame to write
+        """
+        store.put(f"/{symbol}", indicators_df, format='fixed')
+    
+    def _open_store(self) -> pd.HDFStore:
+        """
+        Open indicators.h5 for writing with the shared compression settings.
+        
+        Fixed-format nodes take their compression from the store filters,
+        not from individual put() calls.
+        
+        Returns:
+            HDFStore in append mode
+        """
+        return pd.HDFStore(
+            self.hdf5_path,
+            mode='a',
+            complib=HDF5_COMPLIB,
+            complevel=HDF5_COMPLEVEL
         )
     
     def process_multiple_symbols(
@@ -412,11 +532,23 @@ class IndicatorEngine:
         include_candlestick_patterns: bool = True,
         include_streak_indicators: bool = True,
         include_high_low_days: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_workers: Optional[int] = 1,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        skip_unchanged: bool = False
     ):
         """
         Process indicators for multiple symbols.
         
+        Symbols are independent, so with ``max_workers`` > 1 their indicators
+        are computed in a process pool. HDF5 and config writes always happen
+        serially in the calling process, through one HDFStore handle that
+        stays open for the whole batch.
+        
+        Each symbol's config entry records a fingerprint of its price frame;
+        with ``skip_unchanged``, symbols whose frame and parameters match
+        their stored entry are not recomputed or rewritten.
+        
         Args:
             data_dict: Dictionary mapping symbol to OHLCV DataFrame
             sma_periods: SMA periods to compute
@@ -426,24 +558,71 @@ class IndicatorEngine:
             include_streak_indicators: Whether to compute consecutive higher/lower streaks
             include_high_low_days: Whether to compute days since prev high/low
             show_progress: Whether to show progress bar
+            max_workers: Worker processes to use (None for all CPUs, 1 to run inline)
+            progress_callback: Called as (done, total) after each symbol is
+                processed, in the calling process (optional)
+            skip_unchanged: Skip symbols whose stored indicators are up to date
         """
         symbols = list(data_dict.keys())
-        iterator = tqdm(symbols, desc="Computing indicators") if show_progress else symbols
-        
-        for symbol in iterator:
-            try:
-                self.process_and_store(
-                    symbol, 
-                    data_dict[symbol], 
-                    sma_periods, 
-                    rsi_periods,
-                    ema_periods,
-                    include_candlestick_patterns,
-                    include_streak_indicators,
-                    include_high_low_days
-                )
-            except Exception as e:
-                print(f"Error processing {symbol}: {e}")
+        indicator_args = (
+            sma_periods,
+            rsi_periods,
+            ema_periods,
+            include_candlestick_patterns,
+            include_streak_indicators,
+            include_high_low_days
+        )
+        source_hashes = {symbol: self._frame_fingerprint(data_dict[symbol]) for symbol in symbols}
+        
+        if skip_unchanged:
+            symbols = self._changed_symbols(source_hashes, indicator_args)
+            skipped = len(source_hashes) - len(symbols)
+            if show_progress and skipped:
+                print(f"Skipping {skipped} symbols with up-to-date indicators")
+            if not symbols:
+                return
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(symbols))
+        
+        if max_workers <= 1:
+            iterator = tqdm(symbols, desc="Computing indicators") if show_progress else symbols
+            
+            with self._open_store() as store:
+                for done, symbol in enumerate(iterator, 1):
+                    try:
+                        indicators_df = self.compute_indicators(data_dict[symbol], *indicator_args)
+                        self._store_indicators(symbol, indicators_df, *indicator_args, store=store,
+                                               source_hash=source_hashes[symbol])
+                    except Exception as e:
+                        print(f"Error processing {symbol}: {e}")
+                    if progress_callback is not None:
+                        progress_callback(done, len(symbols))
+            return
+        
+        # Spawn rather than fork: the parent may already be running Numba
+        # worker threads (candlestick kernel), which do not survive a fork.
+        context = mp.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor, \
+                self._open_store() as store:
+            futures = {
+                executor.submit(self.compute_indicators, data_dict[symbol], *indicator_args): symbol
+                for symbol in symbols
+            }
+            completed = as_completed(futures)
+            if show_progress:
+                completed = tqdm(completed, total=len(futures), desc="Computing indicators")
+            
+            for done, future in enumerate(completed, 1):
+                symbol = futures[future]
+                try:
+                    self._store_indicators(symbol, future.result(), *indicator_args, store=store,
+                                           source_hash=source_hashes[symbol])
+                except Exception as e:
+                    print(f"Error processing {symbol}: {e}")
+                if progress_callback is not None:
+                    progress_callback(done, len(symbols))
     
     def load_indicators(self, symbol: str) -> Optional[pd.DataFrame]:
         """
@@ -467,6 +646,152 @@ class IndicatorEngine:
         
         return None
     
+    def iter_indicators(
+        self,
+        symbols: List[str],
+        tail_rows: Optional[int] = None
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Stream indicators for several symbols through one HDF5 handle.
+        
+        Scans only look at the most recent rows, so ``tail_rows`` slices the
+        stored arrays on read instead of loading each symbol's full history.
+        Tails are kept in memory until indicators.h5 is rewritten, so repeated
+        scans are served without touching the file; callers must not mutate
+        the frames they receive. With a shared cache, tails read by one
+        process (e.g. a background scan job) also serve the others.
+        
+        Args:
+            symbols: Symbols to load
+            tail_rows: Number of trailing rows to read (all rows if None)
+            
+        Yields:
+            (symbol, DataFrame) for each requested symbol present in the store
+        """
+        if not self.hdf5_path.exists():
+            return
+        
+        if not tail_rows:
+            for symbol, data in self._read_indicators(symbols):
+                if data is not None:
+                    yield symbol, data
+            return
+        
+        cached = self._tail_frames(tail_rows)
+        missing = [symbol for symbol in symbols if symbol not in cached]
+        if missing:
+            # Tails another process already read, when a shared cache is set
+            shared = self._get_shared_tails(tail_rows)
+            cached.update((symbol, shared[symbol]) for symbol in missing if symbol in shared)
+            missing = [symbol for symbol in missing if symbol not in cached]
+        if missing:
+            for symbol, data in self._read_indicators(missing, start=-tail_rows):
+                cached[symbol] = data
+            self._set_shared_tails(tail_rows, cached)
+        
+        for symbol in symbols:
+            data = cached.get(symbol)
+            if data is not None:
+                yield symbol, data
+    
+    def _read_indicators(
+        self,
+        symbols: List[str],
+        start: Optional[int] = None
+    ) -> Iterator[Tuple[str, Optional[pd.DataFrame]]]:
+        """
+        Read symbols' indicator frames through one HDF5 handle.
+        
+        Args:
+            symbols: Symbols to load
+            start: First row to read (negative counts from the end)
+            
+        Yields:
+            (symbol, DataFrame), or (symbol, None) if the symbol is not stored;
+            symbols that fail to load are reported and skipped
+        """
+        try:
+            with pd.HDFStore(self.hdf5_path, mode='r') as store:
+                for symbol in symbols:
+                    key = f"/{symbol}"
+                    if key not in store:
+                        yield symbol, None
+                        continue
+                    try:
+                        data = store.select(key, start=start)
+                    except Exception as e:
+                        print(f"Error loading indicators for {symbol}: {e}")
+                        continue
+                    yield symbol, data
+        except Exception as e:
+            print(f"Error reading indicator store: {e}")
+    
+    def _tail_frames(self, tail_rows: int) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        In-memory tails of ``tail_rows`` rows, emptied when indicators.h5 changes.
+        
+        Args:
+            tail_rows: Tail length the frames were read with
+            
+        Returns:
+            Mutable dict of symbol -> tail frame (None for symbols not stored)
+        """
+        mtime = os.stat(self.hdf5_path).st_mtime_ns
+        if mtime != self._tail_cache_mtime:
+            self._tail_cache = {}
+            self._tail_cache_mtime = mtime
+        return self._tail_cache.setdefault(tail_rows, {})
+    
+    def _shared_tail_key(self, tail_rows: int) -> str:
+        """Shared cache key for this store's tails at its current mtime."""
+        return f"tails:{self.hdf5_path}:{self._tail_cache_mtime}:{tail_rows}"
+    
+    def _get_shared_tails(self, tail_rows: int) -> Dict[str, Optional[pd.DataFrame]]:
+        """Return tails of ``tail_rows`` rows from the shared cache (empty if none)."""
+        if self._shared_cache is None:
+            return {}
+        try:
+            return self._shared_cache.get(self._shared_tail_key(tail_rows)) or {}
+        except Exception as e:
+            print(f"Error reading shared tail cache: {e}")
+            return {}
+    
+    def _set_shared_tails(self, tail_rows: int, frames: Dict[str, Optional[pd.DataFrame]]):
+        """Publish tails of ``tail_rows`` rows to the shared cache, if one is set."""
+        if self._shared_cache is None:
+            return
+        try:
+            # Merge with entries other processes (e.g. parallel scan shards)
+            # added, atomically so concurrent writers don't drop each other's
+            with self._shared_cache.transact():
+                merged = {**self._get_shared_tails(tail_rows), **frames}
+                self._shared_cache.set(self._shared_tail_key(tail_rows), merged,
+                                       expire=SHARED_TAIL_EXPIRE_SECONDS)
+        except Exception as e:
+            print(f"Error writing shared tail cache: {e}")
+    
+    def get_columns(self, symbol: str) -> List[str]:
+        """
+        List a symbol's stored indicator columns without reading any rows.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            Column names, or an empty list if the symbol is not stored
+        """
+        if not self.hdf5_path.exists():
+            return []
+        
+        try:
+            with pd.HDFStore(self.hdf5_path, mode='r') as store:
+                if f"/{symbol}" in store:
+                    return list(store.select(f"/{symbol}", start=0, stop=0).columns)
+        except Exception as e:
+            print(f"Error reading columns for {symbol}: {e}")
+        
+        return []
+    
     def list_available_symbols(self) -> List[str]:
         """
         List symbols with computed indicators.
@@ -492,7 +817,8 @@ class IndicatorEngine:
         ema_periods: Optional[List[int]] = None,
         include_candlestick_patterns: bool = True,
         include_streak_indicators: bool = True,
-        include_high_low_days: bool = True
+        include_high_low_days: bool = True,
+        source_hash: Optional[str] = None
     ):
         """
         Update configuration JSON with indicator parameters.
@@ -505,6 +831,7 @@ class IndicatorEngine:
             include_candlestick_patterns: Whether candlestick patterns were computed
             include_streak_indicators: Whether streak indicators were computed
             include_high_low_days: Whether days since prev high/low were computed
+            source_hash: Fingerprint of the price frame the indicators came from (optional)
         """
         from datetime import datetime
         
@@ -513,18 +840,17 @@ class IndicatorEngine:
             with open(self.config_path, 'r') as f:
                 config = json.load(f)
         
-        if ema_periods is None:
-            ema_periods = list(range(2, 201)) + list(range(250, 1001, 50))
-        
-        config[symbol] = {
-            'sma_periods': sma_periods,
-            'rsi_periods': rsi_periods,
-            'ema_periods': ema_periods,
-            'candlestick_patterns': include_candlestick_patterns,
-            'streak_indicators': include_streak_indicators,
-            'high_low_days': include_high_low_days,
-            'last_computed': datetime.now().isoformat()
-        }
+        config[symbol] = self._config_params(
+            sma_periods,
+            rsi_periods,
+            ema_periods,
+            include_candlestick_patterns,
+            include_streak_indicators,
+            include_high_low_days
+        )
+        config[symbol]['last_computed'] = datetime.now().isoformat()
+        if source_hash is not None:
+            config[symbol]['source_hash'] = source_hash
         
         # Update global metadata
         if '_metadata' not in config:
@@ -536,6 +862,76 @@ class IndicatorEngine:
         with open(self.config_path, 'w') as f:
             json.dump(config, f, indent=2)
     
+    @staticmethod
+    def _config_params(
+        sma_periods: List[int],
+        rsi_periods: List[int],
+        ema_periods: Optional[List[int]],
+        include_candlestick_patterns: bool,
+        include_streak_indicators: bool,
+        include_high_low_days: bool
+    ) -> Dict:
+        """
+        Indicator parameters as recorded in a symbol's config entry.
+        
+        Returns:
+            Dict of periods and flags, with the default EMA periods filled in
+        """
+        if ema_periods is None:
+            ema_periods = list(range(2, 201)) + list(range(250, 1001, 50))
+        
+        return {
+            'sma_periods': list(sma_periods),
+            'rsi_periods': list(rsi_periods),
+            'ema_periods': list(ema_periods),
+            'candlestick_patterns': include_candlestick_patterns,
+            'streak_indicators': include_streak_indicators,
+            'high_low_days': include_high_low_days
+        }
+    
+    @staticmethod
+    def _frame_fingerprint(data: pd.DataFrame) -> str:
+        """
+        Hash a price frame's index, columns, dtypes and values.
+        
+        Args:
+            data: OHLCV DataFrame
+            
+        Returns:
+            Hex digest identifying the frame's contents
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(list(data.dtypes.items())).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        return digest.hexdigest()
+    
+    def _changed_symbols(self, source_hashes: Dict[str, str], indicator_args: tuple) -> List[str]:
+        """
+        Select symbols whose stored indicators are missing or out of date.
+        
+        Args:
+            source_hashes: Symbol -> fingerprint of its current price frame
+            indicator_args: Indicator parameters, in process_multiple_symbols order
+            
+        Returns:
+            Symbols to recompute, in source_hashes order
+        """
+        config = self.get_config()
+        stored = set(self.list_available_symbols())
+        params = self._config_params(*indicator_args)
+        
+        changed = []
+        for symbol, source_hash in source_hashes.items():
+            entry = config.get(symbol, {})
+            up_to_date = (
+                symbol in stored
+                and entry.get('source_hash') == source_hash
+                and all(entry.get(key) == value for key, value in params.items())
+            )
+            if not up_to_date:
+                changed.append(symbol)
+        return changed
+    
     def get_config(self) -> Dict:
         """
         Load configuration.
@@ -560,12 +956,7 @@ class IndicatorEngine:
         Returns:
             True if the RSI period is cached, False otherwise
         """
-        data = self.load_indicators(symbol)
-        if data is None:
-            return False
-        
-        rsi_col = f"RSI_{period}"
-        return rsi_col in data.columns
+        return f"RSI_{period}" in self.get_columns(symbol)
     
     def compute_and_cache_rsi_period(self, symbol: str, period: int) -> bool:
         """
@@ -595,11 +986,12 @@ class IndicatorEngine:
         
         # Compute the new RSI period
         try:
-            data[rsi_col] = self.compute_rsi(data['Close'], period)
+            value_dtype = np.float32 if data['Close'].dtype == np.float32 else np.float64
+            data[rsi_col] = self.compute_rsi(data['Close'], period).astype(value_dtype)
             
             # Store updated data back to HDF5
-            with pd.HDFStore(self.hdf5_path, mode='a', complevel=9, complib='zlib') as store:
-                store.put(f"/{symbol}", data, format='table')
+            with self._open_store() as store:
+                self._put_indicators(store, symbol, data)
             
             # Update config to include this new period
             config = self.get_config()
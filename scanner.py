@@ -5,12 +5,24 @@ Finds stocks matching live conditions and cross-references with backtest stats.
 Supports configurable scanning criteria (e.g., RSI < 20, MA crossovers).
 """
 
+import operator as op
 from typing import Dict, List, Optional, Callable
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 
+# Comparison operators accepted by Scanner.scan_by_indicator
+COMPARISON_OPERATORS = {
+    '>': op.gt,
+    '<': op.lt,
+    '>=': op.ge,
+    '<=': op.le,
+    '==': op.eq,
+    '!=': op.ne,
+}
+
+
 class Scanner:
     """
     Live stock scanner for finding opportunities.
@@ -50,49 +62,9 @@ class Scanner:
         Returns:
             DataFrame with matching stocks and their metrics
         """
-        results = []
-        
-        for symbol in symbols:
-            try:
-                # Load indicators
-                data = self.indicator_engine.load_indicators(symbol)
-                if data is None or len(data) == 0:
-                    continue
-                
-                # Ensure RSI period is available (compute on-demand if needed)
-                success, was_computed = self.indicator_engine.ensure_rsi_period(symbol, rsi_period)
-                if not success:
-                    continue
-                
-                # Reload data only if we just computed a new RSI period
-                if was_computed:
-                    data = self.indicator_engine.load_indicators(symbol)
-                    if data is None:
-                        continue
-                
-                # Get latest RSI value
-                rsi_col = f"RSI_{rsi_period}"
-                if rsi_col not in data.columns:
-                    continue
-                
-                latest_rsi = data[rsi_col].iloc[-1]
-                
-                # Check condition
-                if pd.notna(latest_rsi) and latest_rsi < threshold:
-                    results.append({
-                        'symbol': symbol,
-                        'rsi': float(latest_rsi),
-                        'close': float(data['Close'].iloc[-1]),
-                        'date': data.index[-1]
-                    })
-            
-            except Exception as e:
-                print(f"Error scanning {symbol}: {e}")
-        
-        if not results:
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(results)
+        df = self._scan_latest_rsi(symbols, rsi_period, op.lt, threshold)
+        if len(df) == 0:
+            return df
         
         # Add backtest stats if available
         df = self._add_backtest_stats(df, 'rsi_meanrev')
@@ -119,49 +91,9 @@ class Scanner:
         Returns:
             DataFrame with matching stocks and their metrics
         """
-        results = []
-        
-        for symbol in symbols:
-            try:
-                # Load indicators
-                data = self.indicator_engine.load_indicators(symbol)
-                if data is None or len(data) == 0:
-                    continue
-                
-                # Ensure RSI period is available (compute on-demand if needed)
-                success, was_computed = self.indicator_engine.ensure_rsi_period(symbol, rsi_period)
-                if not success:
-                    continue
-                
-                # Reload data only if we just computed a new RSI period
-                if was_computed:
-                    data = self.indicator_engine.load_indicators(symbol)
-                    if data is None:
-                        continue
-                
-                # Get latest RSI value
-                rsi_col = f"RSI_{rsi_period}"
-                if rsi_col not in data.columns:
-                    continue
-                
-                latest_rsi = data[rsi_col].iloc[-1]
-                
-                # Check condition
-                if pd.notna(latest_rsi) and latest_rsi > threshold:
-                    results.append({
-                        'symbol': symbol,
-                        'rsi': float(latest_rsi),
-                        'close': float(data['Close'].iloc[-1]),
-                        'date': data.index[-1]
-                    })
-            
-            except Exception as e:
-                print(f"Error scanning {symbol}: {e}")
-        
-        if not results:
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(results)
+        df = self._scan_latest_rsi(symbols, rsi_period, op.gt, threshold)
+        if len(df) == 0:
+            return df
         
         # Add backtest stats if available
         df = self._add_backtest_stats(df, 'rsi_meanrev')
@@ -190,54 +122,57 @@ class Scanner:
         Returns:
             DataFrame with matching stocks and their metrics
         """
-        results = []
-        
-        for symbol in symbols:
+        fast_col = f"SMA_{fast_period}"
+        slow_col = f"SMA_{slow_period}"
+        
+        # Gather each symbol's last two MA values (rows: previous, current),
+        # then detect crossovers for all symbols in one set of comparisons
+        bars = []
+        fast = []
+        slow = []
+        # Only the last two rows are needed to detect a crossover
+        for symbol, data in self.indicator_engine.iter_indicators(symbols, tail_rows=2):
             try:
-                # Load indicators
-                data = self.indicator_engine.load_indicators(symbol)
-                if data is None or len(data) < 2:
+                if len(data) < 2:
                     continue
                 
-                # Get MA columns
-                fast_col = f"SMA_{fast_period}"
-                slow_col = f"SMA_{slow_period}"
-                
                 if fast_col not in data.columns or slow_col not in data.columns:
                     continue
                 
-                # Get latest and previous values
-                fast_current = data[fast_col].iloc[-1]
-                fast_prev = data[fast_col].iloc[-2]
-                slow_current = data[slow_col].iloc[-1]
-                slow_prev = data[slow_col].iloc[-2]
-                
-                # Check for crossover
-                is_match = False
-                if direction == 'bullish':
-                    # Fast crossed above slow
-                    is_match = (fast_prev <= slow_prev) and (fast_current > slow_current)
-                elif direction == 'bearish':
-                    # Fast crossed below slow
-                    is_match = (fast_prev >= slow_prev) and (fast_current < slow_current)
-                
-                if is_match and pd.notna(fast_current) and pd.notna(slow_current):
-                    results.append({
-                        'symbol': symbol,
-                        f'sma_{fast_period}': float(fast_current),
-                        f'sma_{slow_period}': float(slow_current),
-                        'close': float(data['Close'].iloc[-1]),
-                        'date': data.index[-1],
-                        'crossover_type': direction
-                    })
+                bar = (symbol, data['Close'].iloc[-1], data.index[-1])
+                fast.append(data[fast_col].to_numpy())
+                slow.append(data[slow_col].to_numpy())
+                bars.append(bar)
             
             except Exception as e:
                 print(f"Error scanning {symbol}: {e}")
         
-        if not results:
+        if not bars:
             return pd.DataFrame()
         
-        df = pd.DataFrame(results)
+        fast = np.array(fast)
+        slow = np.array(slow)
+        if direction == 'bullish':
+            # Fast crossed above slow
+            matches = (fast[:, 0] <= slow[:, 0]) & (fast[:, 1] > slow[:, 1])
+        elif direction == 'bearish':
+            # Fast crossed below slow
+            matches = (fast[:, 0] >= slow[:, 0]) & (fast[:, 1] < slow[:, 1])
+        else:
+            matches = np.zeros(len(bars), dtype=bool)
+        
+        hits = np.flatnonzero(matches)
+        if len(hits) == 0:
+            return pd.DataFrame()
+        
+        df = pd.DataFrame({
+            'symbol': [bars[i][0] for i in hits],
+            f'sma_{fast_period}': fast[hits, 1].astype(np.float64),
+            f'sma_{slow_period}': slow[hits, 1].astype(np.float64),
+            'close': np.array([bars[i][1] for i in hits], dtype=np.float64),
+            'date': [bars[i][2] for i in hits],
+            'crossover_type': direction
+        })
         
         # Add backtest stats if available
         df = self._add_backtest_stats(df, 'ma_crossover')
@@ -265,13 +200,17 @@ class Scanner:
         Returns:
             DataFrame with matching stocks and their metrics
         """
-        results = []
+        compare = COMPARISON_OPERATORS.get(operator)
+        if compare is None:
+            print(f"Unknown operator: {operator}")
+            return pd.DataFrame()
         
-        for symbol in symbols:
+        # Gather each symbol's latest value, then filter them all in one comparison
+        rows = []
+        values = []
+        for symbol, data in self.indicator_engine.iter_indicators(symbols, tail_rows=1):
             try:
-                # Load indicators
-                data = self.indicator_engine.load_indicators(symbol)
-                if data is None or len(data) == 0:
+                if len(data) == 0:
                     continue
                 
                 # Check if indicator exists
@@ -285,37 +224,26 @@ class Scanner:
                 if pd.isna(latest_value):
                     continue
                 
-                # Evaluate condition
-                is_match = False
-                if operator == '>':
-                    is_match = latest_value > threshold
-                elif operator == '<':
-                    is_match = latest_value < threshold
-                elif operator == '>=':
-                    is_match = latest_value >= threshold
-                elif operator == '<=':
-                    is_match = latest_value <= threshold
-                elif operator == '==':
-                    is_match = latest_value == threshold
-                elif operator == '!=':
-                    is_match = latest_value != threshold
-                else:
-                    print(f"Unknown operator: {operator}")
-                    continue
-                
-                if is_match:
-                    result_dict = {
-                        'symbol': symbol,
-                        'close': float(data['Close'].iloc[-1]),
-                        'date': data.index[-1]
-                    }
-                    if include_value:
-                        result_dict[indicator] = float(latest_value)
-                    results.append(result_dict)
+                rows.append({
+                    'symbol': symbol,
+                    'close': float(data['Close'].iloc[-1]),
+                    'date': data.index[-1]
+                })
+                values.append(latest_value)
             
             except Exception as e:
                 print(f"Error scanning {symbol}: {e}")
         
+        results = []
+        if rows:
+            # Values keep their stored dtype so the comparison matches a scalar one
+            matches = compare(np.array(values), threshold)
+            for row, value, is_match in zip(rows, values, matches):
+                if is_match:
+                    if include_value:
+                        row[indicator] = float(value)
+                    results.append(row)
+        
         if not results:
             return pd.DataFrame()
         
@@ -375,6 +303,95 @@ class Scanner:
         
         return df
     
+    def _scan_latest_rsi(
+        self,
+        symbols: List[str],
+        rsi_period: int,
+        compare: Callable,
+        threshold: float
+    ) -> pd.DataFrame:
+        """
+        Select symbols whose latest ``RSI_<period>`` value passes a comparison.
+        
+        Latest values are gathered in one read pass and filtered with a single
+        array comparison; NaN values never match.
+        
+        Args:
+            symbols: List of symbols to scan
+            rsi_period: RSI period
+            compare: Element-wise comparison, called as compare(values, threshold)
+            threshold: Threshold value to compare against
+            
+        Returns:
+            DataFrame with symbol, rsi, close and date columns (empty if no matches)
+        """
+        rsi_col = f"RSI_{rsi_period}"
+        
+        bars = []
+        values = []
+        for symbol, data in self._iter_with_rsi(symbols, rsi_period):
+            try:
+                bar = (symbol, data['Close'].iloc[-1], data.index[-1])
+                values.append(data[rsi_col].iloc[-1])
+                bars.append(bar)
+            except Exception as e:
+                print(f"Error scanning {symbol}: {e}")
+        
+        if not bars:
+            return pd.DataFrame()
+        
+        # Values keep their stored dtype so the comparison matches a scalar one
+        values = np.array(values)
+        hits = np.flatnonzero(compare(values, threshold))
+        if len(hits) == 0:
+            return pd.DataFrame()
+        
+        return pd.DataFrame({
+            'symbol': [bars[i][0] for i in hits],
+            'rsi': values[hits].astype(np.float64),
+            'close': np.array([bars[i][1] for i in hits], dtype=np.float64),
+            'date': [bars[i][2] for i in hits]
+        })
+    
+    def _iter_with_rsi(self, symbols: List[str], rsi_period: int):
+        """
+        Yield the latest indicator row of each symbol with ``RSI_<period>`` present.
+        
+        Symbols that already store the period are read as one-row tails in a
+        single pass over the store. The rest are computed on demand once that
+        pass has finished, since caching a new period writes to the store.
+        
+        Args:
+            symbols: List of symbols to scan
+            rsi_period: RSI period that must be available
+            
+        Yields:
+            (symbol, DataFrame) pairs
+        """
+        rsi_col = f"RSI_{rsi_period}"
+        missing = []
+        
+        for symbol, data in self.indicator_engine.iter_indicators(symbols, tail_rows=1):
+            if len(data) == 0:
+                continue
+            if rsi_col in data.columns:
+                yield symbol, data
+            else:
+                missing.append(symbol)
+        
+        for symbol in missing:
+            try:
+                success, _ = self.indicator_engine.ensure_rsi_period(symbol, rsi_period)
+                if not success:
+                    continue
+                data = self.indicator_engine.load_indicators(symbol)
+            except Exception as e:
+                print(f"Error scanning {symbol}: {e}")
+                continue
+            
+            if data is not None and rsi_col in data.columns:
+                yield symbol, data
+    
     def get_available_indicators(self) -> List[str]:
         """
         Get list of available indicators from stored data.
@@ -387,10 +404,11 @@ class Scanner:
         if not symbols:
             return []
         
-        # Load first symbol to get column names
-        data = self.indicator_engine.load_indicators(symbols[0])
-        if data is None:
+        # Read one row of the first symbol to get column names
+        first = next(self.indicator_engine.iter_indicators(symbols[:1], tail_rows=1), None)
+        if first is None:
             return []
+        data = first[1]
         
         # Filter out OHLCV columns
         ohlcv_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
@@ -494,16 +512,13 @@ class Scanner:
         Returns:
             DataFrame with top performers
         """
-        # Load backtest summary
-        summary = self.backtest_engine.load_summary()
+        # Push the strategy filter into the store so only its rows are decoded
+        summary = self.backtest_engine.store.get_stats(strategy=strategy_name)
         if summary is None or len(summary) == 0:
             return pd.DataFrame()
         
-        # Filter to strategy and minimum trades
-        filtered = summary[
-            (summary['strategy'] == strategy_name) &
-            (summary['num_trades'] >= min_trades)
-        ]
+        # Filter to minimum trades
+        filtered = summary[summary['num_trades'] >= min_trades]
         
         if len(filtered) == 0:
             return pd.DataFrame()
@@ -512,3 +527,29 @@ class Scanner:
         top = filtered.sort_values(metric, ascending=False).head(top_n)
         
         return top
+
+
+def scan_shard(indicator_path: str, backtest_path: str, method: str, kwargs: Dict,
+               shared_cache=None) -> pd.DataFrame:
+    """
+    Run one Scanner method in a worker process.
+    
+    Engines are rebuilt from their paths because they do not cross process
+    boundaries; the method must only read the stores.
+    
+    Args:
+        indicator_path: IndicatorEngine storage path
+        backtest_path: BacktestEngine storage path
+        method: Scanner method name
+        kwargs: Keyword arguments for the method, including the symbol shard
+        shared_cache: IndicatorEngine shared cache for scan tails (optional)
+        
+    Returns:
+        The method's result DataFrame for the shard
+    """
+    from indicator_engine import IndicatorEngine
+    from backtest_engine import BacktestEngine
+    
+    scanner = Scanner(IndicatorEngine(indicator_path, shared_cache=shared_cache),
+                      BacktestEngine(backtest_path))
+    return getattr(scanner, method)(**kwargs)
@@ -9,6 +9,7 @@ import tempfile
 import shutil
 import numpy as np
 import pandas as pd
+import zarr
 from pathlib import Path
 
 from backtest_store import BacktestStore
@@ -66,6 +67,9 @@ def test_basic_storage_and_retrieval():
         assert details is not None
         assert 'equity_curve' in details
         assert len(details['equity_curve']) == 100
+        assert details['equity_curve'].dtype == np.float32
+        assert np.allclose(details['equity_curve'], equity_curve, rtol=1e-6)
+        assert np.array_equal(details['positions'], positions)
         
         print(f"✓ Retrieved detailed results correctly")
         
@@ -180,6 +184,72 @@ def test_bulk_retrieval():
         print("✓ test_bulk_retrieval PASSED")
 
 
+def test_column_projection():
+    """Test retrieving only selected stats columns."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store_path = Path(tmpdir) / "test_store.zarr"
+        store = BacktestStore(str(store_path))
+        
+        for symbol, strategy, sharpe in [("AAPL", "rsi_meanrev", 1.5), ("MSFT", "ma_crossover", 0.5)]:
+            metrics = {
+                'win_rate': 0.6,
+                'num_trades': 20,
+                'total_return': 0.3,
+                'cagr': 0.1,
+                'sharpe_ratio': sharpe,
+                'max_drawdown': -0.2,
+                'expectancy': 0.015
+            }
+            store.store_backtest(symbol, strategy, {"period": 14}, 'default', metrics)
+        
+        columns = ['strategy', 'sharpe_ratio', 'num_trades']
+        projected = store.get_stats(columns=columns)
+        assert list(projected.columns) == columns
+        
+        full = store.get_all_stats()
+        pd.testing.assert_frame_equal(projected, full[columns])
+        print(f"✓ Projected {len(columns)} of {len(full.columns)} columns")
+        
+        print("✓ test_column_projection PASSED")
+
+
+def test_strategy_averages():
+    """Test per-strategy metric averages computed by the store."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store_path = Path(tmpdir) / "test_store.zarr"
+        store = BacktestStore(str(store_path))
+        
+        cases = [
+            ("AAPL", "rsi_meanrev", 1.0, 10),
+            ("GOOGL", "rsi_meanrev", 2.0, 20),
+            ("MSFT", "ma_crossover", 0.5, 5),
+            ("TSLA", "ma_crossover", 9.0, 50)
+        ]
+        for symbol, strategy, sharpe, trades in cases:
+            metrics = {
+                'win_rate': 0.6,
+                'num_trades': trades,
+                'total_return': 0.3,
+                'cagr': 0.1,
+                'sharpe_ratio': sharpe,
+                'max_drawdown': -0.2,
+                'expectancy': 0.015
+            }
+            store.store_backtest(symbol, strategy, {"period": 14}, 'default', metrics)
+        
+        # Deleted backtests are left out of the averages
+        store.delete_backtest("TSLA", "ma_crossover", {"period": 14}, 'default')
+        
+        averages = store.get_strategy_averages(['sharpe_ratio', 'num_trades'])
+        assert list(averages['strategy']) == ['ma_crossover', 'rsi_meanrev']
+        assert list(averages['count']) == [1, 2]
+        assert np.allclose(averages['sharpe_ratio'], [0.5, 1.5])
+        assert np.allclose(averages['num_trades'], [5, 15])
+        print(f"✓ Averaged {averages['count'].sum()} backtests over {len(averages)} strategies")
+        
+        print("✓ test_strategy_averages PASSED")
+
+
 def test_delete_backtest():
     """Test deleting a backtest."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -222,6 +292,115 @@ def test_delete_backtest():
         print("✓ test_delete_backtest PASSED")
 
 
+def test_delete_persists_after_reopen():
+    """Test that deleted backtests stay deleted when the store is reopened."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store_path = Path(tmpdir) / "test_store.zarr"
+        store = BacktestStore(str(store_path))
+        
+        metrics = {'win_rate': 0.6, 'num_trades': 20}
+        symbols = [f"SYM{i}" for i in range(20)]
+        for symbol in symbols:
+            store.store_backtest(symbol, "rsi_meanrev", {"rsi_period": 14}, 'default', metrics)
+        
+        # A single delete stays below the compaction threshold (tombstoned only)
+        assert store.delete_backtest("SYM0", "rsi_meanrev", {"rsi_period": 14})
+        assert len(store.get_all_stats()) == 19
+        
+        reopened = BacktestStore(str(store_path))
+        assert len(reopened.get_all_stats()) == 19
+        assert len(reopened.get_stats(symbol="SYM0")) == 0
+        assert not reopened.delete_backtest("SYM0", "rsi_meanrev", {"rsi_period": 14})
+        
+        # Further deletes trigger compaction of the metadata array
+        for symbol in symbols[1:5]:
+            assert reopened.delete_backtest(symbol, "rsi_meanrev", {"rsi_period": 14})
+        assert reopened.root['metadata'].shape[0] == 15
+        assert sorted(reopened.get_all_stats()['symbol']) == sorted(symbols[5:])
+        
+        # Re-storing an existing key updates the row instead of duplicating it
+        reopened.store_backtest("SYM5", "rsi_meanrev", {"rsi_period": 14}, 'default', {'win_rate': 0.9})
+        stats = reopened.get_stats(symbol="SYM5")
+        assert len(stats) == 1
+        assert abs(stats.iloc[0]['win_rate'] - 0.9) < 0.01
+        
+        print("✓ test_delete_persists_after_reopen PASSED")
+
+
+def test_two_instances_share_store():
+    """Test that two store instances on one path (e.g. two workers) see each other's writes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store_path = Path(tmpdir) / "test_store.zarr"
+        store_a = BacktestStore(str(store_path))
+        store_b = BacktestStore(str(store_path))
+        
+        store_a.store_backtest("AAA", "rsi", {"rsi_period": 14}, 'e1', {'win_rate': 0.6})
+        store_b.store_backtest("BBB", "ma", {"fast": 10}, 'e2', {'win_rate': 0.4})
+        
+        # Neither write overwrote the other's row or string tables
+        expected = [['AAA', 'rsi', 'e1'], ['BBB', 'ma', 'e2']]
+        for store in (BacktestStore(str(store_path)), store_a, store_b):
+            stats = store.get_all_stats()
+            assert stats[['symbol', 'strategy', 'exit_rule']].astype(str).values.tolist() == expected
+        
+        # Updates and deletes from one instance are visible through the other
+        store_b.store_backtest("AAA", "rsi", {"rsi_period": 14}, 'e1', {'win_rate': 0.9})
+        assert abs(store_a.get_stats(symbol="AAA").iloc[0]['win_rate'] - 0.9) < 0.01
+        assert store_a.get_detailed_results("BBB", "ma", {"fast": 10}, 'e2') is not None
+        assert store_a.delete_backtest("BBB", "ma", {"fast": 10}, 'e2')
+        assert len(store_b.get_stats(symbol="BBB")) == 0
+        assert store_b.get_summary_stats()['total_backtests'] == 1
+        
+        # A delete that finds nothing leaves the generation alone (no reloads elsewhere)
+        generation = store_b._read_generation()
+        assert not store_a.delete_backtest("ZZZ", "ma", {"fast": 10}, 'e2')
+        assert store_b._read_generation() == generation
+        
+        print("✓ test_two_instances_share_store PASSED")
+
+
+def test_legacy_metadata_migration():
+    """Test that stores written with fixed-width string metadata are migrated on open."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store_path = Path(tmpdir) / "test_store.zarr"
+        
+        legacy_dtype = [
+            ('symbol', 'U20'), ('strategy', 'U50'), ('params_hash', 'U32'), ('exit_rule', 'U50'),
+            ('win_rate', 'f4'), ('num_trades', 'i4'), ('total_return', 'f4'), ('cagr', 'f4'),
+            ('sharpe_ratio', 'f4'), ('max_drawdown', 'f4'), ('expectancy', 'f4'),
+            ('start_date', 'U10'), ('end_date', 'U10'), ('timestamp', 'U32')
+        ]
+        legacy = np.array([
+            ('AAPL', 'rsi_meanrev', '123', 'default', 0.6, 20, 0.3, 0.1, 1.2, -0.2, 0.015,
+             '2020-01-01', '2020-12-31', '2024-01-01T10:00:00'),
+            ('MSFT', 'ma_crossover', '456', 'default', 0.5, 10, 0.2, 0.05, 0.8, -0.1, 0.01,
+             '2020-01-01', '2020-12-31', '2024-01-01T10:00:00')
+        ], dtype=legacy_dtype)
+        root = zarr.open(str(store_path), mode='a')
+        root.create_dataset('metadata', data=legacy, chunks=(1000,))
+        legacy_params = root.create_group('params_lookup').create_dataset('456', shape=(1,), dtype='i1')
+        legacy_params.attrs['params'] = '{"fast_period": 20, "slow_period": 50}'
+        
+        store = BacktestStore(str(store_path))
+        assert 'symbol_id' in store.root['metadata'].dtype.names
+        
+        stats = store.get_stats(symbol="MSFT")
+        assert len(stats) == 1
+        row = stats.iloc[0]
+        assert row['strategy'] == "ma_crossover"
+        assert row['params_hash'] == "456"
+        assert row['end_date'] == "2020-12-31"
+        assert row['timestamp'] == pd.Timestamp('2024-01-01T10:00:00')
+        assert row['params'] == {"fast_period": 20, "slow_period": 50}
+        assert 'params_lookup' not in store.root
+        
+        # Params survive a reopen from the lookup table
+        reopened = BacktestStore(str(store_path))
+        assert reopened.get_stats(symbol="MSFT").iloc[0]['params'] == {"fast_period": 20, "slow_period": 50}
+        
+        print("✓ test_legacy_metadata_migration PASSED")
+
+
 def test_params_hashing():
     """Test that parameter hashing is stable and different params get different hashes."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -263,9 +442,24 @@ def run_all_tests():
     test_bulk_retrieval()
     print()
     
+    test_column_projection()
+    print()
+    
+    test_strategy_averages()
+    print()
+    
     test_delete_backtest()
     print()
     
+    test_delete_persists_after_reopen()
+    print()
+    
+    test_two_instances_share_store()
+    print()
+    
+    test_legacy_metadata_migration()
+    print()
+    
     test_params_hashing()
     print()
     
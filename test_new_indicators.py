@@ -21,7 +21,16 @@ from candlestick_patterns import (
     detect_hanging_man,
     detect_doji,
     detect_shooting_star,
-    compute_all_patterns
+    detect_harami_bullish,
+    detect_harami_bearish,
+    detect_dark_cloud_cover,
+    detect_piercing_pattern,
+    detect_three_white_soldiers,
+    detect_three_black_crows,
+    compute_all_patterns,
+    compute_pattern_matrix,
+    pack_patterns,
+    has_pattern
 )
 
 
@@ -270,7 +279,7 @@ def test_candlestick_patterns():
     df_all = create_test_data(100)
     patterns = compute_all_patterns(df_all)
     
-    print(f"\n  All patterns computed: {len(patterns)} patterns")
+    print(f"\n  All patterns computed: {len(patterns.columns)} patterns")
     for pattern_name, pattern_series in patterns.items():
         count = pattern_series.sum()
         print(f"    {pattern_name}: {count} occurrences")
@@ -288,6 +297,101 @@ def test_candlestick_patterns():
     print("\n✅ All candlestick pattern tests passed!")
 
 
+def test_candlestick_kernel_matches_detectors():
+    """Test that the fused pattern kernel agrees with the individual detectors."""
+    print("\n" + "=" * 70)
+    print("Testing Candlestick Kernel Consistency")
+    print("=" * 70)
+    
+    detectors = {
+        'engulfing_bull': detect_engulfing_bullish,
+        'engulfing_bear': detect_engulfing_bearish,
+        'hammer': detect_hammer,
+        'hanging_man': detect_hanging_man,
+        'doji': detect_doji,
+        'shooting_star': detect_shooting_star,
+        'harami_bull': detect_harami_bullish,
+        'harami_bear': detect_harami_bearish,
+        'dark_cloud': detect_dark_cloud_cover,
+        'piercing': detect_piercing_pattern,
+        'three_white_soldiers': detect_three_white_soldiers,
+        'three_black_crows': detect_three_black_crows,
+    }
+    
+    # Random walk plus an explicit three white soldiers run at the end
+    df = create_test_data(500)[['Open', 'High', 'Low', 'Close']]
+    soldiers = pd.DataFrame({
+        'Open': [100.0, 101.0, 102.0],
+        'High': [101.6, 102.6, 103.6],
+        'Low': [99.9, 100.9, 101.9],
+        'Close': [101.5, 102.5, 103.5],
+    }, index=pd.date_range(df.index[-1] + pd.Timedelta(days=1), periods=3))
+    df = pd.concat([df, soldiers])
+    df.iloc[::53, 0] = np.nan
+    
+    patterns = compute_all_patterns(df)
+    for name, detector in detectors.items():
+        expected = detector(df)
+        assert (patterns[name].to_numpy() == expected.to_numpy()).all(), \
+            f"Kernel output for {name} should match its detector"
+    
+    assert patterns['three_white_soldiers'].iloc[-1] == 1, "Should detect three white soldiers"
+    print("  ✓ Kernel matches all 12 detectors")
+    
+    # Very short inputs must not flag multi-candle patterns
+    for n in (0, 1, 2):
+        short = compute_all_patterns(df.iloc[:n])
+        assert len(short) == n, "Outputs should match input length"
+        assert short['three_white_soldiers'].sum() == 0
+    print("  ✓ Short inputs handled")
+    
+    # Packed flags round-trip every pattern
+    packed = pack_patterns(patterns)
+    assert packed.dtype == np.uint16, "Packed flags should be uint16"
+    for name in detectors:
+        assert (has_pattern(packed, name) == patterns[name].to_numpy()).all(), \
+            f"Packed bit for {name} should match its column"
+    print("  ✓ Packed uint16 flags match pattern columns")
+    
+    # Raw matrix form used by multi-pattern scans
+    names, mat = compute_pattern_matrix(df)
+    assert mat.flags['C_CONTIGUOUS'] and mat.dtype == np.int8
+    assert (mat == patterns[names].to_numpy()).all(), "Matrix should match the DataFrame"
+    print("  ✓ Pattern matrix matches DataFrame output")
+    
+    print("\n✅ Candlestick kernel tests passed!")
+
+
+def test_short_history():
+    """Test that symbols shorter than the indicator periods still compute."""
+    print("\n" + "=" * 70)
+    print("Testing Short Price History")
+    print("=" * 70)
+    
+    engine = IndicatorEngine("./data/test_indicators")
+    short_data = create_test_data(10)
+    
+    result = engine.compute_indicators(
+        short_data,
+        sma_periods=[5, 20],
+        rsi_periods=[7, 14],
+        ema_periods=[2, 50]
+    )
+    
+    assert result['SMA_5'].notna().sum() == 6, "SMA_5 should have values once 5 rows are available"
+    assert result['SMA_20'].isna().all(), "SMA_20 needs more history than available"
+    assert result['RSI_7'].notna().any(), "RSI_7 should have values"
+    assert result['RSI_14'].isna().all(), "RSI_14 needs more history than available"
+    assert result['EMA_50'].isna().all(), "EMA_50 needs more history than available"
+    print("  ✓ Periods longer than the history yield NaN columns")
+    
+    empty = compute_all_patterns(short_data.iloc[:0])
+    assert empty.shape == (0, 12), "Empty input should give an empty pattern frame"
+    print("  ✓ Empty input handled")
+    
+    print("\n✅ Short history tests passed!")
+
+
 def test_full_integration():
     """Test full integration with all indicators."""
     print("\n" + "=" * 70)
@@ -373,6 +477,10 @@ def test_full_integration():
     assert 'consec_higher_high' in loaded.columns, "consec_higher_high should be in loaded data"
     assert 'days_since_prev_high' in loaded.columns, "days_since_prev_high should be in loaded data"
     
+    # Pattern flags and day counters are stored narrow
+    assert loaded['engulfing_bull'].dtype == np.int8, "Pattern flags should be stored as int8"
+    assert loaded['consec_higher_high'].dtype == np.int32, "Streak counts should be stored as int32"
+    
     print("    ✓ Storage and loading work correctly")
     
     # Verify config
@@ -390,6 +498,54 @@ def test_full_integration():
     print("\n✅ Full integration test passed!")
 
 
+def test_skip_unchanged_symbols():
+    """Test that unchanged symbols are not recomputed."""
+    print("\n" + "=" * 70)
+    print("Testing Skip of Unchanged Symbols")
+    print("=" * 70)
+    
+    test_cache_path = "./data/test_skip_unchanged"
+    if os.path.exists(test_cache_path):
+        shutil.rmtree(test_cache_path)
+    
+    data_dict = {'AAA': create_test_data(300), 'BBB': create_test_data(300)}
+    params = dict(sma_periods=[20], rsi_periods=[14], ema_periods=[10], show_progress=False)
+    
+    engine = IndicatorEngine(test_cache_path)
+    engine.process_multiple_symbols(data_dict, skip_unchanged=True, **params)
+    first = engine.get_config()
+    
+    # Same data and parameters: nothing is rewritten
+    engine.process_multiple_symbols(data_dict, skip_unchanged=True, **params)
+    second = engine.get_config()
+    for symbol in data_dict:
+        assert second[symbol]['last_computed'] == first[symbol]['last_computed'], \
+            f"{symbol} should have been skipped"
+    print("    ✓ Unchanged symbols skipped")
+    
+    # Changed data: only that symbol is recomputed
+    data_dict['BBB'] = data_dict['BBB'].assign(Close=data_dict['BBB']['Close'] * 1.01)
+    engine.process_multiple_symbols(data_dict, skip_unchanged=True, **params)
+    third = engine.get_config()
+    assert third['AAA']['last_computed'] == first['AAA']['last_computed'], "AAA should have been skipped"
+    assert third['BBB']['last_computed'] != first['BBB']['last_computed'], "BBB should be recomputed"
+    loaded = engine.load_indicators('BBB')
+    assert np.allclose(loaded['Close'], data_dict['BBB']['Close']), "BBB should hold the new prices"
+    print("    ✓ Changed symbol recomputed")
+    
+    # Changed parameters: every symbol is recomputed
+    engine.process_multiple_symbols(data_dict, skip_unchanged=True, **dict(params, rsi_periods=[7]))
+    fourth = engine.get_config()
+    for symbol in data_dict:
+        assert fourth[symbol]['rsi_periods'] == [7], f"{symbol} should be recomputed with new parameters"
+    print("    ✓ Parameter change recomputes all symbols")
+    
+    if os.path.exists(test_cache_path):
+        shutil.rmtree(test_cache_path)
+    
+    print("\n✅ Skip unchanged test passed!")
+
+
 def main():
     """Run all tests."""
     print("=" * 70)
@@ -401,7 +557,10 @@ def main():
         test_consecutive_streaks()
         test_days_since_highs_lows()
         test_candlestick_patterns()
+        test_candlestick_kernel_matches_detectors()
+        test_short_history()
         test_full_integration()
+        test_skip_unchanged_symbols()
         
         print("\n" + "=" * 70)
         print("✅ ALL TESTS PASSED!")
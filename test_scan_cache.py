@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the DashUI scan results cache.
+Checks that cached scans are invalidated by writes to the stores they read.
+"""
+
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import dash_ui
+from dash_ui import DashUI
+from indicator_engine import IndicatorEngine
+
+
+def create_test_data(num_days: int = 120, seed: int = 0) -> pd.DataFrame:
+    """Create synthetic OHLCV data."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end='2024-06-28', periods=num_days, freq='B')
+    close = 100 + np.cumsum(rng.normal(0, 1, num_days))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, num_days),
+        'High': close + np.abs(rng.normal(0, 1, num_days)),
+        'Low': close - np.abs(rng.normal(0, 1, num_days)),
+        'Close': close,
+        'Volume': rng.integers(1000, 10000, num_days)
+    }, index=dates)
+
+
+def test_scan_cache_sees_new_backtest_stats():
+    """Test that a repeated scan shows backtest stats stored after the first run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        indicator_path = str(Path(tmpdir) / "indicators")
+        backtest_path = str(Path(tmpdir) / "backtests")
+        IndicatorEngine(indicator_path).process_multiple_symbols(
+            {'AAA': create_test_data(seed=1), 'BBB': create_test_data(seed=2)},
+            sma_periods=[20], rsi_periods=[14], ema_periods=[10],
+            show_progress=False, max_workers=1
+        )
+        
+        # Keep the cache in process so the test does not touch the shared disk cache
+        disk_cache_module = dash_ui.diskcache
+        dash_ui.diskcache = None
+        try:
+            ui = DashUI(indicator_path=indicator_path, backtest_path=backtest_path)
+        finally:
+            dash_ui.diskcache = disk_cache_module
+        
+        # Every symbol matches, so the scan always returns both rows
+        query = {'scan_type': 'rsi_oversold', 'rsi_period': 14, 'rsi_threshold': 101}
+        
+        def scan():
+            # Same cache lookup as the Run Scan callback
+            results = ui._get_cached_scan(query)
+            if results is None:
+                results, _ = ui._execute_scan(query)
+                ui._cache_scan_results(query, results)
+            return results
+        
+        first = scan()
+        assert sorted(first['symbol']) == ['AAA', 'BBB']
+        assert 'win_rate' not in first.columns
+        assert scan() is first, "Repeated scan should be served from the cache"
+        
+        ui.backtest_engine.store.store_backtest(
+            'AAA', 'rsi_meanrev', {'rsi_period': 14}, 'default',
+            {'win_rate': 0.75, 'num_trades': 12}
+        )
+        
+        second = scan().set_index('symbol')
+        assert abs(second.loc['AAA', 'win_rate'] - 0.75) < 0.01
+        assert second.loc['AAA', 'num_trades'] == 12
+        
+        print("✓ test_scan_cache_sees_new_backtest_stats PASSED")
+
+
+if __name__ == '__main__':
+    test_scan_cache_sees_new_backtest_stats()